@@ -0,0 +1,59 @@
+# batch_export.py
+"""
+Export saved guides without the app: one ZIP per guide with the JSON, PNG,
+print PDF and CSV, written straight to disk.
+
+    python batch_export.py guides/*.json guides/*.sbg --out exports/
+    python batch_export.py team/*.json --theme "Printer-friendly" --dpi 600
+"""
+import argparse
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+import sideboarder_modular as sb_mod  # noqa: E402
+
+
+def export_guide(path: str, out_dir: str, theme: str, dpi: int) -> str:
+    """Write `path`'s bundle into `out_dir` and return the ZIP's path."""
+    with open(path, "rb") as f:
+        guide = sb_mod.load_guide(f)
+    if not guide["matrix"]:  # e.g. a skeleton from bulk_import.py
+        raise sb_mod.GuideValidationError("no matchups to export yet.")
+    deck_data = guide["deck_data"]
+    df = sb_mod.build_matrix_df(guide["matrix"], deck_data)[::-1]
+    labels = sb_mod.card_labels_for(deck_data)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    target = os.path.join(out_dir, f"{stem}.zip")
+    with open(target, "wb") as out:
+        sb_mod.write_guide_bundle(out, deck_data, df, labels, theme, dpi, stem)
+    return target
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("guides", nargs="+", help="saved .json or .sbg guides")
+    parser.add_argument("--out", default=".", help="directory for the ZIPs")
+    parser.add_argument("--theme", choices=list(sb_mod.EXPORT_THEMES), default="Colour")
+    parser.add_argument(
+        "--dpi", type=int, choices=sorted(sb_mod.EXPORT_DPI.values()), default=300
+    )
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    failed = 0
+    for path in args.guides:
+        try:
+            target = export_guide(path, args.out, args.theme, args.dpi)
+        except (OSError, sb_mod.GuideValidationError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"{path} -> {target} ({os.path.getsize(target) // 1024} KiB)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
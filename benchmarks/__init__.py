@@ -0,0 +1 @@
+"""Offline performance benchmarks for SideBoarder (run from the repo root)."""
@@ -0,0 +1,18 @@
+# _timing.py
+"""Best-of-N timing shared by the micro-benchmarks."""
+import time
+
+
+def best(action, repeats: int):
+    """Run `action` `repeats` times; return (fastest seconds, last result)."""
+    fastest, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = action()
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest, result
+
+
+def best_seconds(action, repeats: int) -> float:
+    """Fastest of `repeats` runs of `action`, in seconds."""
+    return best(action, repeats)[0]
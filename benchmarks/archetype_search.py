@@ -0,0 +1,49 @@
+# archetype_search.py
+"""
+Cost of archetype name suggestions as the index grows: the bundled names plus
+1000 and 5000 names remembered from saved guides.
+
+    python -m benchmarks.archetype_search
+"""
+import sys
+
+import sideboarder_modular as sb_mod
+from benchmarks._timing import best_seconds
+
+EXTRA_NAMES = (0, 1000, 5000)
+QUERIES = ("Boros Enrgy", "team arch", "RW Energy", "murk")
+
+
+def build_index(extra: int) -> sb_mod.ArchetypeIndex:
+    index = sb_mod.ArchetypeIndex()
+    bundled = sb_mod.load_bundled_archetypes.__wrapped__("static/archetypes.json")
+    for name, aliases in bundled.items():
+        index.add(name, tuple(aliases))
+    for i in range(extra):
+        index.add(f"Team Archetype {i}")
+    return index
+
+
+def measure(extra: int, repeats: int = 20) -> dict[str, float]:
+    """Best-of-`repeats` seconds to build the index and to answer each query."""
+    index = build_index(extra)
+    results = {"build index": best_seconds(lambda: build_index(extra), 3)}
+    for q in QUERIES:
+        results[f"suggest {q!r}"] = best_seconds(lambda: index.suggest(q), repeats)
+    return results
+
+
+def main() -> int:
+    rows = {n: measure(n) for n in EXTRA_NAMES}
+    names = list(rows[EXTRA_NAMES[0]])
+    print(f"{'ms (+ names)':<22}" + "".join(f"{n:>10}" for n in EXTRA_NAMES))
+    for name in names:
+        print(
+            f"{name:<22}"
+            + "".join(f"{rows[n][name] * 1e3:>10.2f}" for n in EXTRA_NAMES)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# bug_outbox.py
+"""
+How long submitting a bug report blocks the page: BugReportOutbox.enqueue
+while the background sender is busy posting to a slow form endpoint, against
+posting inline as the old form did.
+
+    python -m benchmarks.bug_outbox
+"""
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import sideboarder_modular as sb_mod
+
+ENDPOINT_DELAYS = (0.0, 0.25, 1.0)  # seconds the form takes to answer
+REPORTS = 20
+
+
+class _SlowForm(BaseHTTPRequestHandler):
+    delay = 0.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(delay: float, reports: int = REPORTS) -> dict[str, float]:
+    """Median and worst seconds per submission, queued vs inline."""
+    handler = type("Handler", (_SlowForm,), {"delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/formResponse"
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            outbox = sb_mod.BugReportOutbox(os.path.join(tmp, "outbox.db"), url)
+            outbox.start()
+            queued = []
+            for i in range(reports):
+                start = time.perf_counter()
+                outbox.enqueue({"entry.1": f"report {i}"})
+                queued.append(time.perf_counter() - start)
+        inline = []
+        for i in range(min(reports, 3)):
+            start = time.perf_counter()
+            requests.post(url, data={"entry.1": f"report {i}"}, timeout=10)
+            inline.append(time.perf_counter() - start)
+    finally:
+        server.shutdown()
+    return {
+        "enqueue median": statistics.median(queued),
+        "enqueue max": max(queued),
+        "inline post median": statistics.median(inline),
+    }
+
+
+def main() -> int:
+    rows = {d: measure(d) for d in ENDPOINT_DELAYS}
+    names = list(rows[ENDPOINT_DELAYS[0]])
+    print(f"{'ms (form delay s)':<22}" + "".join(f"{d:>10}" for d in ENDPOINT_DELAYS))
+    for name in names:
+        print(
+            f"{name:<22}"
+            + "".join(f"{rows[d][name] * 1e3:>10.1f}" for d in ENDPOINT_DELAYS)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# card_search.py
+"""
+Cost of feeding the matchup-entry card selectors at 60, 300 and 1000 distinct
+cards: the old per-rerun option list + format_func lambda against the cached
+CardSearchIndex, plus typical filter queries.
+
+    python -m benchmarks.card_search
+"""
+import sys
+
+import sideboarder_modular as sb_mod
+from benchmarks._timing import best_seconds
+from benchmarks.synthetic import card_names
+
+CARD_COUNTS = (60, 300, 1000)
+QUERIES = ("bo", "bolt", "saga", "the rocks", "zzz")
+
+
+def deck_with(n_cards: int) -> dict:
+    """n distinct cards, roughly a sixth of them in the sideboard."""
+    names = card_names(n_cards)
+    n_side = n_cards // 6
+    return {
+        "mainboard": {f"MB:{n}": 1 for n in names[n_side:]},
+        "sideboard": {f"SB:{n}": 1 for n in names[:n_side]},
+    }
+
+
+def measure(n_cards: int, repeats: int = 50) -> dict[str, float]:
+    """Best-of-`repeats` seconds for each way of building the option lists."""
+    deck = deck_with(n_cards)
+    labels = sb_mod.card_labels_for(deck)
+    index = sb_mod.CardSearchIndex(deck)
+
+    def naive_rerun():
+        for zone in deck.values():
+            fmt = lambda k: labels.get(k, k)  # noqa: E731
+            [fmt(k) for k in list(zone.keys())]
+
+    def indexed_rerun():
+        for zone in deck:
+            [index.labels[k] for k in index.search("", zone)]
+
+    results = {
+        "build index": best_seconds(lambda: sb_mod.CardSearchIndex(deck), 5),
+        "naive rerun": best_seconds(naive_rerun, repeats),
+        "indexed rerun": best_seconds(indexed_rerun, repeats),
+    }
+    for q in QUERIES:
+        results[f"search {q!r}"] = best_seconds(lambda: index.search(q), repeats)
+    return results
+
+
+def main() -> int:
+    rows = {n: measure(n) for n in CARD_COUNTS}
+    names = list(rows[CARD_COUNTS[0]])
+    print(f"{'µs':<20}" + "".join(f"{n:>10}" for n in CARD_COUNTS))
+    for name in names:
+        print(
+            f"{name:<20}"
+            + "".join(f"{rows[n][name] * 1e6:>10.1f}" for n in CARD_COUNTS)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# edit_export.py
+"""
+Edit-then-export latency, as in the editor: one count changes and the guide is
+exported again at 300 dpi. Compares a full redraw of every panel with drawing
+only the cells over the cached grid template.
+
+    python -m benchmarks.edit_export
+"""
+import statistics
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+import sideboarder_modular as sb_mod  # noqa: E402
+from benchmarks.synthetic import synthetic_deck_data, synthetic_matchups  # noqa: E402
+
+SCENARIOS = (
+    ("constructed75", 5),
+    ("constructed75", 15),
+    ("commander100", 30),
+)
+DPI = 300
+
+
+def _edits(deck_data: dict, n_matchups: int, n_edits: int):
+    """Yield the guide after each of `n_edits` single-count changes."""
+    matchups = synthetic_matchups(deck_data, n_matchups)
+    for k in range(n_edits):
+        row = matchups[k % len(matchups)]
+        card = next(c for c in row if c.startswith("MB:"))
+        row[card] = "-1" if row[card] != "-1" else "-2"
+        yield sb_mod.build_matrix_df(matchups, deck_data)[::-1]
+
+
+def full_redraw(df, labels):
+    panels = len(sb_mod.matrix_layout(df, labels)["panels"])
+    masters = []
+    for panel in range(panels):
+        fig = sb_mod._draw_matrix_figure(df, labels, panel)
+        masters.append(sb_mod.figure_to_indexed(fig, DPI))
+        plt.close(fig)
+    return sb_mod.themed_png(
+        sb_mod.stack_panels(masters), sb_mod.EXPORT_THEMES["Colour"]
+    )
+
+
+def composited(df, labels):
+    masters = sb_mod.render_panels(df, labels, DPI)
+    return sb_mod.themed_png(
+        sb_mod.stack_panels(masters), sb_mod.EXPORT_THEMES["Colour"]
+    )
+
+
+def measure(shape: str, n_matchups: int, n_edits: int = 8) -> dict[str, float]:
+    """Median seconds per export after an edit, for each export path."""
+    deck_data = synthetic_deck_data(shape)
+    labels = sb_mod.card_labels_for(deck_data)
+    results = {}
+    for name, export in (("full redraw", full_redraw), ("composited", composited)):
+        times = []
+        for df in _edits(deck_data, n_matchups, n_edits + 1):
+            start = time.perf_counter()
+            export(df, labels)
+            times.append(time.perf_counter() - start)
+        results[name] = statistics.median(times[1:])  # first draw fills the caches
+        results[f"{name} (first)"] = times[0]
+    return results
+
+
+def main() -> int:
+    print(
+        f"{'scenario':<20}{'full ms':>10}{'composited ms':>15}{'first ms':>10}{'speed-up':>10}"
+    )
+    for shape, n in SCENARIOS:
+        r = measure(shape, n)
+        print(
+            f"{shape + '/' + str(n):<20}{r['full redraw'] * 1000:>10.1f}"
+            f"{r['composited'] * 1000:>15.1f}{r['composited (first)'] * 1000:>10.1f}"
+            f"{r['full redraw'] / r['composited']:>9.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+# load_test.py
+"""
+Multi-session load test that drives the real pages headlessly.
+
+    python -m benchmarks.load_test --sessions 1 2 4 8 16
+
+Each simulated session uses Streamlit's app-testing API (AppTest) to walk the
+same path as a user: open the splash page, switch to create, paste a
+decklist, add matchups through the widgets, open Export Options, then switch
+to the editor, change one count, save and re-export.
+
+AppTest swaps process-global runtime state on every script run, so sessions
+cannot share a process. Each session of a level runs in its own worker
+process instead, all started together, and the RSS column is the largest
+per-session process. This measures how the page scripts scale across cores,
+not how one Streamlit server process shares its GIL between sessions.
+"""
+import argparse
+import os
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from streamlit.testing.v1 import AppTest
+
+import sideboarder_modular as sb_mod
+from benchmarks.synthetic import (
+    synthetic_decklist,
+    synthetic_deck_data,
+    synthetic_matchups,
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STEPS = ("import", "add_matchup", "export", "edit_save", "editor_export")
+PERCENTILES = (50, 95, 99)
+
+
+def rss_mib() -> float:
+    """Current resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux and bytes on macOS; only a fallback
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def _timed(latencies: dict, step: str, action):
+    start = time.perf_counter()
+    action()
+    latencies.setdefault(step, []).append(time.perf_counter() - start)
+
+
+def _check(at: AppTest, step: str):
+    if at.exception:
+        raise RuntimeError(f"{step} failed: {at.exception[0].message}")
+
+
+def simulate_session(
+    shape: str = "constructed75", n_matchups: int = 3, seed: int = 0
+) -> dict[str, list[float]]:
+    """Run one user journey and return the latency of every step in seconds."""
+    mb_text, sb_text = synthetic_decklist(shape, seed)
+    deck_data = synthetic_deck_data(shape, seed)
+    matchups = synthetic_matchups(deck_data, n_matchups, seed)
+    latencies = {}
+
+    at = AppTest.from_file(os.path.join(REPO_ROOT, "splash.py"), default_timeout=120)
+    at.run()
+    at.switch_page("pages/create.py").run()
+    _check(at, "open create")
+
+    def import_deck():
+        at.text_area[0].input(mb_text)
+        at.text_area[1].input(sb_text)
+        next(b for b in at.button if b.label == "Submit Deck").click().run()
+        _check(at, "import")
+
+    _timed(latencies, "import", import_deck)
+
+    for row in matchups:
+        outs = [c for c in row if c.startswith("MB:")]
+        ins = [c for c in row if c.startswith("SB:")]
+
+        def add_matchup(row=row, outs=outs, ins=ins):
+            at.text_input(key="tmp_opponent_name").input(row["Matchup"])
+            search_out = at.multiselect(key="tmp_search_out")
+            for card in outs:
+                search_out.select(card)
+            search_in = at.multiselect(key="tmp_search_in")
+            for card in ins:
+                search_in.select(card)
+            at.run()
+            for card in outs:
+                at.number_input(key=sb_mod._slug_key("tmp_qty_out", card)).set_value(
+                    int(row[card].lstrip("-"))
+                )
+            for card in ins:
+                at.number_input(key=sb_mod._slug_key("tmp_qty_in", card)).set_value(
+                    int(row[card].lstrip("+"))
+                )
+            at.button(key="add_matchup").click().run()
+            at.button(key="confirm_matchup").click().run()
+            _check(at, "add matchup")
+
+        _timed(latencies, "add_matchup", add_matchup)
+
+    def export():
+        next(b for b in at.button if b.label == "Export Options").click().run()
+        _check(at, "export")
+
+    _timed(latencies, "export", export)
+
+    at.switch_page("pages/editor.py").run()
+    _check(at, "open editor")
+    first_out = next(c for c in matchups[0] if c.startswith("MB:"))
+
+    def edit_save():
+        # editor widgets are keyed by matchup id; the first tab's comes first
+        mid = next(b.key for b in at.button if b.key.startswith("save_btn_"))[9:]
+        at.number_input(key=f"edit_out_{mid}_{first_out}").set_value(0)
+        at.button(key=f"save_btn_{mid}").click().run()
+        at.button(key=f"confirm_save_{mid}").click().run()
+        _check(at, "edit save")
+
+    _timed(latencies, "edit_save", edit_save)
+    _timed(latencies, "editor_export", lambda: (at.run(), _check(at, "editor")))
+    return latencies
+
+
+def _session_in_process(shape: str, n_matchups: int, seed: int):
+    """Worker entry point: one session plus the worker's RSS afterwards."""
+    # the pages open ./static and ./images relative to the working directory
+    os.chdir(REPO_ROOT)
+    return simulate_session(shape, n_matchups, seed), rss_mib()
+
+
+def run_level(
+    n_sessions: int, shape: str = "constructed75", n_matchups: int = 3
+) -> dict:
+    """Run `n_sessions` sessions side by side and summarise throughput and latency."""
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=n_sessions) as pool:
+        futures = [
+            pool.submit(_session_in_process, shape, n_matchups, seed)
+            for seed in range(n_sessions)
+        ]
+        results, rss = zip(*(f.result() for f in futures))
+    wall = time.perf_counter() - start
+
+    summary = {
+        "sessions": n_sessions,
+        "wall_seconds": wall,
+        "sessions_per_second": n_sessions / wall,
+        "rss_mib": max(rss),
+        "steps": {},
+    }
+    for step in STEPS:
+        values = [v for r in results for v in r.get(step, [])]
+        summary["steps"][step] = {
+            f"p{q}": percentile(values, q) for q in PERCENTILES
+        } | {"mean": statistics.fmean(values) if values else 0.0}
+    return summary
+
+
+def format_report(levels: list[dict]) -> str:
+    lines = [
+        f"{'sessions':>8} {'wall s':>8} {'sess/s':>8} {'RSS MiB':>8}  "
+        + "  ".join(f"{s + ' p50/p95':>24}" for s in STEPS)
+    ]
+    for level in levels:
+        cells = "  ".join(
+            "{:>24}".format(
+                f"{level['steps'][s]['p50'] * 1000:.0f}/"
+                f"{level['steps'][s]['p95'] * 1000:.0f} ms"
+            )
+            for s in STEPS
+        )
+        lines.append(
+            f"{level['sessions']:>8} {level['wall_seconds']:>8.2f} "
+            f"{level['sessions_per_second']:>8.2f} {level['rss_mib']:>8.1f}  {cells}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SideBoarder multi-session load test")
+    parser.add_argument("--sessions", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--matchups", type=int, default=3)
+    parser.add_argument("--shape", default="constructed75")
+    args = parser.parse_args(argv)
+
+    levels = []
+    for n in args.sessions:
+        print(f"running {n} concurrent session(s)…", file=sys.stderr)
+        levels.append(run_level(n, args.shape, args.matchups))
+    print(format_report(levels))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# png_export.py
+"""
+Bytes and encode time of the exported PNG: the plain RGBA `savefig` output
+against the indexed, recoloured export path, at each export resolution, then
+the indexed path at each zlib level in LEVELS.
+
+    python -m benchmarks.png_export
+"""
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+import sideboarder_modular as sb_mod  # noqa: E402
+from benchmarks._timing import best  # noqa: E402
+from benchmarks.synthetic import synthetic_deck_data, synthetic_matchups  # noqa: E402
+
+SCENARIOS = (("constructed75", 15), ("commander100", 30), ("cube540", 100))
+LEVELS = (1, 6, 9)
+
+
+def measure(shape: str, n_matchups: int, dpi: int, repeats: int = 3) -> dict:
+    """{path: (bytes, best seconds)} for one synthetic guide at one DPI."""
+    deck = synthetic_deck_data(shape)
+    df = sb_mod.build_matrix_df(synthetic_matchups(deck, n_matchups), deck)
+    labels = sb_mod.card_labels_for(deck)
+    fig = sb_mod._draw_matrix_figure(df, labels)
+    theme = sb_mod.EXPORT_THEMES["Colour"]
+    try:
+        rgba_s, rgba = best(lambda: sb_mod.figure_to_png(fig, dpi), repeats)
+        indexed_s, indexed = best(
+            lambda: sb_mod.themed_png(sb_mod.figure_to_indexed(fig, dpi), theme),
+            repeats,
+        )
+    finally:
+        plt.close(fig)
+    return {
+        "rgba": (len(rgba.getvalue()), rgba_s),
+        "indexed": (len(indexed.getvalue()), indexed_s),
+    }
+
+
+def measure_levels(shape: str, n_matchups: int, dpi: int, repeats: int = 3) -> dict:
+    """{compress_level: (bytes, best seconds)} for the indexed export."""
+    deck = synthetic_deck_data(shape)
+    df = sb_mod.build_matrix_df(synthetic_matchups(deck, n_matchups), deck)
+    fig = sb_mod._draw_matrix_figure(df, sb_mod.card_labels_for(deck))
+    theme = sb_mod.EXPORT_THEMES["Colour"]
+    try:
+        indexed = sb_mod.figure_to_indexed(fig, dpi)
+    finally:
+        plt.close(fig)
+    results = {}
+    for level in LEVELS:
+        seconds, png = best(
+            lambda: sb_mod.themed_png(indexed, theme, compress_level=level), repeats
+        )
+        results[level] = (len(png.getvalue()), seconds)
+    return results
+
+
+def main() -> int:
+    print(
+        f"{'scenario':<20}{'dpi':>5}{'RGBA bytes':>12}{'ms':>8}"
+        f"{'indexed bytes':>15}{'ms':>8}{'saved':>8}"
+    )
+    for shape, n in SCENARIOS:
+        for dpi in sb_mod.EXPORT_DPI.values():
+            r = measure(shape, n, dpi)
+            (rgba_b, rgba_s), (idx_b, idx_s) = r["rgba"], r["indexed"]
+            print(
+                f"{shape + '/' + str(n):<20}{dpi:>5}{rgba_b:>12}{rgba_s * 1000:>8.0f}"
+                f"{idx_b:>15}{idx_s * 1000:>8.0f}{1 - idx_b / rgba_b:>8.0%}"
+            )
+
+    print()
+    print(
+        f"{'scenario':<20}{'dpi':>5}"
+        + "".join(f"{'level ' + str(lv) + ' bytes':>16}{'ms':>8}" for lv in LEVELS)
+    )
+    for shape, n in SCENARIOS:
+        for dpi in sb_mod.EXPORT_DPI.values():
+            r = measure_levels(shape, n, dpi)
+            print(
+                f"{shape + '/' + str(n):<20}{dpi:>5}"
+                + "".join(f"{r[lv][0]:>16}{r[lv][1] * 1000:>8.0f}" for lv in LEVELS)
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+# run_benchmarks.py
+"""
+Time and peak-memory benchmarks for each export stage, at increasing guide sizes.
+
+    python -m benchmarks.run_benchmarks                      # full grid
+    python -m benchmarks.run_benchmarks --quick              # small grid
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+
+Everything runs offline on synthetic data. Cached Streamlit functions are
+called through `__wrapped__`, and the render stage empties the layout and
+grid-template caches first, so every repeat measures a first export (the
+warm path after an edit is in benchmarks/edit_export.py). The render, png and
+pdf stages follow write_guide_images, the app's export path. Peak memory is
+the Python heap peak reported by tracemalloc for a single extra run.
+"""
+import argparse
+import io
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import sideboarder_modular as sb_mod  # noqa: E402
+from benchmarks.synthetic import (  # noqa: E402
+    DECK_SHAPES,
+    synthetic_decklist,
+    synthetic_deck_data,
+    synthetic_matchups,
+)
+
+STAGES = ("parse", "assemble", "render", "png", "pdf")
+DPI = 300
+PALETTE = sb_mod.EXPORT_THEMES["Colour"]
+MATCHUP_COUNTS = (5, 15, 30, 60, 100)
+QUICK_GRID = {"constructed75": (5, 15), "commander100": (15,)}
+
+# Differences smaller than these are treated as noise when comparing to a baseline.
+MIN_SECONDS_DELTA = 0.002
+MIN_KIB_DELTA = 64
+
+
+def _stage_functions(shape: str, n_matchups: int, seed: int = 0) -> dict:
+    """Build one closure per stage; each takes the previous stage's output."""
+    mb_text, sb_text = synthetic_decklist(shape, seed)
+    deck_data = synthetic_deck_data(shape, seed)
+    matchups = synthetic_matchups(deck_data, n_matchups, seed)
+    labels = sb_mod.card_labels_for(deck_data)
+
+    def parse(_):
+        return (
+            sb_mod.parse_decklist.__wrapped__(mb_text),
+            sb_mod.parse_decklist.__wrapped__(sb_text),
+        )
+
+    def assemble(_):
+        return sb_mod.build_matrix_df(matchups, deck_data)
+
+    def render(df):
+        sb_mod.solve_layout.cache_clear()
+        sb_mod._grid_template.clear()
+        return sb_mod.render_panels(df, labels, DPI)
+
+    def png(masters):
+        png = sb_mod.themed_png(
+            sb_mod.stack_panels(masters, gap=DPI // 10), PALETTE
+        ).getvalue()
+        return masters, png
+
+    def pdf(rendered):
+        masters, png = rendered
+        out = io.BytesIO()
+        if len(masters) == 1:
+            sb_mod.write_print_pdf(png, out, DPI)
+        else:
+            sb_mod.impose_guides(
+                (sb_mod.themed_png(m, PALETTE).getvalue() for m in masters), out
+            )
+        return out
+
+    return {
+        "parse": parse,
+        "assemble": assemble,
+        "render": render,
+        "png": png,
+        "pdf": pdf,
+    }
+
+
+def _run_pipeline(funcs: dict, timings: dict | None = None, peaks: dict | None = None):
+    value = None
+    for stage in STAGES:
+        if peaks is not None:
+            tracemalloc.start()
+        start = time.perf_counter()
+        value = funcs[stage](value)
+        elapsed = time.perf_counter() - start
+        if peaks is not None:
+            peaks[stage] = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+        if timings is not None:
+            timings.setdefault(stage, []).append(elapsed)
+    return value
+
+
+def run_scenario(shape: str, n_matchups: int, repeats: int = 3) -> dict:
+    """Return {stage: {'seconds': median, 'peak_kib': peak}} for one guide size."""
+    funcs = _stage_functions(shape, n_matchups)
+    timings, peaks = {}, {}
+    for _ in range(repeats):
+        _run_pipeline(funcs, timings=timings)
+    _run_pipeline(funcs, peaks=peaks)
+    return {
+        stage: {
+            "seconds": statistics.median(timings[stage]),
+            "peak_kib": peaks[stage],
+        }
+        for stage in STAGES
+    }
+
+
+def run_grid(grid: dict, repeats: int = 3, progress=None) -> dict:
+    results = {}
+    for shape, counts in grid.items():
+        for n in counts:
+            name = f"{shape}/{n}"
+            if progress:
+                progress(name)
+            results[name] = run_scenario(shape, n, repeats)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """List every stage that got slower or hungrier than baseline × (1 + tolerance)."""
+    regressions = []
+    for name, stages in results.items():
+        for stage, now in stages.items():
+            before = baseline.get(name, {}).get(stage)
+            if not before:
+                continue
+            for metric, floor in (
+                ("seconds", MIN_SECONDS_DELTA),
+                ("peak_kib", MIN_KIB_DELTA),
+            ):
+                limit = before[metric] * (1 + tolerance)
+                if now[metric] > limit and now[metric] - before[metric] > floor:
+                    regressions.append(
+                        f"{name} {stage} {metric}: {before[metric]:.4g} -> {now[metric]:.4g}"
+                    )
+    return regressions
+
+
+def format_table(results: dict) -> str:
+    header = f"{'scenario':<22}" + "".join(f"{s:>20}" for s in STAGES)
+    lines = [header, "-" * len(header)]
+    for name, stages in results.items():
+        cells = "".join(
+            f"{stages[s]['seconds'] * 1000:>8.1f}ms {stages[s]['peak_kib']:>6.0f}KiB"
+            for s in STAGES
+        )
+        lines.append(f"{name:<22}{cells}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="run a small grid")
+    parser.add_argument(
+        "--shapes", nargs="+", choices=sorted(DECK_SHAPES), help="deck shapes to run"
+    )
+    parser.add_argument(
+        "--matchups", nargs="+", type=int, help="matchup counts per guide"
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--json", metavar="PATH", help="also write results to PATH")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        grid = dict(QUICK_GRID)
+    else:
+        shapes = args.shapes or list(DECK_SHAPES)
+        grid = {s: tuple(args.matchups or MATCHUP_COUNTS) for s in shapes}
+
+    results = run_grid(
+        grid, args.repeats, progress=lambda n: print(f"running {n}…", file=sys.stderr)
+    )
+    print(format_table(results))
+
+    for path in filter(None, (args.json, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# save_formats.py
+"""
+Size and load-time comparison of the JSON save format, the compact .sbg format
+and the share-link token (whose size is in URL characters).
+
+    python -m benchmarks.save_formats
+"""
+import io
+import sys
+
+import sideboarder_modular as sb_mod
+from benchmarks._timing import best_seconds
+from benchmarks.synthetic import synthetic_deck_data, synthetic_matchups
+
+SCENARIOS = (
+    ("constructed75", 15),
+    ("constructed75", 50),
+    ("commander100", 30),
+    ("cube540", 100),
+)
+
+# Large JSON guides exceed the upload limit; measure them anyway.
+NO_SIZE_LIMIT = {"max_bytes": 1 << 30}
+
+
+def _best_load_seconds(payload: bytes, repeats: int) -> float:
+    return best_seconds(
+        lambda: sb_mod.load_guide(io.BytesIO(payload), limits=NO_SIZE_LIMIT), repeats
+    )
+
+
+def measure(shape: str, n_matchups: int, repeats: int = 20) -> dict:
+    """Return {format: (bytes, best load seconds)} for one synthetic guide."""
+    deck_data = synthetic_deck_data(shape)
+    df = sb_mod.build_matrix_df(synthetic_matchups(deck_data, n_matchups), deck_data)
+    records = df.reset_index().to_dict(orient="records")
+    payloads = {
+        "json": sb_mod.guide_to_json(deck_data, df).encode(),
+        "sbg": sb_mod.encode_guide_compact(deck_data, records, compress=False),
+        "sbg+zlib": sb_mod.encode_guide_compact(deck_data, records),
+    }
+    return {
+        fmt: (len(payload), _best_load_seconds(payload, repeats))
+        for fmt, payload in payloads.items()
+    }
+
+
+def share_token_length(shape: str, n_matchups: int) -> int:
+    """Characters in the URL token for one synthetic guide."""
+    deck_data = synthetic_deck_data(shape)
+    df = sb_mod.build_matrix_df(synthetic_matchups(deck_data, n_matchups), deck_data)
+    records = df.reset_index().to_dict(orient="records")
+    return len(sb_mod.encode_share_token(deck_data, records))
+
+
+def main() -> int:
+    print(f"{'scenario':<20}{'format':<10}{'bytes':>10}{'ratio':>8}{'load ms':>10}")
+    for shape, n in SCENARIOS:
+        results = measure(shape, n)
+        results["share link"] = (share_token_length(shape, n), float("nan"))
+        json_bytes = results["json"][0]
+        for fmt, (size, seconds) in results.items():
+            print(
+                f"{shape + '/' + str(n):<20}{fmt:<10}{size:>10}"
+                f"{size / json_bytes:>8.2f}{seconds * 1000:>10.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
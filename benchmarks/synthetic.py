@@ -0,0 +1,87 @@
+# synthetic.py
+"""Deterministic synthetic decks and sideboard guides for benchmarking."""
+import random
+
+# name -> (mainboard cards, sideboard cards, copies per card)
+DECK_SHAPES = {
+    "constructed60": (60, 0, 4),
+    "constructed75": (60, 15, 4),
+    "commander100": (100, 10, 1),
+    "cube540": (540, 45, 1),
+}
+
+_FIRST = (
+    "Ragavan Lightning Thoughtseize Primeval Urza's Dragon's Galvanic Mishra's "
+    "Consign Prismatic Soul-Guide Tormod's Monastery Experimental Pithing Surgical"
+).split()
+_SECOND = (
+    "Bolt Titan Saga Rage Blast Bauble Memory Ending Lantern Crypt Swiftspear "
+    "Synthesizer Needle Extraction Tarn Channeler Cutter Spellbomb"
+).split()
+_EPITHETS = ["Nimble Pilferer", "Who Endures", "the Rocks", "Vial of Souls", ""]
+
+
+def card_names(count: int, seed: int = 0) -> list[str]:
+    """Generate `count` unique, realistically sized card names."""
+    rng = random.Random(seed)
+    names, seen = [], set()
+    while len(names) < count:
+        name = f"{rng.choice(_FIRST)} {rng.choice(_SECOND)}"
+        epithet = rng.choice(_EPITHETS)
+        if epithet:
+            name = f"{name}, {epithet}"
+        if name in seen:
+            name = f"{name} {len(names)}"
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def synthetic_decklist(shape: str, seed: int = 0) -> tuple[str, str]:
+    """MTGO-style (mainboard, sideboard) text for one of DECK_SHAPES."""
+    mb_total, sb_total, copies = DECK_SHAPES[shape]
+    mb_names = card_names(-(-mb_total // copies), seed)
+    sb_names = card_names(-(-sb_total // copies), seed + 1) if sb_total else []
+
+    def lines(names, total):
+        out, left = [], total
+        for name in names:
+            qty = min(copies, left)
+            out.append(f"{qty} {name}")
+            left -= qty
+        return "\n".join(out)
+
+    return lines(mb_names, mb_total), lines(sb_names, sb_total)
+
+
+def synthetic_deck_data(shape: str, seed: int = 0) -> dict[str, dict[str, int]]:
+    """Namespaced deck_data ({'mainboard': {'MB:..': n}, 'sideboard': {...}})."""
+    mb_text, sb_text = synthetic_decklist(shape, seed)
+
+    def parse(text, prefix):
+        deck = {}
+        for line in text.splitlines():
+            qty, name = line.split(" ", 1)
+            deck[f"{prefix}:{name}"] = int(qty)
+        return deck
+
+    return {"mainboard": parse(mb_text, "MB"), "sideboard": parse(sb_text, "SB")}
+
+
+def synthetic_matchups(
+    deck_data: dict, n_matchups: int, seed: int = 0, max_swaps: int = 4
+) -> list[dict]:
+    """Matchup rows in the app's format: {'Matchup': name, card: '-n'/'+n'}."""
+    rng = random.Random(seed)
+    mb = list(deck_data["mainboard"].items())
+    sb = list(deck_data["sideboard"].items())
+    rows = []
+    for i in range(n_matchups):
+        row = {"Matchup": f"Archetype {i + 1}"}
+        for card, qty in rng.sample(mb, min(len(mb), rng.randint(1, max_swaps))):
+            row[card] = f"-{rng.randint(1, qty)}"
+        if sb:
+            for card, qty in rng.sample(sb, min(len(sb), rng.randint(1, max_swaps))):
+                row[card] = f"+{rng.randint(1, qty)}"
+        rows.append(row)
+    return rows
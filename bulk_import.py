@@ -0,0 +1,67 @@
+# bulk_import.py
+"""
+Turn a dump of many decklists into one guide skeleton per deck: a saved
+guide with the decklist and no matchups yet, ready to open in the app.
+
+    python bulk_import.py challenge.txt --out guides/
+    cat lists/*.txt | python bulk_import.py - --zip skeletons.zip
+
+The dump is read a line at a time and each deck is written as soon as it
+ends, so large dumps never sit in memory. Once matchups are added, the same
+files go through batch_export.py.
+"""
+import argparse
+import json
+import os
+import sys
+
+import sideboarder_modular as sb_mod
+
+
+def _dump_lines(paths):
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+            continue
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            yield from f
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("dumps", nargs="+", help="text dumps, or - for stdin")
+    parser.add_argument("--out", default=".", help="directory for the JSON guides")
+    parser.add_argument("--zip", metavar="PATH", help="write one ZIP instead")
+    args = parser.parse_args(argv)
+
+    skeletons = sb_mod.iter_guide_skeletons(_dump_lines(args.dumps))
+    if args.zip:
+        with open(args.zip, "wb") as out:
+            summary = sb_mod.write_skeleton_zip(out, skeletons)
+    else:
+        os.makedirs(args.out, exist_ok=True)
+        summary, taken = [], set(os.listdir(args.out))
+        for name, guide, error in skeletons:
+            row = {"Deck": name, "File": None, "Problem": error}
+            if guide is not None:
+                row["File"] = sb_mod.skeleton_filename(name, taken)
+                with open(
+                    os.path.join(args.out, row["File"]), "w", encoding="utf-8"
+                ) as f:
+                    json.dump(guide, f, indent=2)
+            summary.append(row)
+
+    failed = 0
+    for row in summary:
+        if row["File"]:
+            print(f"{row['Deck']} -> {row['File']}")
+        else:
+            print(f"{row['Deck']}: {row['Problem']}", file=sys.stderr)
+            failed += 1
+    if not summary:
+        print("No decklists found.", file=sys.stderr)
+    return 1 if failed or not summary else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
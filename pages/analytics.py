@@ -0,0 +1,100 @@
+# analytics.py
+import streamlit as st
+import pandas as pd
+import sideboarder_modular as sb_mod
+
+# Page setup
+st.set_page_config(
+    page_title="Team Analytics - SideBoarder",
+    layout="centered",
+    page_icon="./images/icon.ico",
+)
+sb_mod.inject_css()
+sb_mod.start_metrics_exporters()
+sb_mod.render_sidebar()
+st.title("SideBoarder Team Analytics")
+st.markdown(
+    """
+    Upload several guides for the same deck (e.g. one from each teammate) to see
+    where your sideboard plans agree and where they diverge.
+    """
+)
+st.header("Upload Guides")
+sb_mod.section_divider()
+
+uploads = st.file_uploader(
+    "Upload two or more Sideboarder guides",
+    type=["json", "sbg"],
+    accept_multiple_files=True,
+)
+guides = []
+for f in uploads or []:
+    try:
+        guides.append(sb_mod.load_guide(f))
+    except sb_mod.GuideValidationError as e:
+        st.error(f"❌ {f.name}: {e}")
+
+if len(guides) >= 2:
+    if len({sb_mod.deck_hash(g["deck_data"]) for g in guides}) > 1:
+        st.info(
+            "These guides are for different decklists; cards missing from a list count as unused."
+        )
+    stacked = sb_mod.stack_guides(guides)
+    consensus = sb_mod.guide_consensus(stacked)
+    labels = {c: c[3:] for c in stacked["cards"]}
+
+    st.header("Consensus Plan")
+    sb_mod.section_divider()
+    st.markdown(
+        "Mean number of copies moved per matchup, across the guides that cover it."
+    )
+    df = sb_mod.consensus_df(stacked, consensus)
+    if df.empty:
+        st.info("None of these guides move any cards.")
+    else:
+        st.image(
+            sb_mod.apply_theme(
+                sb_mod.stack_panels(sb_mod.render_panels(df[::-1], labels), gap=30),
+                sb_mod.EXPORT_THEMES["Colour"],
+            )
+        )
+
+    st.header("Where Plans Diverge")
+    sb_mod.section_divider()
+    columns = [labels[c] for c in stacked["cards"]]
+    spread = pd.DataFrame(
+        consensus["spread"], index=stacked["archetypes"], columns=columns
+    )
+    spread = spread.loc[:, (spread > 0).any(axis=0)]
+    frequency = pd.DataFrame(
+        consensus["frequency"], index=stacked["archetypes"], columns=columns
+    )
+    frequency = frequency.loc[:, (frequency > 0).any(axis=0)]
+    if spread.empty:
+        st.success("Every guide agrees on every matchup.")
+    else:
+        tab_spread, tab_frequency = st.tabs(["Spread", "How often"])
+        with tab_spread:
+            st.markdown(
+                "Standard deviation of the copies moved; higher means teammates disagree more."
+            )
+            st.dataframe(spread.style.format("{:.1f}").background_gradient(cmap="Reds"))
+        with tab_frequency:
+            st.markdown(
+                "Share of the guides covering each matchup that move the card at all."
+            )
+            st.dataframe(
+                frequency.style.format("{:.0%}").background_gradient(
+                    cmap="Blues", vmin=0, vmax=1
+                )
+            )
+
+    st.header("Card Usage")
+    sb_mod.section_divider()
+    coverage = pd.Series(
+        consensus["coverage"], index=stacked["archetypes"], name="Guides covering"
+    )
+    st.dataframe(sb_mod.card_usage_summary(stacked), hide_index=True)
+    st.dataframe(coverage)
+elif guides:
+    st.info("Upload at least one more guide to compare.")
@@ -20,6 +20,7 @@ USE_DUMMY_MATCHUPS = False  # Inputs matchup_data automatically to save developm
 
 # Inject custom CSS and set up page header
 sb_mod.inject_css()
+sb_mod.start_metrics_exporters()
 st.title("SideBoarder Generator")
 st.markdown(
     """
@@ -48,6 +49,7 @@ sb_mod.initialize_session_state(
 # Step 1: Deck input
 if not st.session_state.deck_data:
     sb_mod.render_deck_input_section()
+    sb_mod.render_bulk_import_section()
 
 
 else:
@@ -102,6 +104,8 @@ if st.session_state.deck_data:
         st.header("Add Matchup Info")
         sb_mod.section_divider()
         sb_mod.render_matchup_entry()
+        if "history" in st.session_state:
+            sb_mod.render_history_controls()
 
 # Step 3: Matrix preview & download
 sb_mod.render_matrix_section()
@@ -1,10 +1,5 @@
 import streamlit as st
-import json
-import pandas as pd
 from datetime import date
-from PIL import Image
-import io
-import math
 import sideboarder_modular as sb_mod
 
 # Page setup
@@ -12,6 +7,7 @@ st.set_page_config(
     page_title="Edit - SideBoarder", layout="centered", page_icon="./images/icon.ico"
 )
 sb_mod.inject_css()
+sb_mod.start_metrics_exporters()
 sb_mod.render_sidebar()
 st.title("SideBoarder Editor")
 st.markdown(
@@ -22,19 +18,31 @@ st.markdown(
 st.header("Upload Data")
 sb_mod.section_divider()
 
+# Shared links carry the whole guide in the URL
+token = st.query_params.get(sb_mod.SHARE_QUERY_PARAM)
+if token and "deck_data" not in st.session_state:
+    try:
+        sb_mod.load_guide_into_session(sb_mod.decode_share_token(token))
+    except sb_mod.GuideValidationError as e:
+        st.error(f"❌ Failed to open shared guide: {e}")
+    else:
+        st.success("✅ Shared guide loaded.")
+
 # Upload JSON (only load into session_state once)
-uploaded = st.file_uploader("Upload your Sideboarder JSON file", type="json")
+uploaded = st.file_uploader(
+    "Upload your Sideboarder guide (JSON or compact .sbg)", type=["json", "sbg"]
+)
 if uploaded and "deck_data" not in st.session_state:
     try:
-        data = json.load(uploaded)
+        data = sb_mod.load_guide(uploaded)
+    except sb_mod.GuideValidationError as e:
+        st.error(f"❌ Failed to load guide: {e}")
+    else:
         st.success("✅ File loaded successfully.")
-        st.session_state.deck_data = data["deck_data"]
-        st.session_state.matchups = data["matrix"]
-        st.session_state.card_labels = {
-            key: key[3:] for zone in data["deck_data"].values() for key in zone
-        }
-    except Exception as e:
-        st.error(f"❌ Failed to parse JSON: {e}")
+        sb_mod.load_guide_into_session(data)
+
+sb_mod.render_guide_store_loader()
+sb_mod.render_guide_comparison()
 
 # Confirmation state defaults
 st.session_state.setdefault("confirm_action", None)
@@ -42,19 +50,41 @@ st.session_state.setdefault("pending_changes", None)
 st.session_state.setdefault("pending_deletion", None)
 
 # Edit matchups with tabs
-if st.session_state.get("matchups"):
+st.session_state.setdefault("history", sb_mod.MatchupHistory())
+if (
+    st.session_state.get("deck_data")
+    and not st.session_state.get("matchups")
+    and not st.session_state.history.can_undo
+):
+    # e.g. a skeleton from the bulk import: matchups are added on Create
+    st.info("This guide has no matchups yet. Add the first ones on the Create page.")
+    st.page_link("pages/create.py", label="Add matchups", icon=":material/add_circle:")
+if st.session_state.get("matchups") or st.session_state.history.can_undo:
     st.header("Edit Matchups")
     sb_mod.section_divider()
+    sb_mod.render_history_controls()
+    sb_mod.render_deck_update()
+    sb_mod.render_review_notes()
+    sb_mod.render_guide_check(st.session_state.deck_data, st.session_state.matchups)
 
     mb_keys = st.session_state.deck_data["mainboard"].keys()
     sb_keys = st.session_state.deck_data["sideboard"].keys()
-    tabs = st.tabs([m["Matchup"] for m in st.session_state.matchups])
+    if st.session_state.matchups:
+        tabs = st.tabs([m["Matchup"] for m in st.session_state.matchups])
+    else:
+        tabs = []
+        st.info("All matchups have been deleted. Use Undo to restore them.")
 
-    for idx, tab in enumerate(tabs):
+    # widgets are keyed by matchup id, so they follow their matchup when
+    # others are deleted; inputs of matchups that are gone are dropped
+    ids = sb_mod.matchup_ids(st.session_state.matchups)
+    sb_mod.collect_widget_state({p: set(ids) for p in sb_mod.EDIT_WIDGET_PREFIXES})
+
+    for idx, (tab, mid) in enumerate(zip(tabs, ids)):
         with tab:
             # Choose whether to show the original or the pending-changes version
             if (
-                st.session_state.confirm_action == f"save_{idx}"
+                st.session_state.confirm_action == f"save_{mid}"
                 and st.session_state.pending_changes
             ):
                 matchup = st.session_state.pending_changes
@@ -62,7 +92,7 @@ if st.session_state.get("matchups"):
                 matchup = st.session_state.matchups[idx]
 
             # Matchup name input
-            name_key = f"edit_name_{idx}"
+            name_key = f"edit_name_{mid}"
             st.text_input("Matchup Name", value=matchup["Matchup"], key=name_key)
 
             # Parse existing in/out values
@@ -96,7 +126,7 @@ if st.session_state.get("matchups"):
                 )
                 for card in mb_keys:
                     if card in mb_out:
-                        key = f"edit_out_{idx}_{card}"
+                        key = f"edit_out_{mid}_{card}"
                         qty = st.number_input(
                             st.session_state.card_labels[card],
                             min_value=0,
@@ -110,7 +140,7 @@ if st.session_state.get("matchups"):
                 with st.expander("Show other mainboard cards:"):
                     for card in mb_keys:
                         if card not in mb_out:
-                            key = f"edit_out_{idx}_{card}"
+                            key = f"edit_out_{mid}_{card}"
                             qty = st.number_input(
                                 st.session_state.card_labels[card],
                                 min_value=0,
@@ -130,7 +160,7 @@ if st.session_state.get("matchups"):
                 )
                 for card in sb_keys:
                     if card in sb_in:
-                        key = f"edit_in_{idx}_{card}"
+                        key = f"edit_in_{mid}_{card}"
                         qty = st.number_input(
                             st.session_state.card_labels[card],
                             min_value=0,
@@ -144,7 +174,7 @@ if st.session_state.get("matchups"):
                 with st.expander("Show other sideboard cards:"):
                     for card in sb_keys:
                         if card not in sb_in:
-                            key = f"edit_in_{idx}_{card}"
+                            key = f"edit_in_{mid}_{card}"
                             qty = st.number_input(
                                 st.session_state.card_labels[card],
                                 min_value=0,
@@ -165,36 +195,48 @@ if st.session_state.get("matchups"):
                     "⚠️ Number of cards being taken OUT does not match number being brought IN."
                 )
 
+            # On-the-draw variant, kept as a delta from the plan above
+            if st.checkbox(
+                "Different plan on the draw",
+                value=bool(matchup.get(sb_mod.DRAW_KEY)),
+                key=f"edit_draw_{mid}_split",
+            ):
+                play = sb_mod.plan_cells(new_row)
+                draw = sb_mod.render_draw_plan_inputs(
+                    f"edit_draw_{mid}",
+                    st.session_state.deck_data,
+                    st.session_state.card_labels,
+                    play,
+                    sb_mod.draw_plan(matchup) if matchup.get(sb_mod.DRAW_KEY) else play,
+                )
+                delta = sb_mod.draw_delta(play, draw)
+                if delta:
+                    new_row[sb_mod.DRAW_KEY] = delta
+
             # Action buttons / confirm dialogs
             confirm = st.session_state.confirm_action
             col1, col2 = st.columns(2)
 
             # — Save path —
             with col1:
-                if confirm == f"save_{idx}":
+                if confirm == f"save_{mid}":
                     # Show changelog & confirm/cancel
                     original = st.session_state.matchups[idx]
-                    changes = []
-                    # Name change?
-                    if new_row["Matchup"] != original["Matchup"]:
-                        changes.append(
-                            f"🆕 Renamed '{original['Matchup']}' to '{new_row['Matchup']}'"
+                    diff = sb_mod.diff_guides([original], [new_row])
+                    changes = [
+                        f"🆕 Renamed '{old}' to '{new}'" for old, new in diff["renamed"]
+                    ]
+                    for change in diff["changed"]:
+                        changes += sb_mod.format_cell_changes(
+                            change["cells"], st.session_state.card_labels
                         )
-                    # Card diffs
-                    all_cards = set(original.keys()).union(new_row.keys()) - {"Matchup"}
-                    for card in sorted(all_cards):
-                        o = original.get(card, "")
-                        n = new_row.get(card, "")
-                        if isinstance(o, float) and math.isnan(o):
-                            o = ""
-                        if o != n:
-                            old_n = int(o.lstrip("+-")) if o else 0
-                            new_n = int(n.lstrip("+-")) if n else 0
-                            delta = new_n - old_n
-                            if delta:
-                                sign = "+" if delta > 0 else "-"
-                                label = st.session_state.card_labels.get(card, card)
-                                changes.append(f"{sign}{abs(delta)} {label}")
+                        changes += [
+                            f"{line} on the draw"
+                            for line in sb_mod.format_cell_changes(
+                                change.get("draw_cells", []),
+                                st.session_state.card_labels,
+                            )
+                        ]
                     if changes:
                         st.markdown("### Changes to Apply:")
                         for c in changes:
@@ -202,99 +244,69 @@ if st.session_state.get("matchups"):
                     sb_mod.custom_info(
                         "Confirm to apply these changes or cancel to continue editing."
                     )
-                    if st.button("✅ Confirm Save", key=f"confirm_save_{idx}"):
-                        st.session_state.matchups[idx] = new_row
+                    if st.button("✅ Confirm Save", key=f"confirm_save_{mid}"):
+                        st.session_state.history.edit(
+                            st.session_state.matchups, idx, new_row
+                        )
                         # cleanup inputs
-                        for k in list(st.session_state.keys()):
-                            if (
-                                k.startswith(f"edit_out_{idx}_")
-                                or k.startswith(f"edit_in_{idx}_")
-                                or k.startswith(name_key)
-                            ):
-                                del st.session_state[k]
+                        sb_mod.clear_matchup_widgets(mid)
                         st.session_state.confirm_action = None
                         st.session_state.pending_changes = None
                         st.rerun()
-                    if st.button("❌ Cancel", key=f"cancel_save_{idx}"):
+                    if st.button("❌ Cancel", key=f"cancel_save_{mid}"):
                         st.session_state.confirm_action = None
                         st.session_state.pending_changes = None
                         st.rerun()
-                elif confirm == f"delete_{idx}":
+                elif confirm == f"delete_{mid}":
                     # Hide Save during delete confirm
                     pass
                 else:
                     if st.button(
-                        f"Save Changes to {matchup['Matchup']}", key=f"save_btn_{idx}"
+                        f"Save Changes to {matchup['Matchup']}", key=f"save_btn_{mid}"
                     ):
                         st.session_state.pending_changes = new_row
-                        st.session_state.confirm_action = f"save_{idx}"
+                        st.session_state.confirm_action = f"save_{mid}"
                         st.rerun()
 
             # — Delete path —
             with col2:
-                if confirm == f"delete_{idx}":
+                if confirm == f"delete_{mid}":
                     sb_mod.custom_info("Are you sure you want to delete this matchup?")
-                    if st.button("✅ Confirm Delete", key=f"confirm_delete_{idx}"):
-                        deleted = st.session_state.matchups.pop(idx)
-                        # cleanup inputs
-                        for k in list(st.session_state.keys()):
-                            if (
-                                k.startswith(f"edit_out_{idx}_")
-                                or k.startswith(f"edit_in_{idx}_")
-                                or k.startswith(name_key)
-                            ):
-                                del st.session_state[k]
+                    if st.button("✅ Confirm Delete", key=f"confirm_delete_{mid}"):
+                        deleted = st.session_state.history.delete(
+                            st.session_state.matchups, idx
+                        )
                         st.toast(f"Deleted matchup: {deleted['Matchup']}")
                         st.session_state.confirm_action = None
                         st.session_state.pending_deletion = None
                         st.rerun()
-                    if st.button("❌ Cancel", key=f"cancel_delete_{idx}"):
+                    if st.button("❌ Cancel", key=f"cancel_delete_{mid}"):
                         st.session_state.confirm_action = None
                         st.session_state.pending_deletion = None
                         st.rerun()
-                elif confirm == f"save_{idx}":
+                elif confirm == f"save_{mid}":
                     # Hide Delete during save confirm
                     pass
                 else:
                     if st.button(
                         f":red[Delete {matchup['Matchup']} Matchup]",
-                        key=f"delete_btn_{idx}",
+                        key=f"delete_btn_{mid}",
                     ):
                         st.session_state.pending_deletion = idx
-                        st.session_state.confirm_action = f"delete_{idx}"
+                        st.session_state.confirm_action = f"delete_{mid}"
                         st.rerun()
 
 # Export section
 if st.session_state.get("matchups"):
     sb_mod.section_divider()
     st.subheader("Export Updated Sideboard Guide")
-    df = pd.DataFrame(st.session_state.matchups).set_index("Matchup")
-    mb_keys = sorted(st.session_state.deck_data["mainboard"].keys())
-    sb_keys = sorted(st.session_state.deck_data["sideboard"].keys())
-    columns = [c for c in mb_keys if c in df.columns] + [
-        c for c in sb_keys if c in df.columns
-    ]
-    df = df[columns].loc[:, (df != "").any(axis=0)]
-    fig = sb_mod.render_matrix_figure(df, st.session_state.card_labels)
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=300)
-    buf.seek(0)
-    card = Image.open(buf)
-    dpi = 300
-    page_w, page_h = int(8.27 * dpi), int(11.69 * dpi)
-    page = Image.new("RGB", (page_w, page_h), "white")
-    x = (page_w - card.width) // 2
-    y = (page_h - card.height) // 2
-    page.paste(card, (x, y))
-    buf_pdf = io.BytesIO()
-    page.save(buf_pdf, "PDF", resolution=dpi)
-    buf_pdf.seek(0)
-
-    payload = {
-        "deck_data": st.session_state.deck_data,
-        "matrix": df.reset_index().to_dict(orient="records"),
-    }
-    json_str = json.dumps(payload, indent=2)
+    df = sb_mod.build_matrix_df(st.session_state.matchups, st.session_state.deck_data)
+    theme, dpi = sb_mod.render_export_settings()
+    with sb_mod.track_cache("grid_template"):
+        buf, buf_pdf = sb_mod.render_guide_images(
+            df, st.session_state.card_labels, theme, dpi
+        )
+    json_str = sb_mod.guide_to_json(st.session_state.deck_data, df)
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -306,6 +318,19 @@ if st.session_state.get("matchups"):
             use_container_width=True,
             icon=":material/save:",
             type="primary",
+            on_click=sb_mod.record_export,
+            args=("json",),
+        )
+        st.download_button(
+            "Compact save (.sbg)",
+            data=sb_mod.guide_to_compact(st.session_state.deck_data, df),
+            file_name=f"sideboarder_{date.today()}.sbg",
+            mime="application/octet-stream",
+            use_container_width=True,
+            icon=":material/compress:",
+            type="tertiary",
+            on_click=sb_mod.record_export,
+            args=("sbg",),
         )
     with col2:
         st.download_button(
@@ -316,6 +341,8 @@ if st.session_state.get("matchups"):
             use_container_width=True,
             icon=":material/image:",
             type="secondary",
+            on_click=sb_mod.record_export,
+            args=("png",),
         )
     with col3:
         st.download_button(
@@ -326,4 +353,11 @@ if st.session_state.get("matchups"):
             use_container_width=True,
             icon=":material/insert_drive_file:",
             type="secondary",
+            on_click=sb_mod.record_export,
+            args=("pdf",),
         )
+    sb_mod.render_bundle_button(
+        st.session_state.deck_data, df, st.session_state.card_labels, (buf, buf_pdf)
+    )
+    sb_mod.render_share_link(st.session_state.deck_data, df)
+    sb_mod.render_guide_store_saver(st.session_state.deck_data, df)
@@ -0,0 +1,77 @@
+# print.py
+import io
+import streamlit as st
+import sideboarder_modular as sb_mod
+
+# Page setup
+st.set_page_config(
+    page_title="Print Guides - SideBoarder",
+    layout="centered",
+    page_icon="./images/icon.ico",
+)
+sb_mod.inject_css()
+sb_mod.start_metrics_exporters()
+sb_mod.render_sidebar()
+st.title("SideBoarder Print Sheets")
+st.markdown(
+    """
+    Upload the guides for your whole team, or for several decks, and get one PDF
+    with as many card-sized guides per page as fit, ready to cut out along the
+    marks.
+    """
+)
+st.header("Upload Guides")
+sb_mod.section_divider()
+
+uploads = st.file_uploader(
+    "Upload the Sideboarder guides to print",
+    type=["json", "sbg"],
+    accept_multiple_files=True,
+)
+guides = []
+for f in uploads or []:
+    try:
+        guide = sb_mod.load_guide(f)
+    except sb_mod.GuideValidationError as e:
+        st.error(f"❌ {f.name}: {e}")
+        continue
+    if not guide["matrix"]:  # e.g. a skeleton from the bulk import
+        st.warning(f"{f.name} has no matchups yet, so there is nothing to print.")
+        continue
+    guides.append(guide)
+
+if guides:
+    st.header("Print Settings")
+    sb_mod.section_divider()
+    col1, col2 = st.columns(2)
+    paper = col1.radio("Paper", list(sb_mod.PAPER_SIZES), horizontal=True)
+    cut_marks = col2.checkbox("Cut marks", value=True)
+    theme, dpi = sb_mod.render_export_settings()
+    layout = sb_mod.imposition_layout(paper)
+    per_page = layout["cols"] * layout["rows"]
+    # a crowded guide is split across panels, and each panel is its own card
+    cards = 0
+    for guide in guides:
+        df = sb_mod.build_matrix_df(guide["matrix"], guide["deck_data"])
+        labels = sb_mod.card_labels_for(guide["deck_data"])
+        cards += len(sb_mod.matrix_layout(df, labels)["panels"])
+    pages = -(-cards // per_page)
+    st.markdown(
+        f"{cards} card{'s' if cards != 1 else ''} from {len(guides)} "
+        f"guide{'s' if len(guides) != 1 else ''} at {per_page} per {paper} page: "
+        f"**{pages} page{'s' if pages != 1 else ''}**."
+    )
+
+    if st.button("Build PDF", key="print_build"):
+        buf_pdf = io.BytesIO()
+        with st.spinner("Laying out guides…"):
+            sb_mod.impose_guides(
+                sb_mod.guide_pngs(guides, theme, dpi), buf_pdf, paper, cut_marks
+            )
+        st.download_button(
+            label="Download print sheet (PDF)",
+            data=buf_pdf,
+            file_name="sideboard_guides_print.pdf",
+            mime="application/pdf",
+            key="print_download",
+        )
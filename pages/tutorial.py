@@ -81,7 +81,7 @@ with tab1:  # Guide creation
 with tab2:  # Export Formats
     st.header("Exporting your guide")
     st.markdown("""
-    SideBoarder (currently) allows for explicit export in 3 formats (`JSON`, `PNG`, & `PDF`). You can also export to `CSV` directly from the preview matrix if you would prefer to use your own formatting for a sideboard guide.
+    SideBoarder (currently) allows for explicit export in 3 formats (`JSON`, `PNG`, & `PDF`). You can also export to `CSV` directly from the preview matrix if you would prefer to use your own formatting for a sideboard guide, or grab everything at once with **Download everything (ZIP)**.
     """)
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -156,7 +156,7 @@ with tab3:  # Guide Editor
 with tab4:  # Play/Draw
     st.header("On the play vs. on the draw")
     st.markdown(
-        "For now, SideBoarder doesn't have explicit support for defining matchups on the play versus on the draw. This is a heavily requested feature, as your play patterns against certain decks may depend on who goes first. While we work on implementing this, the quick fix is to treat either scenario as a new matchup (e.g. Matchup 1: Boros Energy (OTP), Matchup 2: Boros Energy (OTD)). The export templates can handle many matchup rows without throwing out the automatic formatting, so it shouldn't affect the readability of the guide too drastically."
+        "Your plan against some decks depends on who goes first. When adding or editing a matchup, tick `Different plan on the draw` and adjust the quantities for the draw; the plan you entered above is used on the play. Only the cards that differ are saved, and in the exported image those cells are split diagonally: on the play in the top-left half, on the draw in the bottom-right half. Matchups without a draw plan look exactly as before."
     )
 
 with tab5:  # Sample Data
@@ -4,12 +4,33 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import requests
+import base64
+import bisect
+import binascii
+import functools
 import io
+import math
+import os
 import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zipfile
+import zlib
+from contextlib import contextmanager, nullcontext
 from hashlib import sha1
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
+import logging
 from datetime import date
 from PIL import Image
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ft2font import FT2Font, LoadFlags
+
+logger = logging.getLogger(__name__)
 
 
 def inject_css():  # Any custom CSS gets loaded in with this function. Should be moved to a style.css when I have the time
@@ -104,6 +125,208 @@ def initialize_session_state(
         st.session_state.setdefault(key, default)
 
 
+# ─── Operational metrics ─────────────────────────────────────────────────────
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in labels
+    )
+    return "{" + inner + "}"
+
+
+class MetricsRegistry:
+    """Process-wide counters and latency histograms in Prometheus text format.
+
+    Streamlit serves every session from a thread of the same process, so all
+    updates go through a single lock.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._help = {}
+        self._types = {}
+        self._counters = {}  # (name, labels) -> value
+        self._histograms = {}  # (name, labels) -> [bucket counts, sum, count]
+
+    def _declare(self, name: str, kind: str, help_text: str):
+        self._types.setdefault(name, kind)
+        if help_text:
+            self._help.setdefault(name, help_text)
+
+    def inc(self, name: str, amount: float = 1, help_text: str = "", **labels):
+        """Increment the counter `name` for the given label set."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._declare(name, "counter", help_text)
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, help_text: str = "", **labels):
+        """Record `value` (seconds) in the histogram `name`."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._declare(name, "histogram", help_text)
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist[0][i] += 1
+            hist[1] += value
+            hist[2] += 1
+
+    @contextmanager
+    def timer(self, name: str, help_text: str = "", **labels):
+        """Time the enclosed block into the histogram `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, help_text, **labels)
+
+    def get(self, name: str, **labels) -> float:
+        """Current value of a counter (0 if it was never incremented)."""
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def render_prometheus(self) -> str:
+        """Serialize every metric in the Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                k: (list(v[0]), v[1], v[2]) for k, v in self._histograms.items()
+            }
+            types = dict(self._types)
+            helps = dict(self._help)
+
+        lines = []
+        for name in sorted(types):
+            if name in helps:
+                lines.append(f"# HELP {name} {helps[name]}")
+            lines.append(f"# TYPE {name} {types[name]}")
+            if types[name] == "counter":
+                for (n, labels), value in sorted(counters.items()):
+                    if n == name:
+                        lines.append(f"{name}{_format_labels(labels)} {value:g}")
+                continue
+            for (n, labels), (counts, total, count) in sorted(histograms.items()):
+                if n != name:
+                    continue
+                for bound, bucket_count in zip(self.buckets, counts):
+                    le = labels + (("le", f"{bound:g}"),)
+                    lines.append(f"{name}_bucket{_format_labels(le)} {bucket_count}")
+                inf = labels + (("le", "+Inf"),)
+                lines.append(f"{name}_bucket{_format_labels(inf)} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total:g}")
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str):
+        """Atomically write the current metrics to `path` (textfile collector)."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+
+METRICS = MetricsRegistry()
+
+# st.cache_data only runs the wrapped body on a miss; the body flags this
+# thread so the call site can tell hits from misses.
+_cache_local = threading.local()
+
+
+def _record_cache_miss():
+    _cache_local.missed = True
+
+
+@contextmanager
+def track_cache(cache_name: str):
+    """Count a lookup against one of the st.cache_data functions as a hit or miss."""
+    _cache_local.missed = False
+    try:
+        yield
+    finally:
+        result = "miss" if getattr(_cache_local, "missed", False) else "hit"
+        METRICS.inc(
+            "sideboarder_cache_lookups_total",
+            help_text="Lookups against cached functions, by result.",
+            cache=cache_name,
+            result=result,
+        )
+
+
+def record_export(fmt: str):  # on_click callback for the download buttons
+    METRICS.inc(
+        "sideboarder_exports_total",
+        help_text="Guide downloads, by file format.",
+        format=fmt,
+    )
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = METRICS.render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # keep scrapes out of the app log
+        pass
+
+
+def _dump_metrics_forever(path: str, interval: float):
+    while True:
+        try:
+            METRICS.dump(path)
+        except OSError:
+            pass
+        time.sleep(interval)
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_exporters() -> dict:
+    """
+    Start the opt-in metrics exporters once per process:
+      SIDEBOARDER_METRICS_FILE      -> periodic Prometheus textfile dump
+      SIDEBOARDER_METRICS_INTERVAL  -> dump interval in seconds (default 15)
+      SIDEBOARDER_METRICS_PORT      -> serve /metrics on 127.0.0.1:<port>
+    """
+    started = {}
+    path = os.environ.get("SIDEBOARDER_METRICS_FILE")
+    if path:
+        interval = float(os.environ.get("SIDEBOARDER_METRICS_INTERVAL", 15))
+        threading.Thread(
+            target=_dump_metrics_forever,
+            args=(path, interval),
+            name="sideboarder-metrics-dump",
+            daemon=True,
+        ).start()
+        started["file"] = path
+    port = os.environ.get("SIDEBOARDER_METRICS_PORT")
+    if port:
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", int(port)), _MetricsHandler)
+        except OSError as e:  # e.g. a second instance already holds the port
+            logger.warning("Not serving /metrics on port %s: %s", port, e)
+            return started
+        threading.Thread(
+            target=server.serve_forever, name="sideboarder-metrics-http", daemon=True
+        ).start()
+        started["port"] = server.server_address[1]
+    return started
+
+
 @st.cache_data
 def import_deck_from_goldfish(url: str) -> dict[str, dict[str, int]]:
     """
@@ -113,6 +336,21 @@ def import_deck_from_goldfish(url: str) -> dict[str, dict[str, int]]:
       'sideboard': { card_name: count, … }
     }
     """
+    _record_cache_miss()
+    with METRICS.timer(
+        "sideboarder_import_seconds",
+        help_text="Time spent fetching and parsing MTGGoldfish decks.",
+    ):
+        deck = _fetch_goldfish_deck(url)
+    METRICS.inc(
+        "sideboarder_imports_total",
+        help_text="MTGGoldfish import attempts, by outcome.",
+        result="success" if deck else "failure",
+    )
+    return deck
+
+
+def _fetch_goldfish_deck(url: str) -> dict[str, dict[str, int]]:
     # 1. pull the numeric ID from the URL
     m = re.search(r"/deck/(\d+)", url)
     if not m:
@@ -177,6 +415,11 @@ def import_deck_from_goldfish(url: str) -> dict[str, dict[str, int]]:
 #     ]
 
 
+def card_labels_for(deck_data: dict) -> dict[str, str]:
+    """Display label of every card key in the deck: {'MB:Card': 'Card', ...}."""
+    return {key: key[3:] for zone in deck_data.values() for key in zone}
+
+
 def render_deck_input_section():  # Renders the section for entering decklist text
     """Step 1: Deck input UI and submission logic."""
     st.header(
@@ -193,16 +436,14 @@ def render_deck_input_section():  # Renders the section for entering decklist te
         key="gf_url",
     )
     if st.button("Import Goldfish deck"):
-        with st.spinner("Importing…"):
+        with st.spinner("Importing…"), track_cache("import_deck"):
             imported = import_deck_from_goldfish(gf_url)
         if imported:
             st.session_state.deck_data = {
                 "mainboard": imported["mainboard"],
                 "sideboard": imported["sideboard"],
             }
-            labels = {key: key[3:] for key in imported["mainboard"].keys()}
-            labels.update({key: key[3:] for key in imported["sideboard"].keys()})
-            st.session_state.card_labels = labels
+            st.session_state.card_labels = card_labels_for(st.session_state.deck_data)
             st.success("✅ Deck imported!")
             st.rerun()
 
@@ -222,14 +463,14 @@ def render_deck_input_section():  # Renders the section for entering decklist te
         placeholder="1 Boseiju, Who Endures\n2 Dismember\netc.",
     )
     if st.button("Submit Deck"):
-        main_raw = parse_decklist(mainboard_text)
-        side_raw = parse_decklist(sideboard_text)
+        with track_cache("parse_decklist"):
+            main_raw = parse_decklist(mainboard_text)
+        with track_cache("parse_decklist"):
+            side_raw = parse_decklist(sideboard_text)
         mainboard = {f"MB:{name}": qty for name, qty in main_raw.items()}
         sideboard = {f"SB:{name}": qty for name, qty in side_raw.items()}
-        labels = {**{k: k[3:] for k in mainboard}, **{k: k[3:] for k in sideboard}}
-
         st.session_state.deck_data = {"mainboard": mainboard, "sideboard": sideboard}
-        st.session_state.card_labels = labels
+        st.session_state.card_labels = card_labels_for(st.session_state.deck_data)
         st.success("✅ Deck saved!")
         st.rerun()
 
@@ -239,6 +480,10 @@ def parse_decklist(
     deck_text: str,
 ) -> dict[str, int]:  # Parses the decklist text into mainboard and sideboard quantities
     """Parse MTGO‐style decklist into {card_name: quantity}."""
+    _record_cache_miss()
+    METRICS.inc(
+        "sideboarder_parses_total", help_text="Decklists parsed (cache misses)."
+    )
     deck = {}
     for line in deck_text.strip().splitlines():
         try:
@@ -249,9 +494,13 @@ def parse_decklist(
     return deck
 
 
+def _slug(name: str) -> str:
+    return sha1(name.encode()).hexdigest()[:8]
+
+
 def _slug_key(prefix: str, name: str) -> str:
     """Generate a consistent, URL-safe key for a widget based on its name."""
-    return f"{prefix}_{sha1(name.encode()).hexdigest()[:8]}"
+    return f"{prefix}_{_slug(name)}"
 
 
 def _clear_temporary_state():
@@ -267,6 +516,80 @@ def _clear_temporary_state():
     st.rerun()
 
 
+CARD_FILTER_THRESHOLD = 40  # distinct cards before the filter row is shown
+CARD_SCOPES = ("All cards", "Not used yet", "Already used")
+
+
+class CardSearchIndex:
+    """
+    Labels and search structures for one decklist, built once per deck and
+    shared across reruns. Word-prefix hits come from a sorted list of every
+    word-start suffix; plain substring hits are a scan of the folded labels.
+    """
+
+    def __init__(self, deck_data: dict):
+        self.labels = card_labels_for(deck_data)
+        self.zones = {zone: list(cards) for zone, cards in deck_data.items()}
+        self._order = {k: i for i, k in enumerate(self.labels)}
+        self._folded = {k: label.casefold() for k, label in self.labels.items()}
+        suffixes = sorted(
+            (folded[m.start() :], k)
+            for k, folded in self._folded.items()
+            for m in re.finditer(r"\w+", folded)
+        )
+        self._suffixes = [s for s, _ in suffixes]
+        self._suffix_keys = [k for _, k in suffixes]
+
+    def word_prefix(self, query: str) -> set[str]:
+        """Cards with a word starting with `query` (which may span words)."""
+        hits = set()
+        i = bisect.bisect_left(self._suffixes, query)
+        while i < len(self._suffixes) and self._suffixes[i].startswith(query):
+            hits.add(self._suffix_keys[i])
+            i += 1
+        return hits
+
+    def search(
+        self,
+        query: str = "",
+        zone: str | None = None,
+        exclude: set | frozenset = frozenset(),
+        only: set | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """
+        Card keys matching `query`: name prefixes first, then word prefixes,
+        then any substring, each in deck order.
+        """
+        keys = self.zones[zone] if zone else list(self.labels)
+        keys = [k for k in keys if k not in exclude and (only is None or k in only)]
+        q = query.casefold().strip()
+        if q:
+            words = self.word_prefix(q)
+            ranked = []
+            for k in keys:
+                folded = self._folded[k]
+                if folded.startswith(q):
+                    ranked.append((0, self._order[k], k))
+                elif k in words:
+                    ranked.append((1, self._order[k], k))
+                elif q in folded:
+                    ranked.append((2, self._order[k], k))
+            keys = [k for *_, k in sorted(ranked)]
+        return keys[:limit] if limit else keys
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def get_card_index(deck_key: str, _deck_data: dict) -> CardSearchIndex:
+    """Cached per deck hash; pass deck_hash(deck_data) as `deck_key`."""
+    return CardSearchIndex(_deck_data)
+
+
+def used_cards(matchups: list[dict]) -> set[str]:
+    """Cards moved in at least one matchup."""
+    return {c for m in matchups for c in plan_cells(m).keys() | draw_plan(m).keys()}
+
+
 def render_matchup_entry():
     """Renders the section for entering matchup data, with robust quantity handling and clear/cancel support."""
     MAX_OPPONENT_NAME_LENGTH = 25
@@ -289,12 +612,61 @@ def render_matchup_entry():
         key="tmp_opponent_name",
     )
 
+    # Type-ahead: known spellings, and the plan last used for this opponent
+    if name.strip():
+        index = get_archetype_index()
+        suggestions = [
+            s for s in index.suggest(name, limit=4) if s.strip() != name.strip()
+        ]
+        if suggestions:
+            cols = st.columns(len(suggestions))
+            for i, (col, suggestion) in enumerate(zip(cols, suggestions)):
+                col.button(
+                    suggestion,
+                    key=f"tmp_suggest_{i}",
+                    on_click=_use_archetype_name,
+                    args=(suggestion,),
+                )
+        plan = index.closest_plan(st.session_state.deck_data, name)
+        if plan is not None:
+            st.button(
+                f"Prefill plan from '{plan['Matchup']}'",
+                key="tmp_prefill_plan",
+                on_click=_prefill_plan,
+                args=(plan,),
+            )
+
+    # Card selectors are fed from the cached per-deck index; big lists get a
+    # filter row so the option lists stay short
+    index = get_card_index(
+        deck_hash(st.session_state.deck_data), st.session_state.deck_data
+    )
+    query, scope = "", CARD_SCOPES[0]
+    if len(index.labels) > CARD_FILTER_THRESHOLD:
+        col1, col2 = st.columns([2, 1])
+        query = col1.text_input(
+            "Filter cards", placeholder="e.g. bolt", key="tmp_card_filter"
+        )
+        scope = col2.selectbox("Show", CARD_SCOPES, key="tmp_card_scope")
+    used = used_cards(st.session_state.matchups)
+    scope_filter = {
+        "All cards": {},
+        "Not used yet": {"exclude": used},
+        "Already used": {"only": used},
+    }[scope]
+
+    def card_options(zone: str, selected_key: str) -> list[str]:
+        selected = st.session_state[selected_key]
+        chosen = set(selected)
+        hits = index.search(query, zone, **scope_filter)
+        return selected + [k for k in hits if k not in chosen]
+
     # OUT cards
     st.html('<h2>Card(s) to take <span style="color:#f7b2ad;">OUT</span>:</h2>')
     search_out = st.multiselect(
         "Search:",
-        options=list(st.session_state.deck_data["mainboard"].keys()),
-        format_func=lambda k: st.session_state.card_labels.get(k, k),
+        options=card_options("mainboard", "tmp_search_out"),
+        format_func=index.labels.__getitem__,
         key="tmp_search_out",
     )
     # Render quantity inputs directly, keyed by slug
@@ -311,10 +683,19 @@ def render_matchup_entry():
     st.html('<h2>Card(s) to bring <span style="color:#9abca7;">IN</span>:</h2>')
     search_in = st.multiselect(
         "Search:",
-        options=list(st.session_state.deck_data["sideboard"].keys()),
-        format_func=lambda k: st.session_state.card_labels.get(k, k),
+        options=card_options("sideboard", "tmp_search_in"),
+        format_func=index.labels.__getitem__,
         key="tmp_search_in",
     )
+    # quantities of cards that were deselected (or prefilled, then dropped)
+    shown = [*search_out, *search_in, *st.session_state.get("tmp_draw_extra", [])]
+    collect_widget_state(
+        {
+            "tmp_qty_out_": {_slug(c) for c in search_out},
+            "tmp_qty_in_": {_slug(c) for c in search_in},
+            "tmp_draw_qty_": {_slug(c) for c in shown},
+        }
+    )
     for card in search_in:
         key_in = _slug_key("tmp_qty_in", card)
         st.number_input(
@@ -332,6 +713,26 @@ def render_matchup_entry():
         st.session_state.get(_slug_key("tmp_qty_in", c), 0) for c in search_in
     )
 
+    # Optional on-the-draw variant, stored as a delta from the plan above
+    play = {
+        c: f"-{st.session_state.get(_slug_key('tmp_qty_out', c), 0)}"
+        for c in search_out
+    } | {
+        c: f"+{st.session_state.get(_slug_key('tmp_qty_in', c), 0)}" for c in search_in
+    }
+    delta = {}
+    if st.checkbox("Different plan on the draw", key="tmp_split_draw"):
+        draw = render_draw_plan_inputs(
+            "tmp_draw",
+            st.session_state.deck_data,
+            st.session_state.card_labels,
+            play,
+            play,
+        )
+        delta = draw_delta(play, draw)
+        if not delta:
+            st.info("The draw plan is the same as the play plan.")
+
     # Validation flags
     valid_name = bool(name.strip()) and len(name) <= MAX_OPPONENT_NAME_LENGTH
     valid_cards = total_out > 0 or total_in > 0
@@ -372,8 +773,16 @@ def render_matchup_entry():
                     qty = st.session_state.get(_slug_key("tmp_qty_in", c), 0)
                     row[c] = f"+{qty}"
                 row["Matchup"] = name
-
-                st.session_state.matchups.append(row)
+                if delta:
+                    row[DRAW_KEY] = delta
+
+                history = st.session_state.setdefault("history", MatchupHistory())
+                history.add(st.session_state.matchups, row)
+                get_archetype_index().remember(st.session_state.deck_data, [row])
+                METRICS.inc(
+                    "sideboarder_matchups_added_total",
+                    help_text="Matchups confirmed on the create page.",
+                )
                 st.success(f"Matchup '{name}' added!")
 
                 # Clear all temporary state
@@ -389,6 +798,2318 @@ def render_matchup_entry():
         # ───────────────────────────────────────────────────────────────────────
 
 
+# ─── On the play / on the draw ───────────────────────────────────────────────
+# A row's card cells are the plan on the play. An optional DRAW_KEY entry holds
+# only the cells that differ on the draw: {card: '-n'/'+n'}, or '0' where a
+# card moved on the play stays put on the draw.
+DRAW_KEY = "Draw"
+
+
+def plan_cells(row: dict) -> dict[str, str]:
+    """The on-the-play cells of a matchup row (no name, no draw delta, no blanks)."""
+    return {
+        c: v
+        for c, v in row.items()
+        if c not in ("Matchup", DRAW_KEY) and isinstance(v, str) and v
+    }
+
+
+def draw_plan(row: dict) -> dict[str, str]:
+    """The on-the-draw cells: the play plan with the row's delta applied."""
+    cells = plan_cells(row)
+    delta = row.get(DRAW_KEY)
+    if isinstance(delta, dict):
+        for card, cell in delta.items():
+            if cell.lstrip("+-") == "0":
+                cells.pop(card, None)
+            else:
+                cells[card] = cell
+    return cells
+
+
+def draw_delta(play: dict[str, str], draw: dict[str, str]) -> dict[str, str]:
+    """Sparse delta turning `play` into `draw`; empty if the plans match."""
+    return {
+        card: draw.get(card, "0")
+        for card in sorted(play.keys() | draw.keys())
+        if draw.get(card) != play.get(card)
+    }
+
+
+def render_draw_plan_inputs(
+    key_prefix: str, deck_data: dict, card_labels: dict, play: dict, draw: dict
+) -> dict[str, str]:
+    """
+    Quantity inputs for the on-the-draw plan, one per card in either plan plus
+    any picked from the rest of the deck. `draw` supplies the starting values.
+    Returns the draw plan's cells.
+    """
+    mb, sb = deck_data["mainboard"], deck_data["sideboard"]
+    shown = list(dict.fromkeys([*play, *draw]))
+    extra = st.multiselect(
+        "Also move on the draw:",
+        options=[c for zone in (mb, sb) for c in zone if c not in shown],
+        format_func=lambda k: card_labels.get(k, k),
+        key=f"{key_prefix}_extra",
+    )
+    cells = {}
+    left, right = st.columns(2)
+    for card in shown + extra:
+        in_mb = card in mb
+        qty = (left if in_mb else right).number_input(
+            f"{'Out' if in_mb else 'In'}: {card_labels.get(card, card)}",
+            min_value=0,
+            max_value=mb[card] if in_mb else sb[card],
+            value=int(draw.get(card, "0").lstrip("+-")),
+            key=_slug_key(f"{key_prefix}_qty", card),
+        )
+        if qty:
+            cells[card] = f"{'-' if in_mb else '+'}{qty}"
+    return cells
+
+
+def build_matrix_df(matchups: list[dict], deck_data: dict) -> pd.DataFrame:
+    """
+    Matchup rows -> DataFrame indexed by Matchup, MB then SB columns, unused
+    columns dropped. Draw deltas, if any, ride along in a trailing DRAW_KEY column.
+    """
+    df = pd.DataFrame(matchups).set_index("Matchup")
+    deltas = df[DRAW_KEY] if DRAW_KEY in df.columns else None
+    draw_only = set()
+    if deltas is not None:
+        draw_only = {c for d in deltas if isinstance(d, dict) for c in d}
+    mb = sorted(deck_data.get("mainboard", {}).keys())
+    sb = sorted(deck_data.get("sideboard", {}).keys())
+    cols = [c for c in mb + sb if c in df.columns or c in draw_only]
+    df = df.reindex(columns=cols)
+    df = df.loc[:, (df != "").any(axis=0)]
+    if deltas is not None:
+        has_delta = deltas.map(lambda d: isinstance(d, dict) and bool(d))
+        if has_delta.any():
+            df[DRAW_KEY] = deltas.where(has_delta)
+    return df
+
+
+def matrix_df_to_matchups(df: pd.DataFrame) -> list[dict]:
+    """build_matrix_df's inverse, as saved: rows without a draw plan get no DRAW_KEY."""
+    rows = df.reset_index().to_dict(orient="records")
+    for row in rows:
+        if not isinstance(row.get(DRAW_KEY, {}), dict):
+            del row[DRAW_KEY]
+    return rows
+
+
+def matrix_preview_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Flatten draw deltas into 'play / draw' cells for st.dataframe."""
+    if DRAW_KEY not in df.columns:
+        return df
+    preview = df.drop(columns=DRAW_KEY).fillna("")
+    col = {card: j for j, card in enumerate(preview.columns)}
+    for i, delta in enumerate(df[DRAW_KEY]):
+        if isinstance(delta, dict):
+            for card, cell in delta.items():
+                play = preview.iat[i, col[card]] or "0"
+                preview.iat[i, col[card]] = f"{play} / {cell}"
+    return preview
+
+
+# ─── Export themes ───────────────────────────────────────────────────────────
+# The guide is drawn once in these key colours. Every pixel is then a blend of
+# the four, so a theme is a linear map of the palette (see apply_theme).
+KEY_COLORS = {
+    "ink": "#000000",
+    "background": "#ffffff",
+    "in": "#00ff00",
+    "out": "#ff0000",
+}
+EXPORT_THEMES = {
+    "Colour": {
+        "ink": "#000000",
+        "background": "#ffffff",
+        "in": "#9abca7",
+        "out": "#f7b2ad",
+    },
+    "Printer-friendly": {
+        "ink": "#000000",
+        "background": "#ffffff",
+        "in": "#e3e3e3",
+        "out": "#b3b3b3",
+    },
+    "Dark": {
+        "ink": "#f2f2f2",
+        "background": "#1e1e1e",
+        "in": "#3d6b4f",
+        "out": "#8a3b36",
+    },
+}
+
+
+def _rgb(hex_color: str) -> np.ndarray:
+    return np.array([int(hex_color[i : i + 2], 16) for i in (1, 3, 5)], dtype=float)
+
+
+# PNG export: a guide is a few flat colours plus anti-aliased text, so a small
+# palette gives a much smaller file than RGBA savefig. zlib level 9 saves only
+# 3-12% more than 6 for 3-8x the encode time (benchmarks/png_export.py).
+PNG_COLORS = 64
+PNG_COMPRESS_LEVEL = 6
+EXPORT_DPI = {
+    "Screen (150 dpi)": 150,
+    "Print (300 dpi)": 300,
+    "High-res print (600 dpi)": 600,
+}
+
+
+def figure_to_indexed(
+    fig: plt.Figure, dpi: int = 300, colors: int = PNG_COLORS
+) -> Image.Image:
+    """Rasterise a key-colour figure once, as an opaque palette image."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="rgba", dpi=dpi)  # raw pixels, no PNG round trip
+    size = tuple(int(round(x * dpi)) for x in fig.get_size_inches())
+    rgb = Image.frombuffer("RGBA", size, buf.getvalue()).convert("RGB")
+    return _quantize_keyed(rgb, dpi, colors)
+
+
+def _quantize_keyed(rgb: Image.Image, dpi: int, colors: int) -> Image.Image:
+    indexed = rgb.quantize(colors, method=Image.Quantize.FASTOCTREE)
+    # the octree rounds 255 down to 254; key colours only use 0 and 255
+    palette = np.array(indexed.getpalette(), dtype=np.uint8)
+    palette[palette >= 252] = 255
+    palette[palette <= 3] = 0
+    indexed.putpalette(palette.tobytes())
+    indexed.info["dpi"] = (dpi, dpi)
+    return indexed
+
+
+def stack_panels(masters: list[Image.Image], gap: int = 0) -> Image.Image:
+    """One palette image with the panels of a split guide stacked top to bottom."""
+    if len(masters) == 1:
+        return masters[0]
+    width = max(m.width for m in masters)
+    height = sum(m.height for m in masters) + gap * (len(masters) - 1)
+    rgb = Image.new("RGB", (width, height), KEY_COLORS["background"])
+    y = 0
+    for master in masters:
+        rgb.paste(master.convert("RGB"), (0, y))
+        y += master.height + gap
+    dpi = masters[0].info.get("dpi", (300, 300))[0]
+    return _quantize_keyed(rgb, dpi, PNG_COLORS)
+
+
+def apply_theme(indexed: Image.Image, theme: dict[str, str]) -> Image.Image:
+    """
+    Recolour a key-colour palette image. With white/black/green/red keys the
+    blend weights of a palette entry (r, g, b) are background = b, out = r - b,
+    in = g - b and ink = 1 - r - g + b; the same weights are applied to the
+    theme's colours. Only the palette (at most 256 entries) is touched.
+    """
+    palette = np.array(indexed.getpalette(), dtype=float).reshape(-1, 3) / 255
+    r, g, b = palette.T
+    weights = np.stack([1 - r - g + b, b, g - b, r - b], axis=1).clip(0, 1)
+    colors = np.stack([_rgb(theme[k]) for k in ("ink", "background", "in", "out")])
+    themed = indexed.copy()
+    themed.putpalette(
+        (weights @ colors).round().clip(0, 255).astype(np.uint8).tobytes()
+    )
+    return themed
+
+
+def themed_png(
+    indexed: Image.Image,
+    theme: dict[str, str],
+    compress_level: int = PNG_COMPRESS_LEVEL,
+) -> io.BytesIO:
+    """Indexed PNG bytes of `indexed` in `theme`, keeping its DPI."""
+    buf = io.BytesIO()
+    apply_theme(indexed, theme).save(
+        buf,
+        format="PNG",
+        dpi=indexed.info.get("dpi"),
+        compress_level=compress_level,
+    )
+    buf.seek(0)
+    return buf
+
+
+def figure_to_png(fig: plt.Figure, dpi: int = 300) -> io.BytesIO:
+    """Save a rendered guide figure to an in-memory PNG."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi)
+    buf.seek(0)
+    return buf
+
+
+# ─── Print PDFs ──────────────────────────────────────────────────────────────
+PAPER_SIZES = {"A4": (8.27, 11.69), "Letter": (8.5, 11.0)}  # inches
+CARD_SIZE = (3.5, 2.5)  # inches, as drawn by _draw_matrix_figure
+PRINT_MARGIN = 0.3  # inches; cut marks live in this margin
+
+
+def _png_chunks(data: bytes):
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("Not a PNG image.")
+    pos = 8
+    while pos + 8 <= len(data):
+        size = int.from_bytes(data[pos : pos + 4], "big")
+        yield data[pos + 4 : pos + 8], data[pos + 8 : pos + 8 + size]
+        pos += size + 12
+
+
+class StreamingPDFWriter:
+    """
+    Minimal PDF writer that emits each image and page as soon as it is added,
+    so memory stays flat however many pages are written. Only object offsets
+    and page ids are kept until close(). PNGs are embedded without decoding:
+    their zlib stream is passed through with the PNG predictor.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self.offsets = [0, 0, 0]  # object 1 = catalog, 2 = page tree (at close)
+        self.pages = []
+        self._pos = 0
+        self._emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _emit(self, data: bytes):
+        self.out.write(data)
+        self._pos += len(data)
+
+    def _object(self, body: bytes, stream: bytes | None = None, num=None) -> int:
+        if num is None:
+            num = len(self.offsets)
+            self.offsets.append(0)
+        self.offsets[num] = self._pos
+        self._emit(b"%d 0 obj\n" % num + body)
+        if stream is not None:
+            self._emit(b"\nstream\n" + stream + b"\nendstream")
+        self._emit(b"\nendobj\n")
+        return num
+
+    def add_png(self, png: bytes) -> int:
+        """Embed a PNG as an image XObject; returns its object number."""
+        idat, palette = [], None
+        for kind, chunk in _png_chunks(png):
+            if kind == b"IHDR":
+                width, height = int.from_bytes(chunk[:4], "big"), int.from_bytes(
+                    chunk[4:8], "big"
+                )
+                bits, color_type, interlace = chunk[8], chunk[9], chunk[12]
+            elif kind == b"PLTE":
+                palette = chunk
+            elif kind == b"IDAT":
+                idat.append(chunk)
+        if color_type not in (0, 2, 3) or interlace:
+            # alpha or interlacing: let Pillow re-encode as a plain RGB PNG
+            buf = io.BytesIO()
+            Image.open(io.BytesIO(png)).convert("RGB").save(buf, format="PNG")
+            return self.add_png(buf.getvalue())
+        colors = 3 if color_type == 2 else 1
+        if color_type == 3:
+            space = b"[/Indexed /DeviceRGB %d <%s>]" % (
+                len(palette) // 3 - 1,
+                palette.hex().encode(),
+            )
+        else:
+            space = b"/DeviceRGB" if color_type == 2 else b"/DeviceGray"
+        data = b"".join(idat)
+        return self._object(
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+            b"/ColorSpace %s /BitsPerComponent %d /Filter /FlateDecode "
+            b"/DecodeParms << /Predictor 15 /Colors %d /BitsPerComponent %d "
+            b"/Columns %d >> /Length %d >>"
+            % (width, height, space, bits, colors, bits, width, len(data)),
+            data,
+        )
+
+    def add_page(self, size: tuple[float, float], content: bytes, images: list[int]):
+        """One page of `size` points drawing `content`; images are /Im<n>."""
+        resources = b" ".join(b"/Im%d %d 0 R" % (n, n) for n in images)
+        stream = zlib.compress(content)
+        contents = self._object(
+            b"<< /Length %d /Filter /FlateDecode >>" % len(stream), stream
+        )
+        self.pages.append(
+            self._object(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+                b"/Resources << /XObject << %s >> >> /Contents %d 0 R >>"
+                % (size[0], size[1], resources, contents)
+            )
+        )
+
+    def close(self):
+        self._object(b"<< /Type /Catalog /Pages 2 0 R >>", num=1)
+        kids = b" ".join(b"%d 0 R" % n for n in self.pages)
+        self._object(
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.pages)), num=2
+        )
+        xref = self._pos
+        self._emit(b"xref\n0 %d\n0000000000 65535 f \n" % len(self.offsets))
+        for offset in self.offsets[1:]:
+            self._emit(b"%010d 00000 n \n" % offset)
+        self._emit(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(self.offsets), xref)
+        )
+
+
+def imposition_layout(paper: str = "A4", card=CARD_SIZE, margin=PRINT_MARGIN) -> dict:
+    """
+    Grid of abutting cards (so neighbours share a cut) centred on the page,
+    rotated a quarter turn if that fits more: {cols, rows, rotate, x0, y0, w, h}
+    in points, with (x0, y0) the bottom-left corner of the grid.
+    """
+    page_w, page_h = PAPER_SIZES[paper]
+    best = None
+    for rotate in (False, True):
+        w, h = (card[1], card[0]) if rotate else card
+        cols = int((page_w - 2 * margin) // w)
+        rows = int((page_h - 2 * margin) // h)
+        if best is None or cols * rows > best["cols"] * best["rows"]:
+            best = {"cols": cols, "rows": rows, "rotate": rotate, "w": w, "h": h}
+    best["x0"] = (page_w - best["cols"] * best["w"]) / 2 * 72
+    best["y0"] = (page_h - best["rows"] * best["h"]) / 2 * 72
+    best["w"] *= 72
+    best["h"] *= 72
+    return best
+
+
+def _cut_marks(layout: dict, cols: int, rows: int, length=12.0, gap=3.0) -> bytes:
+    """Short lines in the margin continuing each shared cut of a cols × rows block."""
+    x0, w, h = layout["x0"], layout["w"], layout["h"]
+    top = layout["y0"] + layout["rows"] * h
+    bottom = top - rows * h
+    right = x0 + cols * w
+    lines = []
+    for c in range(cols + 1):
+        x = x0 + c * w
+        lines.append((x, bottom - gap, x, bottom - gap - length))
+        lines.append((x, top + gap, x, top + gap + length))
+    for r in range(rows + 1):
+        y = top - r * h
+        lines.append((x0 - gap, y, x0 - gap - length, y))
+        lines.append((right + gap, y, right + gap + length, y))
+    return b"0.3 w 0 G\n" + b"".join(
+        b"%.2f %.2f m %.2f %.2f l S\n" % line for line in lines
+    )
+
+
+def impose_guides(pngs, out, paper: str = "A4", cut_marks: bool = True) -> int:
+    """
+    Pack card-sized guide PNGs (any iterable of bytes, consumed lazily) onto
+    as few `paper` pages as possible and stream them into `out` as one PDF.
+    Returns the number of pages written.
+    """
+    layout = imposition_layout(paper)
+    per_page = layout["cols"] * layout["rows"]
+    page_size = tuple(x * 72 for x in PAPER_SIZES[paper])
+    writer = StreamingPDFWriter(out)
+    slots, content = [], bytearray()
+
+    def flush():
+        cols = min(len(slots), layout["cols"])
+        rows = -(-len(slots) // layout["cols"])
+        marks = _cut_marks(layout, cols, rows) if cut_marks else b""
+        writer.add_page(page_size, bytes(content) + marks, slots)
+        slots.clear()
+        content.clear()
+
+    for png in pngs:
+        i = len(slots)
+        col, row = i % layout["cols"], i // layout["cols"]
+        x = layout["x0"] + col * layout["w"]
+        y = layout["y0"] + (layout["rows"] - 1 - row) * layout["h"]  # top row first
+        image = writer.add_png(png)
+        if layout["rotate"]:  # image width runs up the page
+            matrix = (0, layout["h"], -layout["w"], 0, x + layout["w"], y)
+        else:
+            matrix = (layout["w"], 0, 0, layout["h"], x, y)
+        content += b"q %.2f %.2f %.2f %.2f %.2f %.2f cm /Im%d Do Q\n" % (
+            *matrix,
+            image,
+        )
+        slots.append(image)
+        if len(slots) == per_page:
+            flush()
+    if slots or not writer.pages:
+        flush()
+    writer.close()
+    return len(writer.pages)
+
+
+def render_panels(df: pd.DataFrame, card_labels: dict[str, str], dpi: int = 300):
+    """Indexed master of every card panel of a guide, in order."""
+    panels = len(matrix_layout(df, card_labels)["panels"])
+    return [composite_panel(df, card_labels, panel, dpi) for panel in range(panels)]
+
+
+def write_guide_images(
+    df: pd.DataFrame,
+    card_labels: dict[str, str],
+    theme: str,
+    dpi: int,
+    open_png,
+    open_pdf,
+):
+    """
+    Write one guide's PNG, then its print PDF, each into the file object that
+    open_png() / open_pdf() returns as a context manager (a ZIP entry, or a
+    buffer in nullcontext). A guide split across several panels gets the
+    panels stacked in the PNG and one card per panel in the PDF.
+    """
+    masters = render_panels(df, card_labels, dpi)
+    palette = EXPORT_THEMES[theme]
+    png = themed_png(stack_panels(masters, gap=dpi // 10), palette).getvalue()
+    with open_png() as out:
+        out.write(png)
+    with open_pdf() as out:
+        if len(masters) == 1:
+            write_print_pdf(png, out, dpi)
+        else:
+            del png
+            impose_guides((themed_png(m, palette).getvalue() for m in masters), out)
+
+
+def render_guide_images(
+    df: pd.DataFrame, card_labels: dict[str, str], theme: str, dpi: int = 300
+) -> tuple[io.BytesIO, io.BytesIO]:
+    """(PNG, print PDF) buffers for one guide; see write_guide_images."""
+    buf, buf_pdf = io.BytesIO(), io.BytesIO()
+    write_guide_images(
+        df,
+        card_labels,
+        theme,
+        dpi,
+        lambda: nullcontext(buf),
+        lambda: nullcontext(buf_pdf),
+    )
+    buf.seek(0)
+    buf_pdf.seek(0)
+    return buf, buf_pdf
+
+
+def guide_pngs(guides, theme: str = "Colour", dpi: int = 300):
+    """Yield one themed card PNG per panel of each loaded guide, lazily, for impose_guides."""
+    for guide in guides:
+        if not guide["matrix"]:  # a skeleton: nothing to draw yet
+            continue
+        deck_data = guide["deck_data"]
+        df = build_matrix_df(guide["matrix"], deck_data)[::-1]
+        for indexed in render_panels(df, card_labels_for(deck_data), dpi):
+            yield themed_png(indexed, EXPORT_THEMES[theme]).getvalue()
+
+
+def write_print_pdf(png: bytes, out, dpi: int = 300):
+    """Stream a PDF with the card-sized PNG centred on an A4 page into `out`."""
+    with Image.open(io.BytesIO(png)) as card:
+        w, h = card.width / dpi * 72, card.height / dpi * 72
+    page_w, page_h = (x * 72 for x in PAPER_SIZES["A4"])
+    writer = StreamingPDFWriter(out)
+    image = writer.add_png(png)
+    x, y = (page_w - w) / 2, (page_h - h) / 2
+    writer.add_page(
+        (page_w, page_h),
+        b"q %.2f 0 0 %.2f %.2f %.2f cm /Im%d Do Q\n" % (w, h, x, y, image),
+        [image],
+    )
+    writer.close()
+
+
+def compose_print_pdf(png_buf: io.BytesIO, dpi: int = 300) -> io.BytesIO:
+    """Centre the card-sized PNG on an A4 page and save it as a PDF."""
+    png = png_buf.getvalue()
+    png_buf.seek(0)
+    buf_pdf = io.BytesIO()
+    write_print_pdf(png, buf_pdf, dpi)
+    buf_pdf.seek(0)
+    return buf_pdf
+
+
+def guide_to_json(deck_data: dict, df: pd.DataFrame) -> str:
+    """Serialize the deck and matrix into the JSON save format read by the editor."""
+    payload = {
+        "deck_data": deck_data,
+        "matrix": matrix_df_to_matchups(df),
+    }
+    return json.dumps(payload, indent=2)
+
+
+def write_guide_bundle(
+    out,
+    deck_data: dict,
+    df: pd.DataFrame,
+    card_labels: dict[str, str],
+    theme: str = "Colour",
+    dpi: int = 300,
+    stem: str = "sideboarder",
+    images: tuple[io.BytesIO, io.BytesIO] | None = None,
+):
+    """
+    Stream a ZIP of the guide as JSON, PNG, print PDF and CSV into `out`
+    (any writable file object; it need not be seekable). Each file is made
+    and written before the next, from a single render of the panels. Pass
+    `images`, the (PNG, PDF) pair from render_guide_images, to reuse theirs.
+    """
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr(f"{stem}.json", guide_to_json(deck_data, df))
+        bundle.writestr(f"{stem}.csv", matrix_preview_df(df).to_csv())
+        # PNG and PDF are compressed already
+        if images is not None:
+            for ext, buf in zip(("png", "pdf"), images):
+                bundle.writestr(f"{stem}.{ext}", buf.getvalue(), zipfile.ZIP_STORED)
+            return
+
+        def entry(ext):  # ZipInfo entries default to ZIP_STORED
+            info = zipfile.ZipInfo(f"{stem}.{ext}", time.localtime()[:6])
+            return lambda: bundle.open(info, "w")
+
+        write_guide_images(df, card_labels, theme, dpi, entry("png"), entry("pdf"))
+
+
+# ─── Guide upload validation ─────────────────────────────────────────────────
+GUIDE_LIMITS = {
+    "max_bytes": 1024 * 1024,  # same as server.maxUploadSize in config.toml
+    "max_cards": 1000,  # unique cards across mainboard + sideboard
+    "max_matchups": 200,
+    "max_card_name_length": 160,
+    "max_archetype_length": 100,
+    "max_quantity": 250,
+}
+_CELL_RE = re.compile(r"^([+-])(\d{1,4})$")
+_ZONE_PREFIX = {"mainboard": "MB:", "sideboard": "SB:"}
+
+
+class GuideValidationError(ValueError):
+    """Raised when an uploaded guide does not match the Sideboarder save format."""
+
+
+def _read_bounded(fileobj, max_bytes: int, chunk_size: int = 64 * 1024) -> bytes:
+    """Read `fileobj` in chunks, giving up as soon as it exceeds `max_bytes`."""
+    chunks, total = [], 0
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            raise GuideValidationError(
+                f"File is larger than {max_bytes // 1024} KiB and cannot be a Sideboarder guide."
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _bounded_object_hook(limits: dict):
+    """object_pairs_hook that rejects oversized objects/strings while decoding."""
+    max_keys = limits["max_cards"] + 2  # a matchup row: cards, name, draw delta
+    max_len = max(limits["max_card_name_length"], limits["max_archetype_length"]) + 3
+
+    def hook(pairs):
+        if len(pairs) > max_keys:
+            raise GuideValidationError(
+                f"An object has {len(pairs)} entries (limit {max_keys})."
+            )
+        for key, value in pairs:
+            if len(key) > max_len or (isinstance(value, str) and len(value) > max_len):
+                raise GuideValidationError(
+                    f"String longer than {max_len} characters near '{key[:40]}'."
+                )
+        return dict(pairs)
+
+    return hook
+
+
+def _validate_deck_data(deck_data, limits: dict) -> dict:
+    if not isinstance(deck_data, dict):
+        raise GuideValidationError("'deck_data' must be an object.")
+    clean, total = {}, 0
+    for zone, prefix in _ZONE_PREFIX.items():
+        cards = deck_data.get(zone)
+        if not isinstance(cards, dict):
+            raise GuideValidationError(f"'deck_data.{zone}' must be an object.")
+        for key, qty in cards.items():
+            if not key.startswith(prefix) or not key[3:].strip():
+                raise GuideValidationError(
+                    f"deck_data.{zone}: card key '{key}' must start with '{prefix}'."
+                )
+            if len(key) - 3 > limits["max_card_name_length"]:
+                raise GuideValidationError(
+                    f"deck_data.{zone}: card name '{key[3:40]}…' is too long."
+                )
+            if (
+                isinstance(qty, bool)
+                or not isinstance(qty, int)
+                or not 1 <= qty <= limits["max_quantity"]
+            ):
+                raise GuideValidationError(
+                    f"deck_data.{zone}['{key}']: quantity must be an integer "
+                    f"between 1 and {limits['max_quantity']}, got {qty!r}."
+                )
+        total += len(cards)
+        clean[zone] = dict(cards)
+    if total > limits["max_cards"]:
+        raise GuideValidationError(
+            f"Deck has {total} unique cards (limit {limits['max_cards']})."
+        )
+    return clean
+
+
+def _validate_matrix(matrix, deck_data: dict, limits: dict) -> list[dict]:
+    if not isinstance(matrix, list):
+        raise GuideValidationError("'matrix' must be a list of matchups.")
+    if len(matrix) > limits["max_matchups"]:
+        raise GuideValidationError(
+            f"Guide has {len(matrix)} matchups (limit {limits['max_matchups']})."
+        )
+    mb, sb = deck_data["mainboard"], deck_data["sideboard"]
+    rows = []
+    for i, row in enumerate(matrix):
+        if not isinstance(row, dict):
+            raise GuideValidationError(f"matrix[{i}] must be an object.")
+        name = row.get("Matchup")
+        if not isinstance(name, str) or not name.strip():
+            raise GuideValidationError(f"matrix[{i}] is missing a 'Matchup' name.")
+        if len(name) > limits["max_archetype_length"]:
+            raise GuideValidationError(
+                f"matrix[{i}]: archetype name exceeds {limits['max_archetype_length']} characters."
+            )
+        clean = {}
+        for card, cell in row.items():
+            if card in ("Matchup", DRAW_KEY) or cell is None or cell == "":
+                continue  # NaN is decoded to None
+            where = f"matrix[{i}] ({name})['{card}']"
+            if _validate_cell(where, card, cell, mb, sb):
+                clean[card] = cell
+        clean["Matchup"] = name
+        delta = row.get(DRAW_KEY)
+        if delta is not None:
+            if not isinstance(delta, dict):
+                raise GuideValidationError(
+                    f"matrix[{i}] ({name})['{DRAW_KEY}'] must be an object."
+                )
+            draw = {}
+            for card, cell in delta.items():
+                where = f"matrix[{i}] ({name})['{DRAW_KEY}']['{card}']"
+                valid = cell != "0" and _validate_cell(where, card, cell, mb, sb)
+                draw[card] = cell if valid else "0"
+            delta = draw_delta(plan_cells(clean), draw_plan({**clean, DRAW_KEY: draw}))
+            if delta:
+                clean[DRAW_KEY] = delta
+        rows.append(clean)
+    return rows
+
+
+def _validate_cell(where: str, card: str, cell, mb: dict, sb: dict) -> bool:
+    """Check one '-n'/'+n' cell; False for a zero count, which callers drop."""
+    if card not in mb and card not in sb:
+        raise GuideValidationError(f"{where}: card is not in deck_data.")
+    m = _CELL_RE.match(cell) if isinstance(cell, str) else None
+    if not m:
+        raise GuideValidationError(
+            f"{where}: expected a value like '-2' or '+2', got {cell!r}."
+        )
+    sign, qty = m.group(1), int(m.group(2))
+    if qty == 0:
+        return False
+    expected = "-" if card in mb else "+"
+    if sign != expected:
+        raise GuideValidationError(
+            f"{where}: {'mainboard' if card in mb else 'sideboard'} cards "
+            f"must use '{expected}', got {cell!r}."
+        )
+    available = mb.get(card) or sb.get(card)
+    if qty > available:
+        raise GuideValidationError(
+            f"{where}: {qty} copies exceeds the {available} in the deck."
+        )
+    return True
+
+
+def load_guide(fileobj, limits: dict | None = None) -> dict:
+    """
+    Read, validate and normalize a saved guide (JSON or compact .sbg):
+    {'deck_data': {...}, 'matrix': [{'Matchup': name, card: '+n'/'-n'}, ...]}.
+    Empty and NaN cells are dropped. Raises GuideValidationError with the
+    location of the first problem found.
+    """
+    limits = {**GUIDE_LIMITS, **(limits or {})}
+    raw = _read_bounded(fileobj, limits["max_bytes"])
+    if raw.startswith(COMPACT_MAGIC):
+        return decode_guide_compact(raw, limits)
+    try:
+        data = json.loads(
+            raw,
+            object_pairs_hook=_bounded_object_hook(limits),
+            parse_constant=lambda _: None,  # NaN / Infinity -> empty cell
+        )
+    except UnicodeDecodeError:
+        raise GuideValidationError("File is not UTF-8 encoded text.")
+    except json.JSONDecodeError as e:
+        raise GuideValidationError(
+            f"Invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}."
+        )
+    if not isinstance(data, dict) or "deck_data" not in data or "matrix" not in data:
+        raise GuideValidationError(
+            "Expected an object with 'deck_data' and 'matrix' entries."
+        )
+    deck_data = _validate_deck_data(data["deck_data"], limits)
+    return {
+        "deck_data": deck_data,
+        "matrix": _validate_matrix(data["matrix"], deck_data, limits),
+    }
+
+
+# ─── Compact binary save format (.sbg) ───────────────────────────────────────
+# magic | version u8 | flags u8 | body (zlib-compressed when flags & 1)
+# body: varint n_mb, varint n_sb, card table (varint qty, str name) MB then SB,
+#       varint n_matchups, per matchup: str name, varint n_cells,
+#       n_cells × (varint card index, varint quantity). Signs follow the zone.
+#       Version 2 adds, per matchup, the draw delta in the same cell layout
+#       (varint n_delta, n_delta × (index, quantity)); quantity 0 = not moved.
+# Strings are varint byte length + UTF-8; varints are unsigned LEB128.
+COMPACT_MAGIC = b"SBG"
+COMPACT_FORMAT_VERSION = 2
+_COMPACT_COMPRESSED = 0x01
+
+
+def _write_varint(out: bytearray, value: int):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _write_str(out: bytearray, text: str):
+    raw = text.encode("utf-8")
+    _write_varint(out, len(raw))
+    out += raw
+
+
+class _CompactReader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise GuideValidationError("Compact guide is truncated.")
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+            if shift > 35:
+                raise GuideValidationError("Compact guide has a malformed number.")
+
+    def string(self, max_len: int) -> str:
+        size = self.varint()
+        if size > max_len * 4 or self.pos + size > len(self.data):
+            raise GuideValidationError("Compact guide has a malformed string.")
+        raw = self.data[self.pos : self.pos + size]
+        self.pos += size
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError:
+            raise GuideValidationError("Compact guide has invalid UTF-8 text.")
+
+
+def encode_guide_compact(
+    deck_data: dict, matchups: list[dict], compress: bool = True
+) -> bytes:
+    """Encode a guide as a card table plus sparse matrix (see layout above)."""
+    mb = list(deck_data.get("mainboard", {}).items())
+    sb = list(deck_data.get("sideboard", {}).items())
+    index = {card: i for i, (card, _) in enumerate(mb + sb)}
+
+    body = bytearray()
+    _write_varint(body, len(mb))
+    _write_varint(body, len(sb))
+    for card, qty in mb + sb:
+        _write_varint(body, qty)
+        _write_str(body, card[3:])
+    _write_varint(body, len(matchups))
+
+    def write_cells(row: dict):
+        cells = sorted(
+            (index[card], int(cell.lstrip("+-")))
+            for card, cell in row.items()
+            if card in index and isinstance(cell, str) and cell.lstrip("+-").isdigit()
+        )
+        _write_varint(body, len(cells))
+        for i, qty in cells:
+            _write_varint(body, i)
+            _write_varint(body, qty)
+
+    for row in matchups:
+        _write_str(body, row["Matchup"])
+        write_cells(row)
+        delta = row.get(DRAW_KEY)
+        write_cells(delta if isinstance(delta, dict) else {})
+
+    flags = 0
+    if compress:
+        body = zlib.compress(bytes(body), 9)
+        flags |= _COMPACT_COMPRESSED
+    return COMPACT_MAGIC + bytes([COMPACT_FORMAT_VERSION, flags]) + bytes(body)
+
+
+def decode_guide_compact(data: bytes, limits: dict | None = None) -> dict:
+    """Decode and validate a compact guide into the same shape as load_guide."""
+    limits = {**GUIDE_LIMITS, **(limits or {})}
+    if len(data) < 5 or not data.startswith(COMPACT_MAGIC):
+        raise GuideValidationError("Not a compact Sideboarder guide.")
+    version, flags = data[3], data[4]
+    if version > COMPACT_FORMAT_VERSION:
+        raise GuideValidationError(
+            f"Compact guide version {version} is newer than this app supports "
+            f"({COMPACT_FORMAT_VERSION})."
+        )
+    body = data[5:]
+    if flags & _COMPACT_COMPRESSED:
+        inflater = zlib.decompressobj()
+        try:
+            body = inflater.decompress(body, limits["max_bytes"])
+        except zlib.error:
+            raise GuideValidationError("Compact guide is corrupted.")
+        if inflater.unconsumed_tail:
+            raise GuideValidationError("Compact guide expands beyond the size limit.")
+
+    reader = _CompactReader(body)
+    n_mb, n_sb = reader.varint(), reader.varint()
+    if n_mb + n_sb > limits["max_cards"]:
+        raise GuideValidationError(
+            f"Deck has {n_mb + n_sb} unique cards (limit {limits['max_cards']})."
+        )
+    cards = []
+    deck_data = {"mainboard": {}, "sideboard": {}}
+    for i in range(n_mb + n_sb):
+        qty = reader.varint()
+        prefix, zone = ("MB:", "mainboard") if i < n_mb else ("SB:", "sideboard")
+        key = prefix + reader.string(limits["max_card_name_length"])
+        deck_data[zone][key] = qty
+        cards.append((key, "-" if i < n_mb else "+"))
+
+    n_matchups = reader.varint()
+    if n_matchups > limits["max_matchups"]:
+        raise GuideValidationError(
+            f"Guide has {n_matchups} matchups (limit {limits['max_matchups']})."
+        )
+
+    def read_cells(row: dict):
+        for _ in range(reader.varint()):
+            i, qty = reader.varint(), reader.varint()
+            if i >= len(cards):
+                raise GuideValidationError("Compact guide references an unknown card.")
+            card, sign = cards[i]
+            row[card] = f"{sign}{qty}"
+
+    matrix = []
+    for _ in range(n_matchups):
+        row = {"Matchup": reader.string(limits["max_archetype_length"])}
+        read_cells(row)
+        if version >= 2:
+            read_cells(row.setdefault(DRAW_KEY, {}))
+        matrix.append(row)
+
+    deck_data = _validate_deck_data(deck_data, limits)
+    return {
+        "deck_data": deck_data,
+        "matrix": _validate_matrix(matrix, deck_data, limits),
+    }
+
+
+def guide_to_compact(deck_data: dict, df: pd.DataFrame) -> bytes:
+    """Compact (.sbg) counterpart of guide_to_json."""
+    return encode_guide_compact(deck_data, matrix_df_to_matchups(df))
+
+
+# ─── Shareable links ─────────────────────────────────────────────────────────
+SHARE_QUERY_PARAM = "guide"
+MAX_SHARE_TOKEN_LENGTH = 8000  # keeps links well inside common URL limits
+
+
+def encode_share_token(deck_data: dict, matchups: list[dict]) -> str:
+    """Compressed compact guide as unpadded URL-safe base64."""
+    data = encode_guide_compact(deck_data, matchups)
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_share_token(token: str) -> dict:
+    """Inverse of encode_share_token; raises GuideValidationError on bad links."""
+    if len(token) > MAX_SHARE_TOKEN_LENGTH:
+        raise GuideValidationError("Share link is too long to be a Sideboarder guide.")
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        raise GuideValidationError("Share link is not a valid Sideboarder guide.")
+    return decode_guide_compact(data)
+
+
+def share_url(token: str) -> str:
+    """Editor URL that opens the shared guide, on this server when it is known."""
+    m = re.match(r"^https?://[^/]+", getattr(st.context, "url", None) or "")
+    base = m.group(0) if m else ""
+    return f"{base}/editor?{SHARE_QUERY_PARAM}={token}"
+
+
+def render_share_link(deck_data: dict, df: pd.DataFrame):
+    token = encode_share_token(deck_data, matrix_df_to_matchups(df))
+    st.markdown(
+        "**Share link** – opens this guide in the editor on any device, no upload needed:"
+    )
+    st.code(share_url(token), language=None, wrap_lines=True)
+
+
+def load_guide_into_session(guide: dict):
+    """Put a validated guide (from load_guide/decode_share_token) into session state."""
+    st.session_state.deck_data = guide["deck_data"]
+    st.session_state.matchups = guide["matrix"]
+    st.session_state.card_labels = card_labels_for(guide["deck_data"])
+    get_archetype_index().remember(guide["deck_data"], guide["matrix"])
+
+
+# ─── Bulk decklist import ────────────────────────────────────────────────────
+# Event coverage pastes many decklists into one text: a name line, the cards,
+# then a 'Sideboard' line or a blank line before the sideboard.
+BULK_LIMITS = {"max_decks": 500}
+DECK_SECTIONS = {
+    **dict.fromkeys(("deck", "main", "maindeck", "main deck", "mainboard"), "mainboard"),
+    **dict.fromkeys(("sideboard", "side board", "sb", "companion"), "sideboard"),
+    # category headings from deck sites all belong to the mainboard
+    **dict.fromkeys(
+        (
+            "commander", "creature", "creatures", "land", "lands", "spells",
+            "other spells", "instant", "instants", "sorcery", "sorceries",
+            "artifact", "artifacts", "enchantment", "enchantments",
+            "planeswalker", "planeswalkers", "battle", "battles",
+        ),
+        "mainboard",
+    ),
+}  # fmt: skip
+_DUMP_CARD_RE = re.compile(
+    r"^(?:(SB):\s*)?(\d+)x?\s+(.+?)"
+    r"(?:\s+[(\[][A-Za-z0-9]{2,6}[)\]](?:\s+[\w-]+)?)?"  # Arena/Cockatrice set + number
+    r"(?:\s+\*F\*)?$",
+    re.IGNORECASE,
+)
+_SECTION_COUNT_RE = re.compile(
+    r"\s*(?:[(\[]\d+[)\]]|:\s*\d*)$"
+)  # "Sideboard (15)", "Lands: 24"
+_QUOTES = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"'})
+_MINOR_WORDS = {"a", "an", "and", "at", "by", "for", "from", "in", "into", "of", "on", "or", "the", "to", "with"}  # fmt: skip
+
+
+@functools.lru_cache(maxsize=4096)
+def canonical_card_name(name: str) -> str:
+    """
+    One spelling per card: curly quotes, extra spaces and split-card slashes
+    are normalised ('Fire/Ice' -> 'Fire // Ice'), and an all-lower or
+    all-upper name is title-cased.
+    """
+    name = unicodedata.normalize("NFKC", name).translate(_QUOTES)
+    name = re.sub(r"\s*/{1,2}\s*", " // ", " ".join(name.split()))
+    if name.islower() or name.isupper():
+        words = name.lower().split(" ")
+        name = " ".join(
+            w if i and w in _MINOR_WORDS else w[:1].upper() + w[1:]
+            for i, w in enumerate(words)
+        )
+    return name
+
+
+def _dump_header(line: str) -> str:
+    return line.strip("#/=-*_ \t").strip()
+
+
+def iter_decklists(lines):
+    """
+    Split a multi-deck dump into {'name', 'deck_data'} decks, one at a time,
+    so only the deck being read is held in memory. `lines` is any iterable of
+    text lines (an open file, a generator over an upload). Lines that are
+    neither cards nor section headings name the next deck; a blank line after
+    the sideboard, or a fresh 'Deck' heading, ends the current one.
+    """
+    headers, deck, zone, seen = [], None, "mainboard", 0
+
+    def finished():
+        mb = {f"MB:{card}": qty for card, qty in deck["mainboard"].items()}
+        sb = {f"SB:{card}": qty for card, qty in deck["sideboard"].items()}
+        return {"name": deck["name"], "deck_data": {"mainboard": mb, "sideboard": sb}}
+
+    for raw in lines:
+        line = raw.strip().lstrip("﻿")
+        if not line:
+            if deck and zone == "mainboard" and deck["mainboard"]:
+                zone = "sideboard"  # MTGO: a blank line before the sideboard
+            elif deck and zone == "sideboard" and deck["sideboard"]:
+                yield finished()
+                deck = None
+            continue
+        m = _DUMP_CARD_RE.match(line)
+        if m:
+            if deck is None:
+                seen += 1
+                name = " - ".join(headers) or f"Deck {seen}"
+                deck = {"name": name[: GUIDE_LIMITS["max_archetype_length"]]}
+                deck.update(mainboard={}, sideboard={})
+                headers, zone = [], "mainboard"
+            sideboard, qty, card = m.groups()
+            cards = deck["sideboard" if sideboard else zone]
+            card = canonical_card_name(card)
+            cards[card] = cards.get(card, 0) + int(qty)
+            continue
+        section = DECK_SECTIONS.get(_SECTION_COUNT_RE.sub("", line).casefold())
+        if section:
+            if deck and section == "mainboard" and deck["sideboard"]:
+                yield finished()  # Arena: 'Deck' starts the next list
+                deck = None
+            zone = section
+        elif _dump_header(line):
+            if deck and (deck["mainboard"] or deck["sideboard"]):
+                yield finished()
+                deck = None
+            headers.append(_dump_header(line))
+    if deck:
+        yield finished()
+
+
+def iter_guide_skeletons(lines, limits: dict | None = None):
+    """
+    (deck name, guide, error) per deck in the dump. A guide is a saved guide
+    with no matchups yet, checked against the upload limits; decks that fail
+    come back with guide None and the reason.
+    """
+    limits = limits or GUIDE_LIMITS
+    for i, deck in enumerate(iter_decklists(lines)):
+        if i >= BULK_LIMITS["max_decks"]:
+            yield deck["name"], None, f"More than {i} decks; the rest were skipped."
+            return
+        try:
+            deck_data = _validate_deck_data(deck["deck_data"], limits)
+        except GuideValidationError as e:
+            yield deck["name"], None, str(e)
+            continue
+        yield deck["name"], {"deck_data": deck_data, "matrix": []}, None
+
+
+def skeleton_filename(name: str, taken: set[str]) -> str:
+    """'<slug>.json' for a deck name, numbered if the slug is already taken."""
+    stem = re.sub(r"[^\w]+", "-", name.casefold()).strip("-")[:60] or "deck"
+    filename, n = f"{stem}.json", 1
+    while filename in taken:
+        n += 1
+        filename = f"{stem}-{n}.json"
+    taken.add(filename)
+    return filename
+
+
+def write_skeleton_zip(out, skeletons) -> list[dict]:
+    """
+    Stream one JSON guide per skeleton into a ZIP in `out`, as
+    iter_guide_skeletons yields them; returns a summary row per deck.
+    """
+    summary, taken = [], set()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as bundle:
+        for name, guide, error in skeletons:
+            row = {"Deck": name, "File": None, "Mainboard": 0, "Sideboard": 0}
+            if guide is not None:
+                row["File"] = skeleton_filename(name, taken)
+                bundle.writestr(row["File"], json.dumps(guide, indent=2))
+                for zone, cards in guide["deck_data"].items():
+                    row[zone.capitalize()] = sum(cards.values())
+            summary.append(row | {"Problem": error})
+    return summary
+
+
+def _upload_lines(fileobj):
+    for raw in fileobj:
+        yield raw.decode("utf-8", "replace")
+
+
+def render_bulk_import_section():
+    """Many decklists at once: one guide skeleton per deck, as a ZIP of JSON."""
+    with st.expander("Bulk import (many decklists)", icon=":material/library_books:"):
+        st.markdown(
+            "Paste or upload a text dump with several decklists, each under its "
+            "own name line. Every deck becomes an empty guide; open one here to "
+            "start adding matchups."
+        )
+        upload = st.file_uploader("Decklist dump", type=["txt"], key="bulk_upload")
+        text = st.text_area("or paste it here", height=150, key="bulk_text")
+        if st.button("Build guide skeletons", key="bulk_build"):
+            lines = _upload_lines(upload) if upload else io.StringIO(text)
+            buf = io.BytesIO()
+            summary = write_skeleton_zip(buf, iter_guide_skeletons(lines))
+            st.session_state.bulk_import = {"zip": buf.getvalue(), "summary": summary}
+        result = st.session_state.get("bulk_import")
+        if not result:
+            return
+        summary = result["summary"]
+        ok = [row for row in summary if row["File"]]
+        if not summary:
+            st.warning("No decklists found.")
+            return
+        st.dataframe(pd.DataFrame(summary), hide_index=True, use_container_width=True)
+        if not ok:
+            return
+        st.download_button(
+            f"Download {len(ok)} guide skeletons (ZIP)",
+            data=result["zip"],
+            file_name=f"sideboarder_skeletons_{date.today()}.zip",
+            mime="application/zip",
+            icon=":material/folder_zip:",
+            key="bulk_download",
+        )
+        files = {row["File"]: row["Deck"] for row in ok}
+        choice = st.selectbox(
+            "Start a guide from", list(files), format_func=files.get, key="bulk_pick"
+        )
+        if st.button("Open this deck", key="bulk_open"):
+            with zipfile.ZipFile(io.BytesIO(result["zip"])) as bundle:
+                guide = json.loads(bundle.read(choice))
+            del st.session_state.bulk_import
+            load_guide_into_session(guide)
+            st.rerun()
+
+
+# ─── Optional guide store (SQLite) ───────────────────────────────────────────
+_GUIDE_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS guides (
+    id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    deck_hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_guides_owner ON guides (owner, id);
+CREATE INDEX IF NOT EXISTS idx_guides_deck ON guides (deck_hash, id);
+CREATE TABLE IF NOT EXISTS guide_archetypes (
+    archetype TEXT NOT NULL,
+    guide_id INTEGER NOT NULL REFERENCES guides (id) ON DELETE CASCADE,
+    PRIMARY KEY (archetype, guide_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_archetypes_guide ON guide_archetypes (guide_id);
+"""
+
+
+def deck_hash(deck_data: dict) -> str:
+    """Order-independent hash of a decklist, shared by guides for the same 75."""
+    lines = sorted(
+        f"{card}={qty}" for zone in deck_data.values() for card, qty in zone.items()
+    )
+    return sha1("\n".join(lines).encode()).hexdigest()
+
+
+def normalize_archetype(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+GUIDE_PAGE_SIZE = 20  # guides per page in the store loader
+
+
+class GuideStore:
+    """
+    Guides stored server-side as compact .sbg blobs, indexed by deck hash, owner
+    and archetype so every lookup is a B-tree seek. Owner tokens are only ever
+    stored hashed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_GUIDE_STORE_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """A connection that commits (or rolls back) on exit, then is closed."""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute("PRAGMA foreign_keys=ON")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def owner_key(owner_token: str) -> str:
+        return sha1(owner_token.encode()).hexdigest()
+
+    def save(
+        self,
+        owner_token: str,
+        deck_data: dict,
+        matchups: list[dict],
+        title: str = "",
+        guide_id: int | None = None,
+    ) -> int:
+        """Insert a guide, or replace `guide_id` if this owner already has it."""
+        owner = self.owner_key(owner_token)
+        data = encode_guide_compact(deck_data, matchups)
+        archetypes = {normalize_archetype(m["Matchup"]) for m in matchups}
+        with self._connect() as conn:
+            row = None
+            if guide_id is not None:
+                row = conn.execute(
+                    "SELECT id FROM guides WHERE id = ? AND owner = ?",
+                    (guide_id, owner),
+                ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE guides SET deck_hash = ?, title = ?, data = ?, updated_at = ? "
+                    "WHERE id = ?",
+                    (deck_hash(deck_data), title, data, time.time(), guide_id),
+                )
+                conn.execute(
+                    "DELETE FROM guide_archetypes WHERE guide_id = ?", (guide_id,)
+                )
+            else:
+                guide_id = conn.execute(
+                    "INSERT INTO guides (owner, deck_hash, title, data, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (owner, deck_hash(deck_data), title, data, time.time()),
+                ).lastrowid
+            conn.executemany(
+                "INSERT INTO guide_archetypes (archetype, guide_id) VALUES (?, ?)",
+                [(a, guide_id) for a in archetypes],
+            )
+        return guide_id
+
+    def load(self, guide_id: int, owner_token: str) -> dict | None:
+        """The guide in load_guide's shape, or None if this owner has no such guide."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM guides WHERE id = ? AND owner = ?",
+                (guide_id, self.owner_key(owner_token)),
+            ).fetchone()
+        return decode_guide_compact(row[0]) if row else None
+
+    def delete(self, guide_id: int, owner_token: str) -> bool:
+        with self._connect() as conn:
+            cur = conn.execute(
+                "DELETE FROM guides WHERE id = ? AND owner = ?",
+                (guide_id, self.owner_key(owner_token)),
+            )
+        return cur.rowcount > 0
+
+    def list_guides(
+        self,
+        owner_token: str,
+        deck: dict | None = None,
+        archetype: str | None = None,
+        before_id: int | None = None,
+        limit: int = GUIDE_PAGE_SIZE,
+    ) -> list[dict]:
+        """
+        Newest-first page of this owner's guides, optionally for one deck and/or
+        one archetype. Pass the last id of a page as `before_id` to get the next.
+        """
+        sql = "SELECT g.id, g.title, g.deck_hash, g.updated_at FROM guides g"
+        where, params = ["g.owner = ?"], [self.owner_key(owner_token)]
+        if archetype:
+            sql += " JOIN guide_archetypes a ON a.guide_id = g.id AND a.archetype = ?"
+            params.insert(0, normalize_archetype(archetype))
+        if deck is not None:
+            where.append("g.deck_hash = ?")
+            params.append(deck_hash(deck))
+        if before_id is not None:
+            where.append("g.id < ?")
+            params.append(before_id)
+        sql += " WHERE " + " AND ".join(where) + " ORDER BY g.id DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            {"id": r[0], "title": r[1], "deck_hash": r[2], "updated_at": r[3]}
+            for r in rows
+        ]
+
+
+@st.cache_resource(show_spinner=False)
+def get_guide_store() -> GuideStore | None:
+    """The process-wide store if SIDEBOARDER_GUIDE_DB points at a SQLite file."""
+    path = os.environ.get("SIDEBOARDER_GUIDE_DB")
+    return GuideStore(path) if path else None
+
+
+def render_guide_store_loader():  # Editor: keyed load from the optional store
+    store = get_guide_store()
+    if store is None or "deck_data" in st.session_state:
+        return
+    with st.expander("Load from saved guides"):
+        owner = st.text_input(
+            "Owner token",
+            type="password",
+            key="store_owner",
+            help="The private token you used when saving guides to this server.",
+            on_change=_reset_store_pages,
+        )
+        archetype = st.text_input(
+            "Filter by archetype (optional)",
+            key="store_filter",
+            on_change=_reset_store_pages,
+        )
+        if not owner:
+            return
+        st.session_state.setdefault("store_pages", [None])
+        before_id = st.session_state.store_pages[-1]
+        page = store.list_guides(
+            owner, archetype=archetype or None, before_id=before_id
+        )
+        if not page:
+            st.info("No saved guides found.")
+        for guide in page:
+            col1, col2 = st.columns([0.75, 0.25])
+            col1.markdown(f"**{guide['title'] or 'Untitled guide'}** (#{guide['id']})")
+            if col2.button("Load", key=f"store_load_{guide['id']}"):
+                loaded = store.load(guide["id"], owner)
+                if loaded is None:  # deleted since the list was shown
+                    st.error(f"❌ Guide #{guide['id']} is no longer available.")
+                    continue
+                load_guide_into_session(loaded)
+                st.session_state.store_guide_id = guide["id"]
+                st.rerun()
+        col1, col2 = st.columns(2)
+        if len(st.session_state.store_pages) > 1 and col1.button("Newer"):
+            st.session_state.store_pages.pop()
+            st.rerun()
+        if len(page) == GUIDE_PAGE_SIZE and col2.button("Older"):
+            st.session_state.store_pages.append(page[-1]["id"])
+            st.rerun()
+
+
+def _reset_store_pages():
+    # a new owner or filter lists a different set, so start from its newest page
+    st.session_state.store_pages = [None]
+
+
+def render_guide_store_saver(deck_data: dict, df: pd.DataFrame):
+    store = get_guide_store()
+    if store is None:
+        return
+    with st.expander("Save to this server"):
+        owner = st.text_input("Owner token", type="password", key="store_owner_save")
+        title = st.text_input("Title", key="store_title")
+        # a callback, so the save still runs when the button sits inside the
+        # create page's one-shot "Export Options" block
+        st.button(
+            "Save guide",
+            disabled=not owner,
+            key="store_save",
+            on_click=_save_to_store,
+            args=(store, owner, title, deck_data, df),
+        )
+
+
+def _save_to_store(store: GuideStore, owner, title, deck_data, df):
+    st.session_state.store_guide_id = store.save(
+        owner,
+        deck_data,
+        matrix_df_to_matchups(df),
+        title=title,
+        guide_id=st.session_state.get("store_guide_id"),
+    )
+    st.toast(f"Saved as guide #{st.session_state.store_guide_id}.")
+
+
+# ─── Archetype names ─────────────────────────────────────────────────────────
+def _fold_archetype(name: str) -> str:
+    """normalize_archetype, plus punctuation dropped so 'U/R' matches 'UR'."""
+    return normalize_archetype(re.sub(r"[^\w\s]", "", name))
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ArchetypeIndex:
+    """
+    Trigram index over archetype names and their aliases, so 'boros energy',
+    'RW Energy' and 'Boros Enrgy' all lead to 'Boros Energy'. Also remembers the
+    latest plan saved for each archetype, per deck hash.
+    """
+
+    def __init__(self):
+        self.canonical: dict[str, str] = {}  # folded name or alias -> display name
+        self._keys: list[str] = []
+        self._sizes: list[int] = []  # trigram count per key
+        self._postings: dict[str, set[int]] = {}
+        self.plans: dict[str, dict[str, dict]] = {}  # deck hash -> folded -> row
+
+    def add(self, name: str, aliases: tuple = ()) -> str:
+        """Index `name` (and aliases) unless already known; returns its display name."""
+        name = " ".join(name.split())
+        display = self.canonical.get(_fold_archetype(name), name)
+        for spelling in (name, *aliases):
+            key = _fold_archetype(spelling)
+            if not key or key in self.canonical:
+                continue
+            self.canonical[key] = display
+            grams = _trigrams(key)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(len(self._keys))
+            self._keys.append(key)
+            self._sizes.append(len(grams))
+        return display
+
+    def scored(self, query: str) -> list[tuple[float, str]]:
+        """(score, display name) best first; prefix matches outrank fuzzy ones."""
+        key = _fold_archetype(query)
+        if not key:
+            return []
+        grams = _trigrams(key)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for i in self._postings.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        best: dict[str, float] = {}
+        for i, n in shared.items():
+            candidate = self._keys[i]
+            score = 2 * n / (len(grams) + self._sizes[i])
+            if candidate.startswith(key):
+                score += 1
+            display = self.canonical[candidate]
+            best[display] = max(best.get(display, 0), score)
+        return sorted(((s, d) for d, s in best.items()), key=lambda t: (-t[0], t[1]))
+
+    def suggest(self, query: str, limit: int = 5, cutoff: float = 0.3) -> list[str]:
+        return [d for s, d in self.scored(query) if s >= cutoff][:limit]
+
+    def remember(self, deck_data: dict, matchups: list[dict]):
+        """Index every matchup name and keep its plan for this deck."""
+        plans = self.plans.setdefault(deck_hash(deck_data), {})
+        for row in matchups:
+            display = self.add(row["Matchup"])
+            plans[_fold_archetype(display)] = row
+
+    def closest_plan(
+        self, deck_data: dict, name: str, cutoff: float = 0.6
+    ) -> dict | None:
+        """The remembered row for the best match of `name` on this deck, if any."""
+        plans = self.plans.get(deck_hash(deck_data))
+        if not plans:
+            return None
+        for score, display in self.scored(name):
+            if score < cutoff:
+                break
+            if _fold_archetype(display) in plans:
+                return plans[_fold_archetype(display)]
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def load_bundled_archetypes(path: str = "./static/archetypes.json") -> dict:
+    """{display name: [aliases]} shipped with the app."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_archetype_index() -> ArchetypeIndex:
+    """This session's index: the bundled names plus every guide seen so far."""
+    if "archetype_index" not in st.session_state:
+        index = ArchetypeIndex()
+        for name, aliases in load_bundled_archetypes().items():
+            index.add(name, tuple(aliases))
+        st.session_state.archetype_index = index
+    return st.session_state.archetype_index
+
+
+def _prefill_plan(row: dict):  # on_click callback for the plan prefill button
+    deck = st.session_state.deck_data
+    moved = [c for c, v in row.items() if c != "Matchup" and str(v).strip("+-0")]
+    out_cards = [c for c in moved if c in deck["mainboard"]]
+    in_cards = [c for c in moved if c in deck["sideboard"]]
+    for cards, zone, prefix in (
+        (out_cards, "mainboard", "tmp_qty_out"),
+        (in_cards, "sideboard", "tmp_qty_in"),
+    ):
+        for card in cards:
+            qty = min(abs(int(row[card])), deck[zone][card])
+            st.session_state[_slug_key(prefix, card)] = qty
+    st.session_state.tmp_search_out = out_cards
+    st.session_state.tmp_search_in = in_cards
+
+
+def _use_archetype_name(name: str):  # on_click callback for a suggestion button
+    st.session_state.tmp_opponent_name = name
+
+
+# ─── Guide diffs ─────────────────────────────────────────────────────────────
+def matchups_to_array(matchups: list[dict], cards: list[str]) -> np.ndarray:
+    """Signed counts (-n out, +n in), one row per matchup, one column per card."""
+    col = {card: j for j, card in enumerate(cards)}
+    arr = np.zeros((len(matchups), len(cards)), dtype=np.int16)
+    for i, row in enumerate(matchups):
+        for card, cell in row.items():
+            j = col.get(card)
+            if j is not None and isinstance(cell, str) and cell:
+                arr[i, j] = int(cell)
+    return arr
+
+
+def _pair_matchups(old: list[dict], new: list[dict], A, B) -> list[tuple[int, int]]:
+    """
+    Match old rows to new rows: same name, then identical plan, then same
+    position if the two plans touch a common card (or they are the only rows).
+    """
+    by_name = {}
+    for i, row in enumerate(old):
+        by_name.setdefault(normalize_archetype(row["Matchup"]), []).append(i)
+    pairs, new_left = [], []
+    for j, row in enumerate(new):
+        candidates = by_name.get(normalize_archetype(row["Matchup"]))
+        if candidates:
+            pairs.append((candidates.pop(0), j))
+        else:
+            new_left.append(j)
+    old_left = sorted(i for idxs in by_name.values() for i in idxs)
+    if old_left and new_left:
+        same = (A[old_left][:, None, :] == B[new_left][None, :, :]).all(axis=2)
+        taken_old, taken_new = set(), set()
+        for a, b in zip(*np.nonzero(same)):
+            if a not in taken_old and b not in taken_new:
+                pairs.append((old_left[a], new_left[b]))
+                taken_old.add(a)
+                taken_new.add(b)
+        old_left = [i for k, i in enumerate(old_left) if k not in taken_old]
+        new_left = [j for k, j in enumerate(new_left) if k not in taken_new]
+    single = len(old) == len(new) == 1
+    for i in sorted(set(old_left) & set(new_left)):
+        if single or ((A[i] != 0) & (B[i] != 0)).any():
+            pairs.append((i, i))
+    return pairs
+
+
+def diff_guides(old: list[dict], new: list[dict]) -> dict:
+    """
+    Structured changes between two versions of a guide's matchups:
+      renamed: [(old name, new name)]      added/removed: [name]
+      changed: [{'matchup', 'old_matchup', 'cells': [(card, old, new)]}]
+    Card counts are compared as whole integer arrays; `old`/`new` in cells are
+    signed (-n out, +n in, 0 unused). Changes to the on-the-draw plan of a
+    matchup that has one on either side are listed under an extra 'draw_cells'.
+    """
+    cards = sorted({c for row in old + new for c in plan_cells(row)})
+    A, B = matchups_to_array(old, cards), matchups_to_array(new, cards)
+    pairs = _pair_matchups(old, new, A, B)
+    paired_old = {i for i, _ in pairs}
+    paired_new = {j for _, j in pairs}
+
+    result = {
+        "renamed": [],
+        "added": [r["Matchup"] for j, r in enumerate(new) if j not in paired_new],
+        "removed": [r["Matchup"] for i, r in enumerate(old) if i not in paired_old],
+        "changed": [],
+    }
+    if not pairs:
+        return result
+    pairs.sort(key=lambda p: p[1])
+    oi = np.array([i for i, _ in pairs])
+    nj = np.array([j for _, j in pairs])
+    differs = A[oi] != B[nj]
+    for k, (i, j) in enumerate(pairs):
+        old_name, new_name = old[i]["Matchup"], new[j]["Matchup"]
+        if old_name != new_name:
+            result["renamed"].append((old_name, new_name))
+        cols = np.flatnonzero(differs[k])
+        draw_cells = []
+        if old[i].get(DRAW_KEY) or new[j].get(DRAW_KEY):
+            before, after = draw_plan(old[i]), draw_plan(new[j])
+            draw_cells = [
+                (c, int(before.get(c, 0)), int(after.get(c, 0)))
+                for c in sorted(before.keys() | after.keys())
+                if before.get(c) != after.get(c)
+            ]
+        if cols.size or draw_cells:
+            change = {
+                "matchup": new_name,
+                "old_matchup": old_name,
+                "cells": [(cards[c], int(A[i, c]), int(B[j, c])) for c in cols],
+            }
+            if draw_cells:
+                change["draw_cells"] = draw_cells
+            result["changed"].append(change)
+    return result
+
+
+def diff_decks(old: dict, new: dict) -> dict:
+    """Cards added, removed or re-counted between two deck_data dicts."""
+    old_cards = {c: q for zone in old.values() for c, q in zone.items()}
+    new_cards = {c: q for zone in new.values() for c, q in zone.items()}
+    return {
+        "added": sorted(new_cards.keys() - old_cards.keys()),
+        "removed": sorted(old_cards.keys() - new_cards.keys()),
+        "recounted": sorted(
+            (c, old_cards[c], new_cards[c])
+            for c in old_cards.keys() & new_cards.keys()
+            if old_cards[c] != new_cards[c]
+        ),
+    }
+
+
+def format_cell_changes(cells: list[tuple], card_labels: dict[str, str]) -> list[str]:
+    """'+1 Card' / '-2 Card' lines: change in the number of copies moved."""
+    lines = []
+    for card, old, new in cells:
+        delta = abs(new) - abs(old)
+        if delta:
+            sign = "+" if delta > 0 else "-"
+            lines.append(f"{sign}{abs(delta)} {card_labels.get(card, card)}")
+    return lines
+
+
+def render_guide_diff(diff: dict, card_labels: dict[str, str]):
+    for old_name, new_name in diff["renamed"]:
+        st.markdown(f"- 🆕 Renamed '{old_name}' to '{new_name}'")
+    for name in diff["added"]:
+        st.markdown(f"- ➕ Added matchup '{name}'")
+    for name in diff["removed"]:
+        st.markdown(f"- ➖ Removed matchup '{name}'")
+    for change in diff["changed"]:
+        lines = format_cell_changes(change["cells"], card_labels) + [
+            f"{line} on the draw"
+            for line in format_cell_changes(change.get("draw_cells", []), card_labels)
+        ]
+        if lines:
+            st.markdown(f"- **{change['matchup']}**: " + ", ".join(lines))
+    if not any(diff.values()):
+        st.markdown("No differences between the matchups.")
+
+
+def render_guide_comparison():
+    """Editor: compare two uploaded saves side by side."""
+    with st.expander("Compare two saved guides"):
+        col1, col2 = st.columns(2)
+        guides = []
+        for col, label, key in (
+            (col1, "Older", "compare_old"),
+            (col2, "Newer", "compare_new"),
+        ):
+            with col:
+                f = st.file_uploader(f"{label} guide", type=["json", "sbg"], key=key)
+                if f is None:
+                    continue
+                try:
+                    guide = load_guide(f)
+                except GuideValidationError as e:
+                    st.error(f"❌ {e}")
+                    continue
+                guides.append(guide)
+                st.markdown(
+                    "\n".join(f"- {m['Matchup']}" for m in guide["matrix"])
+                    or "_No matchups_"
+                )
+        if len(guides) != 2:
+            return
+        old, new = guides
+        labels = {
+            key: key[3:]
+            for guide in guides
+            for zone in guide["deck_data"].values()
+            for key in zone
+        }
+        st.markdown("### Differences")
+        deck = diff_decks(old["deck_data"], new["deck_data"])
+        if deck["added"] or deck["removed"] or deck["recounted"]:
+            st.markdown(
+                "Decklist: "
+                + ", ".join(
+                    [f"+{labels[c]}" for c in deck["added"]]
+                    + [f"−{labels[c]}" for c in deck["removed"]]
+                    + [f"{labels[c]} {o}→{n}" for c, o, n in deck["recounted"]]
+                )
+            )
+        render_guide_diff(diff_guides(old["matrix"], new["matrix"]), labels)
+
+
+# ─── Whole-guide consistency check ───────────────────────────────────────────
+def check_guide(deck_data: dict, matchups: list[dict]) -> dict[str, list]:
+    """
+    Check every matchup at once on the signed count matrix:
+      unbalanced      [(matchup, cards out, cards in)]
+      over_limit      [(matchup, card, count, copies in deck)]
+      wrong_direction [(matchup, card)]  mainboard brought in / sideboard taken out
+      unused_sideboard [card]            never brought in
+      always_cut      [card]             taken out in every matchup
+      duplicate_names [name]             same archetype name (case-insensitive)
+    """
+    mb = list(deck_data.get("mainboard", {}))
+    sb = list(deck_data.get("sideboard", {}))
+    cards = mb + sb
+    base_names = [m["Matchup"] for m in matchups]
+    # draw plans are checked as extra rows alongside the play plans
+    plans = [plan_cells(m) for m in matchups] + [
+        draw_plan(m) for m in matchups if m.get(DRAW_KEY)
+    ]
+    names = base_names + [
+        f"{m['Matchup']} (on the draw)" for m in matchups if m.get(DRAW_KEY)
+    ]
+    arr = matchups_to_array(plans, cards)
+    limits = np.array(
+        [deck_data["mainboard"][c] for c in mb]
+        + [deck_data["sideboard"][c] for c in sb],
+        dtype=np.int16,
+    )
+    mb_part, sb_part = arr[:, : len(mb)], arr[:, len(mb) :]
+    total_out = -arr.clip(max=0).sum(axis=1)
+    total_in = arr.clip(min=0).sum(axis=1)
+
+    unbalanced = np.flatnonzero(total_out != total_in)
+    over_r, over_c = np.nonzero(np.abs(arr) > limits)
+    wrong = np.concatenate([mb_part > 0, sb_part < 0], axis=1)
+    wrong_r, wrong_c = np.nonzero(wrong)
+    normalized = [normalize_archetype(n) for n in base_names]
+    seen, duplicates = set(), []
+    for name, key in zip(base_names, normalized):
+        if key in seen and name not in duplicates:
+            duplicates.append(name)
+        seen.add(key)
+    return {
+        "unbalanced": [
+            (names[i], int(total_out[i]), int(total_in[i])) for i in unbalanced
+        ],
+        "over_limit": [
+            (names[i], cards[j], int(abs(arr[i, j])), int(limits[j]))
+            for i, j in zip(over_r, over_c)
+        ],
+        "wrong_direction": [(names[i], cards[j]) for i, j in zip(wrong_r, wrong_c)],
+        "unused_sideboard": (
+            [sb[j] for j in np.flatnonzero(~(sb_part > 0).any(axis=0))]
+            if matchups
+            else []
+        ),
+        "always_cut": (
+            [mb[j] for j in np.flatnonzero((mb_part < 0).all(axis=0))]
+            if matchups
+            else []
+        ),
+        "duplicate_names": duplicates,
+    }
+
+
+def render_guide_check(deck_data: dict, matchups: list[dict]):
+    """Collapsed summary of check_guide for the create preview and the editor."""
+    if not matchups:
+        return
+    report = check_guide(deck_data, matchups)
+    labels = st.session_state.get("card_labels", {})
+    lines = (
+        [f"**{m}** takes out {o} but brings in {i}" for m, o, i in report["unbalanced"]]
+        + [
+            f"**{m}** moves {n} {labels.get(c, c)} but the deck has {q}"
+            for m, c, n, q in report["over_limit"]
+        ]
+        + [
+            f"**{m}** moves {labels.get(c, c)} the wrong way"
+            for m, c in report["wrong_direction"]
+        ]
+        + [
+            f"Archetype **{n}** appears more than once"
+            for n in report["duplicate_names"]
+        ]
+        + [
+            f"{labels.get(c, c)} is never brought in"
+            for c in report["unused_sideboard"]
+        ]
+        + [
+            f"{labels.get(c, c)} is taken out in every matchup"
+            for c in report["always_cut"]
+        ]
+    )
+    title = f"Guide check: {len(lines)} note{'s' if len(lines) != 1 else ''}"
+    with st.expander(title if lines else "Guide check: no issues found"):
+        for line in lines:
+            st.markdown(f"- {line}")
+
+
+# ─── Team analytics across guides ────────────────────────────────────────────
+def stack_guides(guides: list[dict]) -> dict:
+    """
+    Stack many loaded guides into one (guides × archetypes × cards) array of
+    signed counts. Archetypes are merged case-insensitively; `present` marks
+    which guides have a plan for which archetype.
+    """
+    archetypes, display = {}, []
+    for guide in guides:
+        for row in guide["matrix"]:
+            key = normalize_archetype(row["Matchup"])
+            if key not in archetypes:
+                archetypes[key] = len(display)
+                display.append(row["Matchup"].strip())
+    mb = sorted({c for g in guides for c in g["deck_data"]["mainboard"]})
+    sb = sorted({c for g in guides for c in g["deck_data"]["sideboard"]})
+    cards = mb + sb
+    stack = np.zeros((len(guides), len(display), len(cards)), dtype=np.int16)
+    present = np.zeros((len(guides), len(display)), dtype=bool)
+    for g, guide in enumerate(guides):
+        rows = [archetypes[normalize_archetype(r["Matchup"])] for r in guide["matrix"]]
+        # later duplicates of an archetype within one guide win, like a dict
+        stack[g, rows] = matchups_to_array(guide["matrix"], cards)
+        present[g, rows] = True
+    return {"stack": stack, "present": present, "archetypes": display, "cards": cards}
+
+
+def guide_consensus(stacked: dict) -> dict[str, np.ndarray]:
+    """
+    Per archetype × card, over the guides that cover the archetype:
+      coverage  number of guides with a plan for the archetype (per archetype)
+      frequency share of those plans that move the card
+      mean      mean signed count (-out / +in)
+      spread    standard deviation of the signed count (disagreement)
+    """
+    stack = stacked["stack"].astype(np.float64)
+    mask = stacked["present"][:, :, None]
+    coverage = stacked["present"].sum(axis=0)
+    n = np.maximum(coverage, 1)[:, None]
+    used = (stack != 0) & mask
+    mean = (stack * mask).sum(axis=0) / n
+    mean_sq = (stack**2 * mask).sum(axis=0) / n
+    return {
+        "coverage": coverage,
+        "frequency": used.sum(axis=0) / n,
+        "mean": mean,
+        "spread": np.sqrt(np.maximum(mean_sq - mean**2, 0)),
+    }
+
+
+def consensus_df(stacked: dict, consensus: dict) -> pd.DataFrame:
+    """Mean plan as '+n'/'-n' strings, ready for render_matrix_figure."""
+    cells = [
+        [f"{x:+.1f}".replace(".0", "") if x else "" for x in row]
+        for row in consensus["mean"]
+    ]
+    df = pd.DataFrame(cells, index=stacked["archetypes"], columns=stacked["cards"])
+    df.index.name = "Matchup"
+    return df.loc[:, (df != "").any(axis=0)]
+
+
+def card_usage_summary(stacked: dict) -> pd.DataFrame:
+    """How often each card moves across every plan of every guide."""
+    stack, present = stacked["stack"], stacked["present"]
+    plans = max(int(present.sum()), 1)
+    brought_in = (stack > 0).sum(axis=(0, 1))
+    taken_out = (stack < 0).sum(axis=(0, 1))
+    df = pd.DataFrame(
+        {
+            "Card": [c[3:] for c in stacked["cards"]],
+            "Zone": [c[:2] for c in stacked["cards"]],
+            "Plans bringing in": brought_in,
+            "Plans taking out": taken_out,
+            "Share of plans": (brought_in + taken_out) / plans,
+        }
+    )
+    return df.sort_values(
+        ["Plans bringing in", "Plans taking out"], ascending=False
+    ).reset_index(drop=True)
+
+
+# ─── Deck revisions ──────────────────────────────────────────────────────────
+def migrate_guide(
+    old_deck: dict,
+    new_deck: dict,
+    matchups: list[dict],
+    renames: dict[str, str] | None = None,
+) -> tuple[list[dict], dict[str, list[str]]]:
+    """
+    Re-key matchups for an updated decklist, touching only changed columns.
+    `renames` maps a removed card to its replacement in the same zone (e.g. a
+    one-for-one swap); other removed cards are dropped and counts above the new
+    maximum are clamped. Returns (matchups, {matchup name: reasons to review});
+    rows that needed no change are returned as the same objects.
+    """
+    renames = renames or {}
+    deck = diff_decks(old_deck, new_deck)
+    new_counts = {c: q for zone in new_deck.values() for c, q in zone.items()}
+    changed = set(deck["removed"]) | {c for c, _, _ in deck["recounted"]}
+    out, flagged = [], {}
+    for row in matchups:
+        delta = row.get(DRAW_KEY) or {}
+        if not changed.intersection(row.keys() | delta.keys()):
+            out.append(row)
+            continue
+        play, reasons = _migrate_cells(plan_cells(row), changed, renames, new_counts)
+        new_row = {"Matchup": row["Matchup"], **play}
+        if delta:
+            draw, draw_reasons = _migrate_cells(
+                draw_plan(row), changed, renames, new_counts
+            )
+            reasons += [f"{r} on the draw" for r in draw_reasons if r not in reasons]
+            delta = draw_delta(play, draw)
+            if delta:
+                new_row[DRAW_KEY] = delta
+        if not play:
+            reasons.append("no cards left in this plan")
+        out.append(new_row)
+        if reasons:
+            flagged[row["Matchup"]] = reasons
+    return out, flagged
+
+
+def _migrate_cells(
+    cells: dict, changed: set, renames: dict, new_counts: dict
+) -> tuple[dict, list[str]]:
+    cells, reasons = dict(cells), []
+    for card in sorted(changed.intersection(cells)):
+        cell = cells.pop(card)
+        sign, qty = cell[0], int(cell[1:])
+        target = renames.get(card, card)
+        label = card[3:]
+        if target not in new_counts or target[:3] != card[:3]:
+            reasons.append(f"{label} was removed from the deck ({cell} dropped)")
+            continue
+        if target != card:
+            reasons.append(f"{label} replaced by {target[3:]}")
+            if target in cells:
+                qty += int(cells[target][1:])
+        if qty > new_counts[target]:
+            reasons.append(
+                f"{target[3:]} reduced from {qty} to {new_counts[target]} copies"
+            )
+            qty = new_counts[target]
+        cells[target] = f"{sign}{qty}"
+    return cells, reasons
+
+
+def render_deck_update():
+    """Editor: replace the decklist and migrate existing matchups to it."""
+    with st.expander("Update decklist"):
+        deck_data, labels = st.session_state.deck_data, st.session_state.card_labels
+        mb_text = st.text_area(
+            "Mainboard",
+            value="\n".join(
+                f"{q} {labels[k]}" for k, q in deck_data["mainboard"].items()
+            ),
+            height=200,
+            key="update_mainboard",
+        )
+        sb_text = st.text_area(
+            "Sideboard",
+            value="\n".join(
+                f"{q} {labels[k]}" for k, q in deck_data["sideboard"].items()
+            ),
+            height=100,
+            key="update_sideboard",
+        )
+        new_deck = {
+            "mainboard": {f"MB:{n}": q for n, q in parse_decklist(mb_text).items()},
+            "sideboard": {f"SB:{n}": q for n, q in parse_decklist(sb_text).items()},
+        }
+        deck = diff_decks(deck_data, new_deck)
+        if not (deck["added"] or deck["removed"] or deck["recounted"]):
+            return
+
+        renames = {}
+        for card in deck["removed"]:
+            options = [c for c in deck["added"] if c[:3] == card[:3]]
+            if options:
+                choice = st.selectbox(
+                    f"Replace {card[3:]} with",
+                    [None] + options,
+                    format_func=lambda c: "— drop it —" if c is None else c[3:],
+                    key=_slug_key("update_rename", card),
+                )
+                if choice:
+                    renames[card] = choice
+        migrated, flagged = migrate_guide(
+            deck_data, new_deck, st.session_state.matchups, renames
+        )
+        st.markdown(
+            f"{len(flagged)} of {len(migrated)} matchups will need review after this update."
+        )
+        if st.button("Apply deck update", type="primary", key="apply_deck_update"):
+            st.session_state.deck_data = new_deck
+            st.session_state.card_labels = card_labels_for(new_deck)
+            st.session_state.matchups = migrated
+            st.session_state.review_matchups = flagged
+            # old history entries refer to the previous decklist
+            st.session_state.history = MatchupHistory()
+            _clear_edit_widgets()
+            for key in ("update_mainboard", "update_sideboard"):
+                st.session_state.pop(key, None)
+            st.rerun()
+
+
+def render_review_notes():
+    """Editor: matchups flagged by the last deck update."""
+    flagged = st.session_state.get("review_matchups")
+    if not flagged:
+        return
+    lines = "\n".join(
+        f"- **{name}**: {'; '.join(reasons)}" for name, reasons in flagged.items()
+    )
+    st.warning(f"These matchups changed with the decklist update:\n{lines}")
+    if st.button("Dismiss", key="dismiss_review"):
+        st.session_state.review_matchups = {}
+        st.rerun()
+
+
+# ─── Undo / redo for matchup edits ───────────────────────────────────────────
+class MatchupHistory:
+    """
+    Undo/redo stacks for a list of matchup rows. Edits are recorded as deltas
+    ({card: (old, new)} plus an optional rename) and applied in place, so an
+    entry costs O(cells changed) and rows that were not touched are never copied.
+    Adds and deletes keep the one row they affect.
+    """
+
+    def __init__(self, max_depth: int = 200):
+        self.max_depth = max_depth
+        self._undo = []
+        self._redo = []
+
+    def _push(self, entry: tuple):
+        self._undo.append(entry)
+        if len(self._undo) > self.max_depth:
+            del self._undo[0]
+        self._redo.clear()
+
+    def add(self, matchups: list[dict], row: dict, idx: int | None = None):
+        idx = len(matchups) if idx is None else idx
+        matchups.insert(idx, row)
+        self._push(("add", idx, row))
+
+    def delete(self, matchups: list[dict], idx: int) -> dict:
+        row = matchups.pop(idx)
+        self._push(("delete", idx, row))
+        return row
+
+    def edit(self, matchups: list[dict], idx: int, new_row: dict) -> bool:
+        """Apply `new_row` to matchups[idx] as a delta; False if nothing changed."""
+        row = matchups[idx]
+        old_name, new_name = row["Matchup"], new_row["Matchup"]
+        cells = {}
+        for card in (row.keys() | new_row.keys()) - {"Matchup"}:
+            old, new = row.get(card, ""), new_row.get(card, "")
+            if old != new:
+                cells[card] = (old, new)
+        rename = (old_name, new_name) if old_name != new_name else None
+        if not cells and not rename:
+            return False
+        self._apply_edit(row, rename, cells, forward=True)
+        self._push(("edit", idx, rename, cells, new_name))
+        return True
+
+    @staticmethod
+    def _apply_edit(row: dict, rename, cells: dict, forward: bool):
+        if rename:
+            row["Matchup"] = rename[1] if forward else rename[0]
+        for card, (old, new) in cells.items():
+            value = new if forward else old
+            if value:
+                row[card] = value
+            else:
+                row.pop(card, None)
+
+    @staticmethod
+    def describe(entry: tuple) -> str:
+        kind, _, payload = entry[0], entry[1], entry[2]
+        if kind == "add":
+            return f"add {payload['Matchup']}"
+        if kind == "delete":
+            return f"delete {payload['Matchup']}"
+        if payload and not entry[3]:
+            return f"rename {payload[0]} → {payload[1]}"
+        return f"edit {entry[4]}"
+
+    def _replay(self, entry: tuple, matchups: list[dict], forward: bool):
+        kind, idx = entry[0], entry[1]
+        if kind == "edit":
+            self._apply_edit(matchups[idx], entry[2], entry[3], forward)
+        elif (kind == "add") == forward:
+            matchups.insert(idx, entry[2])
+        else:
+            matchups.pop(idx)
+
+    def undo(self, matchups: list[dict]) -> str | None:
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self._replay(entry, matchups, forward=False)
+        self._redo.append(entry)
+        return self.describe(entry)
+
+    def redo(self, matchups: list[dict]) -> str | None:
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self._replay(entry, matchups, forward=True)
+        self._undo.append(entry)
+        return self.describe(entry)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def next_undo(self) -> str | None:
+        return self.describe(self._undo[-1]) if self._undo else None
+
+    def next_redo(self) -> str | None:
+        return self.describe(self._redo[-1]) if self._redo else None
+
+
+EDIT_WIDGET_PREFIXES = ("edit_out_", "edit_in_", "edit_name_", "edit_draw_")
+
+
+def matchup_ids(matchups: list[dict]) -> list[str]:
+    """
+    A stable id per matchup row, for widget keys. Edits are applied to rows
+    in place, so a row keeps its id through edits and through adds or deletes
+    elsewhere in the list, and its tab's widgets follow it rather than its
+    position. Rows that leave the list are forgotten; undo brings them back
+    under a new id.
+    """
+    registry = st.session_state.setdefault("matchup_ids", {})  # id(row) -> (row, id)
+    ids = []
+    for row in matchups:
+        entry = registry.get(id(row))
+        if entry is None or entry[0] is not row:
+            seq = st.session_state.get("matchup_id_seq", 0)
+            st.session_state.matchup_id_seq = seq + 1
+            entry = registry[id(row)] = (row, f"m{seq}")
+        ids.append(entry[1])
+    live = {id(row) for row in matchups}
+    for key in [k for k in registry if k not in live]:
+        del registry[key]
+    return ids
+
+
+def collect_widget_state(live: dict[str, set[str]]) -> int:
+    """
+    Drop session_state keys named `<prefix><owner>...` whose owner is not in
+    live[prefix], e.g. the inputs of a deleted matchup or a deselected card.
+    Called once per rerun; returns how many keys were removed.
+    """
+    dropped = 0
+    for key in list(st.session_state.keys()):
+        for prefix, owners in live.items():
+            if key.startswith(prefix):
+                if key[len(prefix) :].split("_", 1)[0] not in owners:
+                    del st.session_state[key]
+                    dropped += 1
+                break
+    return dropped
+
+
+def clear_matchup_widgets(matchup_id: str):
+    """Drop one tab's inputs so they re-read its matchup."""
+    for key in list(st.session_state.keys()):
+        for prefix in EDIT_WIDGET_PREFIXES:
+            if key.startswith(prefix):
+                if key[len(prefix) :].split("_", 1)[0] == matchup_id:
+                    del st.session_state[key]
+                break
+
+
+def _clear_edit_widgets():
+    """Drop the editor's per-tab widget state so tabs re-read the matchups."""
+    for key in list(st.session_state.keys()):
+        if key.startswith(EDIT_WIDGET_PREFIXES):
+            del st.session_state[key]
+    st.session_state.confirm_action = None
+    st.session_state.pending_changes = None
+    st.session_state.pending_deletion = None
+
+
+def _undo_or_redo(action: str):  # on_click callback for the Undo/Redo buttons
+    history = st.session_state.history
+    done = getattr(history, action)(st.session_state.matchups)
+    if done:
+        _clear_edit_widgets()
+        st.toast(f"{action.capitalize()}: {done}")
+
+
+def render_history_controls():
+    """Undo/Redo buttons for the editor."""
+    history = st.session_state.setdefault("history", MatchupHistory())
+    col1, col2 = st.columns(2)
+    col1.button(
+        f"Undo {history.next_undo()}" if history.can_undo else "Undo",
+        icon=":material/undo:",
+        disabled=not history.can_undo,
+        use_container_width=True,
+        key="history_undo",
+        on_click=_undo_or_redo,
+        args=("undo",),
+    )
+    col2.button(
+        f"Redo {history.next_redo()}" if history.can_redo else "Redo",
+        icon=":material/redo:",
+        disabled=not history.can_redo,
+        use_container_width=True,
+        key="history_redo",
+        on_click=_undo_or_redo,
+        args=("redo",),
+    )
+
+
+def render_export_settings() -> tuple[str, int]:
+    """
+    Theme and resolution pickers for the PNG/PDF exports, returned as
+    (theme name, dpi). Sits outside one-shot export blocks so it persists.
+    """
+    col1, col2 = st.columns(2)
+    theme = col1.radio(
+        "Export theme",
+        list(EXPORT_THEMES),
+        horizontal=True,
+        key="export_theme",
+        help="Colours for the PNG and PDF. The guide is drawn once and recoloured.",
+    )
+    resolution = col2.selectbox(
+        "Resolution",
+        list(EXPORT_DPI),
+        index=1,
+        key="export_dpi",
+        help="The guide prints at card size (3.5 × 2.5 in); higher DPI means larger files.",
+    )
+    return theme, EXPORT_DPI[resolution]
+
+
+def render_bundle_button(
+    deck_data: dict,
+    df: pd.DataFrame,
+    card_labels: dict[str, str],
+    images: tuple[io.BytesIO, io.BytesIO],
+):
+    """
+    One download with every format, reusing the PNG/PDF already rendered.
+    The ZIP is only built when the button is clicked, so a session doesn't
+    hold a second copy of both images on every rerun.
+    """
+    stem = f"sideboarder_{date.today()}"
+
+    def build_bundle() -> bytes:
+        bundle = io.BytesIO()
+        write_guide_bundle(bundle, deck_data, df, card_labels, stem=stem, images=images)
+        return bundle.getvalue()
+
+    st.download_button(
+        label="Download everything (ZIP)",
+        data=build_bundle,
+        file_name=f"{stem}.zip",
+        mime="application/zip",
+        use_container_width=True,
+        icon=":material/folder_zip:",
+        type="secondary",
+        on_click=record_export,
+        args=("zip",),
+        help="JSON, PNG, PDF and CSV in one file.",
+    )
+
+
 def render_matrix_section():  # Renders the download options
     if not st.session_state.matchups:
         return
@@ -400,14 +3121,11 @@ def render_matrix_section():  # Renders the download options
         Click **Export Options** once you are finished to save your sideboard guide and/or export it to a printable file.
         """
     )
-    df = pd.DataFrame(st.session_state.matchups).set_index("Matchup")
-    mb = sorted(st.session_state.deck_data.get("mainboard", {}).keys())
-    sb = sorted(st.session_state.deck_data.get("sideboard", {}).keys())
-    cols = [c for c in mb if c in df.columns] + [c for c in sb if c in df.columns]
-    df = df[cols][::-1]
-    df = df.loc[:, (df != "").any(axis=0)]
-    st.dataframe(df)
+    df = build_matrix_df(st.session_state.matchups, st.session_state.deck_data)[::-1]
+    st.dataframe(matrix_preview_df(df))
+    render_guide_check(st.session_state.deck_data, st.session_state.matchups)
 
+    theme, dpi = render_export_settings()
     if st.button("Export Options"):
         st.markdown("Select which format you would like to download.")
 
@@ -417,29 +3135,12 @@ def render_matrix_section():  # Renders the download options
 
         # st.markdown("Select which format you would like to download.") :red[If you would like to edit your sideboard guide at a later date, it is recommended to download a JSON file as Sideboarder does not store any user data server-side.]")
         # PNG Render
-        fig = render_matrix_figure(df, st.session_state.card_labels)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300)
-        buf.seek(0)
-        # PDF Render
-        card = Image.open(buf)
-        dpi = 300
-        page_w, page_h = int(8.27 * dpi), int(11.69 * dpi)
-        page = Image.new("RGB", (page_w, page_h), "white")
-        x = (page_w - card.width) // 2
-        y = (page_h - card.height) // 2
-        page.paste(card, (x, y))
-        buf_pdf = io.BytesIO()
-        page.save(buf_pdf, "PDF", resolution=dpi)
-        buf_pdf.seek(0)
+        with track_cache("grid_template"):
+            buf, buf_pdf = render_guide_images(
+                df, st.session_state.card_labels, theme, dpi
+            )
         # JSON Render
-        records = df.reset_index().to_dict(
-            orient="records"
-        )  # serialize to list of records
-        json_str = json.dumps(records, indent=2)
-        matrix_records = df.reset_index().to_dict(orient="records")
-        payload = {"deck_data": st.session_state.deck_data, "matrix": matrix_records}
-        json_str = json.dumps(payload, indent=2)
+        json_str = guide_to_json(st.session_state.deck_data, df)
         col1, col2, col3 = st.columns(3)
         with col1:
             # JSON Download
@@ -451,6 +3152,19 @@ def render_matrix_section():  # Renders the download options
                 use_container_width=True,
                 icon=":material/save:",
                 type="primary",
+                on_click=record_export,
+                args=("json",),
+            )
+            st.download_button(
+                label="Compact save (.sbg)",
+                data=guide_to_compact(st.session_state.deck_data, df),
+                file_name=f"sideboarder_{date.today()}.sbg",
+                mime="application/octet-stream",
+                use_container_width=True,
+                icon=":material/compress:",
+                type="tertiary",
+                on_click=record_export,
+                args=("sbg",),
             )
         with col2:
             # PNG Download
@@ -462,6 +3176,8 @@ def render_matrix_section():  # Renders the download options
                 use_container_width=True,
                 icon=":material/image:",
                 type="secondary",
+                on_click=record_export,
+                args=("png",),
             )
         with col3:
             st.download_button(
@@ -472,77 +3188,375 @@ def render_matrix_section():  # Renders the download options
                 use_container_width=True,
                 icon=":material/insert_drive_file:",
                 type="secondary",
+                on_click=record_export,
+                args=("pdf",),
             )
-            # now we can close the figure
-            plt.close(fig)
+        render_bundle_button(
+            st.session_state.deck_data, df, st.session_state.card_labels, (buf, buf_pdf)
+        )
+        render_share_link(st.session_state.deck_data, df)
+        render_guide_store_saver(st.session_state.deck_data, df)
 
 
-@st.cache_data(show_spinner=False)
+# ─── Matrix layout ───────────────────────────────────────────────────────────
+CARD_POINTS = (252.0, 180.0)  # CARD_SIZE in points
+LABEL_FONT_SIZES = (6, 5.5, 5, 4.5, 4)  # largest first
+READABLE_FONT_SIZE = 5  # split into panels rather than shrink below this
+MAX_PANELS = 4  # front and back of two cards
+LABEL_ROTATION = 50  # degrees, card-name labels along the bottom
+PANEL_PAD = 4.0  # points of padding inside the card edge
+TICK_SPACE = 7.0  # points taken by a tick and its label pad
+_font_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _label_font() -> FT2Font:
+    font = FT2Font(font_manager.findfont(font_manager.FontProperties()))
+    font.set_size(10, 72)
+    return font
+
+
+@functools.lru_cache(maxsize=1024)
+def _glyph_width(char: str) -> float:
+    with _font_lock:  # FT2Font keeps per-call state
+        glyph = _label_font().load_char(ord(char), flags=LoadFlags.NO_HINTING)
+    return glyph.linearHoriAdvance / 65536 / 10
+
+
+def label_width(text: str) -> float:
+    """
+    Width of `text` in points per point of font size, in the figure's font.
+    Sums memoized glyph advances, ignoring kerning, so it errs slightly wide.
+    """
+    return sum(map(_glyph_width, text))
+
+
+# ─── Label abbreviation ──────────────────────────────────────────────────────
+ROW_LABEL_SHARE = 0.3  # of the card width, for matchup names
+COL_LABEL_SHARE = 0.4  # of the card height, for rotated card names
+# whole words or phrases, applied longest first
+ABBREVIATIONS = {
+    "Collected Company": "CoCo",
+    "Lightning Bolt": "Bolt",
+    "Five-Color": "5c",
+    "Four-Color": "4c",
+    "Three-Color": "3c",
+    "Mono Black": "Mono-B",
+    "Mono Blue": "Mono-U",
+    "Mono Green": "Mono-G",
+    "Mono Red": "Mono-R",
+    "Mono White": "Mono-W",
+    "Control": "Ctrl",
+    "Midrange": "Mid",
+    "Company": "Co.",
+    "Planeswalker": "PW",
+    "Elemental": "Elem.",
+    "Aggro": "Agg.",
+}
+_ABBREVIATION_RE = re.compile(
+    r"\b("
+    + "|".join(map(re.escape, sorted(ABBREVIATIONS, key=len, reverse=True)))
+    + r")\b"
+)
+FILLER_WORDS = {"a", "an", "and", "in", "of", "on", "the", "to"}
+MIN_WORD_LENGTH = 3  # letters kept when a word is cut short
+
+
+def _abbreviation_steps(text: str):
+    """Successively shorter forms of `text`, most readable first."""
+    yield text
+    # "Ragavan, Nimble Pilferer" -> "Ragavan"; split cards keep their first face
+    stripped = re.split(r",\s| // ", text, maxsplit=1)[0] or text
+    if stripped != text:
+        yield stripped
+    text = _ABBREVIATION_RE.sub(lambda m: ABBREVIATIONS[m.group(1)], stripped)
+    if text != stripped:
+        yield text
+    words = [w for w in text.split() if w.lower() not in FILLER_WORDS] or text.split()
+    if len(words) < len(text.split()):
+        yield " ".join(words)
+    # cut the longest word down a letter at a time, marking the cut with "."
+    while True:
+        lengths = [len(w.rstrip(".")) for w in words]
+        i = max(range(len(words)), key=lambda k: (lengths[k], -k), default=None)
+        if i is None or lengths[i] <= MIN_WORD_LENGTH or not words[i][0].isalpha():
+            return
+        words[i] = words[i].rstrip(".")[:-1].rstrip("'-") + "."
+        yield " ".join(words)
+
+
+@functools.lru_cache(maxsize=8192)
+def abbreviate(text: str, max_width: float) -> str:
+    """
+    Shortest-needed form of a label that fits in `max_width` (label_width
+    units): drop a card's epithet, apply ABBREVIATIONS, drop filler words,
+    then cut the longest words. Returns the shortest form if none fits.
+    """
+    for short in _abbreviation_steps(text):
+        if label_width(short) <= max_width:
+            return short
+    return short
+
+
+def _unique_prefix(text: str, others: list[str]) -> str:
+    """Shortest prefix of `text` ending in a letter or digit that no other shares."""
+    for end in range(1, len(text) + 1):
+        prefix = text[:end]
+        if prefix[-1].isalnum() and not any(o.startswith(prefix) for o in others):
+            return prefix if end == len(text) else prefix + "."
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def abbreviate_labels(labels: tuple[str, ...], max_width: float) -> tuple[str, ...]:
+    """
+    abbreviate() every label, keeping different labels distinct: labels that
+    shorten to the same text fall back to the shortest prefix of their full
+    text that tells them apart, e.g. "Ragavan, N." and "Ragavan, L.".
+    """
+    short = {text: abbreviate(text, max_width) for text in dict.fromkeys(labels)}
+    groups = {}
+    for text, result in short.items():
+        groups.setdefault(result, []).append(text)
+    for group in groups.values():
+        for text in group if len(group) > 1 else ():
+            short[text] = _unique_prefix(text, [o for o in group if o != text])
+    return tuple(short[text] for text in labels)
+
+
+def _panel_cells(rows, cols, row_width, col_width, font, titled):
+    """(cell width, cell height) in points for a rows × cols panel at `font`."""
+    angle = math.radians(LABEL_ROTATION)
+    left = max(row_width * font + TICK_SPACE, col_width * font * math.cos(angle))
+    bottom = col_width * font * math.sin(angle) + font * math.cos(angle) + TICK_SPACE
+    top = font + PANEL_PAD if titled else 0
+    grid_w = CARD_POINTS[0] - 2 * PANEL_PAD - left
+    grid_h = CARD_POINTS[1] - 2 * PANEL_PAD - bottom - top
+    return grid_w / max(cols, 1), grid_h / max(rows, 1)
+
+
+def _panel_fits(cells, font) -> bool:
+    cell_w, cell_h = cells
+    spacing = min(cell_h, cell_w * math.sin(math.radians(LABEL_ROTATION)))
+    return spacing >= 1.15 * font and min(cell_w, cell_h) >= 1.1 * (font + 1)
+
+
+def _spans(n: int, parts: int) -> list[tuple[int, int]]:
+    size = -(-n // parts)
+    return [(i, min(i + size, n)) for i in range(0, n, size)] or [(0, 0)]
+
+
+@functools.lru_cache(maxsize=256)
+def solve_layout(
+    row_labels: tuple[str, ...], col_labels: tuple[str, ...], titled: bool = False
+) -> dict:
+    """
+    Pick the label font size and how to split a matrix across card panels.
+
+    Tries one panel, then 2 up to MAX_PANELS (splitting card columns, matchup
+    rows or both), and takes the first panel count that fits at
+    READABLE_FONT_SIZE or larger, using its largest font. If nothing is
+    readable, the split with the largest font wins, and failing that the one
+    with the roomiest cells at the smallest font. Labels longer than their
+    share of the card are abbreviated for each font first. Returns {'font',
+    'number_font', 'row_labels', 'col_labels', 'panels'}, where each panel is
+    (row start, row end, column start, column end) in matrix order. Cached per
+    label set; do not mutate.
+    """
+    rows, cols = len(row_labels), len(col_labels)
+    angle = math.radians(LABEL_ROTATION)
+    fitted = {}  # font -> (row labels, column labels, row width, column width)
+    for font in LABEL_FONT_SIZES:
+        short_rows = abbreviate_labels(
+            row_labels, ROW_LABEL_SHARE * CARD_POINTS[0] / font
+        )
+        short_cols = abbreviate_labels(
+            col_labels, COL_LABEL_SHARE * CARD_POINTS[1] / font / math.sin(angle)
+        )
+        fitted[font] = (
+            short_rows,
+            short_cols,
+            max(map(label_width, short_rows), default=0.0),
+            max(map(label_width, short_cols), default=0.0),
+        )
+    best, roomiest = None, None
+    for panels in range(1, MAX_PANELS + 1):
+        for row_parts in (p for p in range(1, panels + 1) if panels % p == 0):
+            col_parts = panels // row_parts
+            if row_parts > max(rows, 1) or col_parts > max(cols, 1):
+                continue
+            shape = (-(-rows // row_parts), -(-cols // col_parts))
+            titled_here = titled or panels > 1
+            for font in LABEL_FONT_SIZES:
+                widths = fitted[font][2:]
+                cells = _panel_cells(*shape, *widths, font, titled_here)
+                if _panel_fits(cells, font):
+                    if best is None or font > best[0]:
+                        best = (font, row_parts, col_parts)
+                    break
+            else:
+                room = min(cells[1], cells[0] * math.sin(angle))
+                if roomiest is None or room > roomiest[0]:
+                    roomiest = (room, font, row_parts, col_parts)
+        if best is not None and best[0] >= READABLE_FONT_SIZE:
+            break
+    font, row_parts, col_parts = best or roomiest[1:]
+    return {
+        "font": font,
+        "number_font": font + 1,
+        "row_labels": fitted[font][0],
+        "col_labels": fitted[font][1],
+        "panels": tuple(
+            (r0, r1, c0, c1)
+            for r0, r1 in _spans(rows, row_parts)
+            for c0, c1 in _spans(cols, col_parts)
+        ),
+    }
+
+
+def _layout_key(df: pd.DataFrame, card_labels: dict[str, str]) -> tuple:
+    cards = [c for c in df.columns if c != DRAW_KEY]
+    titled = DRAW_KEY in df.columns and any(isinstance(d, dict) for d in df[DRAW_KEY])
+    return (
+        tuple(map(str, df.index)),
+        tuple(card_labels.get(c, c) for c in cards),
+        titled,
+    )
+
+
+def matrix_layout(df: pd.DataFrame, card_labels: dict[str, str]) -> dict:
+    """solve_layout for a matrix DataFrame as passed to render_matrix_figure."""
+    return solve_layout(*_layout_key(df, card_labels))
+
+
+# draw-delta dicts defeat Streamlit's default DataFrame hashing
+@st.cache_data(
+    show_spinner=False, hash_funcs={pd.DataFrame: lambda df: df.to_json(orient="split")}
+)
 def render_matrix_figure(
-    df: pd.DataFrame, card_labels: dict[str, str]
+    df: pd.DataFrame, card_labels: dict[str, str], panel: int = 0
 ) -> plt.Figure:  # Renders the image that gets exported
     """
-    Render the sideboard matrix as a matplotlib Figure, caching the result
-    so it only re-draws when `df` or `card_labels` change.
+    Render one card panel of the sideboard matrix (see matrix_layout) as a
+    matplotlib Figure in KEY_COLORS, caching the result so it only re-draws
+    when `df` or `card_labels` change. Pass it through figure_to_indexed and
+    apply_theme/themed_png for display or export.
     """
-    # flip rows so the first index is at the top
+    _record_cache_miss()
+    with METRICS.timer(
+        "sideboarder_render_seconds",
+        help_text="Time spent drawing the sideboard matrix figure.",
+    ):
+        return _draw_matrix_figure(df, card_labels, panel)
+
+
+def _panel_slice(df: pd.DataFrame, layout: dict, panel: int) -> pd.DataFrame:
+    r0, r1, c0, c1 = layout["panels"][panel]
+    cards = [c for c in df.columns if c != DRAW_KEY][c0:c1]
+    return df.iloc[r0:r1][cards + ([DRAW_KEY] if DRAW_KEY in df.columns else [])]
+
+
+def _cell_contents(df: pd.DataFrame):
+    """(texts, colours, split) for one panel, flipped so the first row is at the top."""
     df_export = df[::-1].copy()
+    deltas = df_export.pop(DRAW_KEY) if DRAW_KEY in df_export.columns else None
+
+    def text_and_color(v):
+        if isinstance(v, str) and v.lstrip("+-") not in ("", "0"):
+            return v.lstrip("+-"), KEY_COLORS["in" if v.startswith("+") else "out"]
+        return "", ""
 
     # build a matrix of text + background colors
     matrix = np.empty(df_export.shape, object)
     color_m = np.full(df_export.shape, "", object)
     for i in range(df_export.shape[0]):
         for j in range(df_export.shape[1]):
-            v = df_export.iat[i, j]
-            if isinstance(v, str) and v:
-                matrix[i, j] = v.lstrip("+-")
-                color_m[i, j] = "#9abca7" if v.startswith("+") else "#f7b2ad"
-            else:
-                matrix[i, j] = ""
-
-    # ─── MAGIC CARD SIZING ─────────────────────────────────────────────────
-    # force the figure to Magic card dimensions: 2.5" wide × 3.5" tall
-    fig, ax = plt.subplots(figsize=(3.5, 2.5), constrained_layout=True)
-    ax.set_aspect("auto")
-
-    name_fontsize = 5
-
-    # ────────────────────────────────────────────────────────────────────────────
-
-    ax.set_xlim(0, matrix.shape[1])
-    ax.set_ylim(0, matrix.shape[0])
-
-    # draw cells + numbers
+            matrix[i, j], color_m[i, j] = text_and_color(df_export.iat[i, j])
+
+    # cells whose draw plan differs: (i, j) -> (text, color) on the draw
+    split = {}
+    if deltas is not None:
+        col = {card: j for j, card in enumerate(df_export.columns)}
+        for i, delta in enumerate(deltas):
+            if isinstance(delta, dict):
+                for card, cell in delta.items():
+                    if card in col:  # the card may sit on another panel
+                        split[i, col[card]] = text_and_color(cell)
+    return matrix, color_m, split
+
+
+def _draw_cells(ax, matrix, color_m, split, number_fontsize) -> list:
+    """Draw cells + numbers and return the artists; split cells are play (top-left) / draw (bottom-right)."""
+    artists = []
     for i in range(matrix.shape[0]):
         for j in range(matrix.shape[1]):
-            if matrix[i, j]:
-                ax.add_patch(plt.Rectangle((j, i), 1, 1, color=color_m[i, j]))
-                ax.text(
-                    j + 0.5,
-                    i + 0.5,
-                    matrix[i, j],
-                    ha="center",
-                    va="center",
-                    fontsize=6,
+            if (i, j) in split:
+                draw_text, draw_color = split[i, j]
+                halves = (
+                    ([(j, i), (j, i + 1), (j + 1, i + 1)], 0.3, 0.7, matrix[i, j]),
+                    ([(j, i), (j + 1, i), (j + 1, i + 1)], 0.7, 0.3, draw_text),
                 )
+                colors = (color_m[i, j], draw_color)
+                for (corners, dx, dy, text), color in zip(halves, colors):
+                    if text:
+                        artists.append(
+                            ax.add_patch(plt.Polygon(corners, color=color, lw=0))
+                        )
+                        artists.append(
+                            ax.text(
+                                j + dx,
+                                i + dy,
+                                text,
+                                ha="center",
+                                va="center",
+                                fontsize=number_fontsize - 1.5,
+                            )
+                        )
+                artists += ax.plot(
+                    [j, j + 1], [i, i + 1], color=KEY_COLORS["ink"], lw=0.3
+                )
+            elif matrix[i, j]:
+                artists.append(
+                    ax.add_patch(plt.Rectangle((j, i), 1, 1, color=color_m[i, j]))
+                )
+                artists.append(
+                    ax.text(
+                        j + 0.5,
+                        i + 0.5,
+                        matrix[i, j],
+                        ha="center",
+                        va="center",
+                        fontsize=number_fontsize,
+                    )
+                )
+    return artists
+
+
+def _draw_grid(fig, ax, layout: dict, panel: int, split: bool):
+    """The parts of a panel that only depend on its labels: ticks, frame, titles."""
+    r0, r1, c0, c1 = layout["panels"][panel]
+    name_fontsize = layout["font"]
+    ax.set_aspect("auto")
+    ax.set_xlim(0, c1 - c0)
+    ax.set_ylim(0, r1 - r0)
 
     # ticks + labels
-    ax.set_xticks(np.arange(df_export.shape[1]) + 0.5)
+    ax.set_xticks(np.arange(c1 - c0) + 0.5)
     ax.set_xticklabels(
-        [card_labels.get(c, c) for c in df_export.columns],
-        rotation=50,
+        layout["col_labels"][c0:c1],
+        rotation=LABEL_ROTATION,
         ha="right",
         fontsize=name_fontsize,
     )
-    ax.set_yticks(np.arange(df_export.shape[0]) + 0.5)
-    ax.set_yticklabels(df_export.index, fontsize=name_fontsize)
+    ax.set_yticks(np.arange(r1 - r0) + 0.5)
+    ax.set_yticklabels(layout["row_labels"][r0:r1][::-1], fontsize=name_fontsize)
 
     # Title
     # ax.set_title("Sideboard Guide", fontsize=title_fontsize)
 
     # draw grid behind cells
-    ax.set_xticks(np.arange(matrix.shape[1]), minor=True)
-    ax.set_yticks(np.arange(matrix.shape[0]), minor=True)
+    ax.set_xticks(np.arange(c1 - c0), minor=True)
+    ax.set_yticks(np.arange(r1 - r0), minor=True)
     # ax.grid(which="minor", color="black", alpha=0.5, linestyle="-", linewidth=0.5)
     ax.tick_params(which="minor", size=0)
     for s in ax.spines.values():
@@ -550,14 +3564,115 @@ def render_matrix_figure(
     # flip so the “first” row is at the top
     # ax.invert_yaxis()
 
+    if split:
+        ax.set_title(
+            "◤ on the play   ◢ on the draw", fontsize=name_fontsize - 1, loc="right"
+        )
+    if len(layout["panels"]) > 1:
+        ax.set_title(
+            f"{panel + 1}/{len(layout['panels'])}",
+            fontsize=name_fontsize - 1,
+            loc="left",
+        )
+
     # ─── add a thin black border around the *whole* image ───────────────
-    fig.patch.set_edgecolor("black")
+    fig.patch.set_edgecolor(KEY_COLORS["ink"])
     fig.patch.set_linewidth(1)
     # ─────────────────────────────────────────────────────────────────────
 
+
+def _draw_matrix_figure(
+    df: pd.DataFrame, card_labels: dict[str, str], panel: int = 0
+) -> plt.Figure:
+    layout = matrix_layout(df, card_labels)
+    matrix, color_m, split = _cell_contents(_panel_slice(df, layout, panel))
+
+    # ─── MAGIC CARD SIZING ─────────────────────────────────────────────────
+    # force the figure to Magic card dimensions: 2.5" wide × 3.5" tall
+    fig, ax = plt.subplots(
+        figsize=CARD_SIZE,
+        constrained_layout=True,
+        facecolor=KEY_COLORS["background"],
+    )
+    # ────────────────────────────────────────────────────────────────────────────
+
+    _draw_cells(ax, matrix, color_m, split, layout["number_font"])
+    _draw_grid(fig, ax, layout, panel, bool(split))
     return fig
 
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _grid_template(
+    row_labels: tuple[str, ...],
+    col_labels: tuple[str, ...],
+    titled: bool,
+    panel: int,
+    split: bool,
+    dpi: int,
+) -> dict:
+    """
+    One panel's grid drawn once at `dpi` with no cells, plus a snapshot of
+    its pixels to restore before each guide's cells are drawn over it. The
+    figure is reused, so hold the lock while compositing.
+    """
+    _record_cache_miss()
+    layout = solve_layout(row_labels, col_labels, titled)
+    fig = Figure(
+        figsize=CARD_SIZE,
+        dpi=dpi,
+        constrained_layout=True,
+        facecolor=KEY_COLORS["background"],
+    )
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    _draw_grid(fig, ax, layout, panel, split)
+    fig.canvas.draw()
+    fig.set_layout_engine("none")  # cells must not move the axes
+    # the frame is drawn over the cells each time, so keep it out of the snapshot
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    for spine in ax.spines.values():
+        spine.set_visible(True)
+    return {"fig": fig, "ax": ax, "background": background, "lock": threading.Lock()}
+
+
+def composite_panel(
+    df: pd.DataFrame,
+    card_labels: dict[str, str],
+    panel: int = 0,
+    dpi: int = 300,
+    colors: int = PNG_COLORS,
+) -> Image.Image:
+    """
+    Indexed master of one panel, like figure_to_indexed(render_matrix_figure(...)),
+    but only the cells are drawn: they are composited over a cached
+    _grid_template, so changing counts does not redraw labels and frame.
+    """
+    layout = matrix_layout(df, card_labels)
+    matrix, color_m, split = _cell_contents(_panel_slice(df, layout, panel))
+    template = _grid_template(*_layout_key(df, card_labels), panel, bool(split), dpi)
+    with METRICS.timer(
+        "sideboarder_render_seconds",
+        help_text="Time spent drawing the sideboard matrix figure.",
+    ), template["lock"]:
+        fig, ax = template["fig"], template["ax"]
+        fig.canvas.restore_region(template["background"])
+        artists = _draw_cells(ax, matrix, color_m, split, layout["number_font"])
+        # the frame goes back over the cell edges, as in a full draw
+        for artist in sorted(
+            artists + list(ax.spines.values()), key=lambda a: a.get_zorder()
+        ):
+            ax.draw_artist(artist)
+        for artist in artists:
+            artist.remove()
+        rgba = fig.canvas.buffer_rgba()
+        rgb = Image.frombuffer("RGBA", (rgba.shape[1], rgba.shape[0]), rgba)
+        rgb = rgb.convert("RGB")
+    return _quantize_keyed(rgb, dpi, colors)
+
+
 def render_sidebar():  # Renders the sidebar text and options
     """Render sidebar links, badges, and bug-report expander."""
     st.sidebar.page_link("splash.py", label="Main page", icon=":material/home:")
@@ -572,6 +3687,12 @@ def render_sidebar():  # Renders the sidebar text and options
     st.sidebar.page_link(
         "pages/editor.py", label="Edit a saved guide", icon=":material/edit:"
     )
+    st.sidebar.page_link(
+        "pages/analytics.py", label="Compare team guides", icon=":material/groups:"
+    )
+    st.sidebar.page_link(
+        "pages/print.py", label="Print several guides", icon=":material/print:"
+    )
     with st.sidebar:
         section_divider()
     st.sidebar.write(
@@ -615,16 +3736,234 @@ def submit_bug_report(
     if include_session:
         report_text += f"\n---\nDeck: {st.session_state.get('deck_data')}\nMatchups: {st.session_state.get('matchups')}"
 
-    form_url = "https://docs.google.com/forms/d/e/1FAIpQLSe3VRA_G7MRTM0PHKlErHYMlH3YxTmiL_GuQrw0WaUSwxle4Q/formResponse"
     form_data = {"entry.1096092479": bug_text, "entry.258759295": report_text}
 
     try:
-        requests.post(form_url, data=form_data)
-        st.success("Bug report submitted. Thank you!!")
-    except Exception as e:
+        queued = get_bug_outbox().enqueue(form_data)
+    except (OSError, sqlite3.Error) as e:
         st.error(
             f"Failed to submit bug report: {e}. Please create an issue on [GitHub](https://github.com/NBrichta/mtg-sideboarder) and I'll try to address it as soon as I can."
         )
+        return
+    if queued:
+        st.success("Bug report submitted. Thank you!!")
+    else:
+        st.info("This report has already been submitted. Thank you!!")
+
+
+# ─── Bug report outbox ───────────────────────────────────────────────────────
+BUG_REPORT_URL = "https://docs.google.com/forms/d/e/1FAIpQLSe3VRA_G7MRTM0PHKlErHYMlH3YxTmiL_GuQrw0WaUSwxle4Q/formResponse"
+OUTBOX_LIMITS = {
+    "max_field_bytes": 32 * 1024,  # session dumps can be large
+    "max_pending": 200,  # oldest reports are dropped beyond this
+    "max_attempts": 8,
+    "dedup_seconds": 24 * 3600,  # identical reports within this window are sent once
+}
+OUTBOX_TIMEOUT = (3.05, 10)  # connect, read (seconds) for each POST
+OUTBOX_BACKOFF = (30.0, 3600.0)  # first retry delay, longest delay (seconds)
+OUTBOX_IDLE_SECONDS = 300.0  # the sender re-checks at least this often
+
+_OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    sent_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (sent_at, next_attempt);
+"""
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return text
+    marker = "\n[truncated]"
+    return data[: max_bytes - len(marker)].decode("utf-8", "ignore") + marker
+
+
+class BugReportOutbox:
+    """
+    Bug reports queued in SQLite and posted by a background thread, so the
+    page never waits on the form endpoint and a failed post is retried with
+    exponential backoff instead of lost. Fields are capped in size, the queue
+    in length, and identical reports are only sent once per dedup window.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        url: str = BUG_REPORT_URL,
+        timeout=OUTBOX_TIMEOUT,
+        backoff=OUTBOX_BACKOFF,
+        limits: dict | None = None,
+    ):
+        self.path = path
+        self.url = url
+        self.timeout = timeout
+        self.backoff = backoff
+        self.limits = {**OUTBOX_LIMITS, **(limits or {})}
+        self._wake = threading.Event()
+        self._send_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_OUTBOX_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """A connection that commits (or rolls back) on exit, then is closed."""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, form_data: dict[str, str], now: float | None = None) -> bool:
+        """Queue a report and wake the sender; False if it is a duplicate."""
+        now = time.time() if now is None else now
+        payload = json.dumps(
+            {
+                k: _truncate_utf8(str(v), self.limits["max_field_bytes"])
+                for k, v in form_data.items()
+            },
+            sort_keys=True,
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM outbox WHERE sent_at < ?",
+                (now - self.limits["dedup_seconds"],),
+            )
+            queued = conn.execute(
+                "INSERT OR IGNORE INTO outbox (digest, payload, created_at, next_attempt) "
+                "VALUES (?, ?, ?, ?)",
+                (sha1(payload.encode()).hexdigest(), payload, now, now),
+            ).rowcount
+            dropped = conn.execute(
+                "DELETE FROM outbox WHERE id IN (SELECT id FROM outbox "
+                "WHERE sent_at IS NULL ORDER BY created_at DESC, id DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.limits["max_pending"],),
+            ).rowcount
+        if dropped:
+            self._count("dropped", dropped)
+        if queued:
+            self._wake.set()
+        return bool(queued)
+
+    def pending(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL"
+            ).fetchone()[0]
+
+    def send_due(self, now: float | None = None) -> int:
+        """Post every report that is due once; returns how many were delivered."""
+        now = time.time() if now is None else now
+        with self._send_lock:
+            with self._connect() as conn:
+                due = conn.execute(
+                    "SELECT id, payload, attempts FROM outbox "
+                    "WHERE sent_at IS NULL AND next_attempt <= ? ORDER BY id",
+                    (now,),
+                ).fetchall()
+            sent = 0
+            for report_id, payload, attempts in due:
+                # no transaction is open while posting, so enqueue never waits on it
+                error = self._post(json.loads(payload))
+                with self._connect() as conn:
+                    sent += self._record(conn, report_id, attempts, error, now)
+        return sent
+
+    def _record(self, conn, report_id: int, attempts: int, error, now: float) -> int:
+        if error is None:
+            conn.execute("UPDATE outbox SET sent_at = ? WHERE id = ?", (now, report_id))
+            self._count("sent")
+            return 1
+        attempts += 1
+        permanent = error.startswith("HTTP 4") and error != "HTTP 429"
+        if permanent or attempts >= self.limits["max_attempts"]:
+            conn.execute("DELETE FROM outbox WHERE id = ?", (report_id,))
+            self._count("dropped")
+            return 0
+        delay = min(self.backoff[0] * 2 ** (attempts - 1), self.backoff[1])
+        conn.execute(
+            "UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? "
+            "WHERE id = ?",
+            (attempts, now + delay, error, report_id),
+        )
+        self._count("retried")
+        return 0
+
+    def _post(self, form_data: dict) -> str | None:
+        """None on success, else a short description of the failure."""
+        try:
+            response = requests.post(self.url, data=form_data, timeout=self.timeout)
+        except requests.RequestException as e:
+            return type(e).__name__
+        if response.status_code >= 400:
+            return f"HTTP {response.status_code}"
+        return None
+
+    def seconds_until_due(self, now: float | None = None) -> float:
+        now = time.time() if now is None else now
+        with self._connect() as conn:
+            (next_attempt,) = conn.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE sent_at IS NULL"
+            ).fetchone()
+        if next_attempt is None:
+            return OUTBOX_IDLE_SECONDS
+        return min(max(next_attempt - now, 0.0), OUTBOX_IDLE_SECONDS)
+
+    def _run(self):
+        while True:
+            try:
+                self.send_due()
+                wait = self.seconds_until_due()
+            except sqlite3.Error:
+                wait = OUTBOX_IDLE_SECONDS
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def start(self) -> "BugReportOutbox":
+        threading.Thread(
+            target=self._run, name="sideboarder-bug-outbox", daemon=True
+        ).start()
+        return self
+
+    def _count(self, outcome: str, amount: int = 1):
+        METRICS.inc(
+            "sideboarder_bug_reports_total",
+            amount,
+            help_text="Bug reports leaving the outbox, by outcome.",
+            outcome=outcome,
+        )
+
+
+@st.cache_resource(show_spinner=False)
+def get_bug_outbox() -> BugReportOutbox:
+    """The process-wide outbox, with its sender running."""
+    return BugReportOutbox(bug_outbox_path()).start()
+
+
+def bug_outbox_path() -> str:
+    """
+    SIDEBOARDER_BUG_OUTBOX, or outbox.db in the per-user data directory
+    ($XDG_DATA_HOME/sideboarder, by default ~/.local/share/sideboarder),
+    which unlike the temp directory survives a reboot.
+    """
+    path = os.environ.get("SIDEBOARDER_BUG_OUTBOX")
+    if path:
+        return path
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser(
+        os.path.join("~", ".local", "share")
+    )
+    os.makedirs(os.path.join(data_home, "sideboarder"), exist_ok=True)
+    return os.path.join(data_home, "sideboarder", "outbox.db")
 
 
 def download_sample_json():
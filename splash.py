@@ -15,6 +15,7 @@ st.set_page_config(
     },
 )
 sb_mod.inject_css()
+sb_mod.start_metrics_exporters()
 sb_mod.render_sidebar()
 # 2. Splash screen UI
 st.markdown("<h1 style='text-align:center'>SideBoarder</h1>", unsafe_allow_html=True)
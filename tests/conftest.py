@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import sideboarder_modular as sb_mod
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def blast_cutter_path() -> Path:
+    """The bundled example guide, wherever pytest is run from."""
+    return REPO_ROOT / "static" / "blast_cutter.json"
+
+
+@pytest.fixture
+def blast_cutter_guide(blast_cutter_path) -> dict:
+    """The example guide as load_guide returns it."""
+    with open(blast_cutter_path, "rb") as f:
+        return sb_mod.load_guide(f)
+
+
+@pytest.fixture
+def blast_cutter(blast_cutter_guide):
+    """The example guide as (deck_data, df in display order, labels)."""
+    deck_data = blast_cutter_guide["deck_data"]
+    df = sb_mod.build_matrix_df(blast_cutter_guide["matrix"], deck_data)[::-1]
+    return deck_data, df, sb_mod.card_labels_for(deck_data)
+
+
+@pytest.fixture
+def small_deck() -> dict:
+    """A two-card deck for page tests."""
+    return {"mainboard": {"MB:Ragavan": 4}, "sideboard": {"SB:Dismember": 2}}
+
+
+@pytest.fixture
+def open_page(monkeypatch):
+    """
+    open_page(page, deck_data=None, matchups=None, query_params=None) runs the
+    app from the splash page, as a user arrives, then switches to `page` and
+    returns the AppTest. A deck (with its labels), matchups and query params
+    can be put in place first.
+    """
+    monkeypatch.chdir(REPO_ROOT)  # the pages read ./static and ./images
+
+    def open_page(page, deck_data=None, matchups=None, query_params=None):
+        at = AppTest.from_file(str(REPO_ROOT / "splash.py"), default_timeout=60)
+        if deck_data is not None:
+            at.session_state.deck_data = deck_data
+            at.session_state.card_labels = sb_mod.card_labels_for(deck_data)
+        if matchups is not None:
+            at.session_state.matchups = matchups
+        at.query_params.update(query_params or {})
+        at.run()
+        return at.switch_page(page).run()
+
+    return open_page
@@ -0,0 +1,59 @@
+import sideboarder_modular as sb_mod
+
+
+def test_labels_that_fit_are_left_alone():
+    assert (
+        sb_mod.abbreviate("Ragavan, Nimble Pilferer", 100) == "Ragavan, Nimble Pilferer"
+    )
+
+
+def test_rules_apply_in_order_of_readability():
+    name = "Fable of the Mirror-Breaker // Reflection of Kiki-Jiki"
+    first_face = "Fable of the Mirror-Breaker"
+    assert sb_mod.abbreviate(name, sb_mod.label_width(first_face)) == first_face
+    assert sb_mod.abbreviate("Ragavan, Nimble Pilferer", 8) == "Ragavan"
+    assert sb_mod.abbreviate("Four-Color Omnath Control", 8) == "4c Omnath Ctrl"
+    assert sb_mod.abbreviate("Chained to the Rocks", 8) == "Chained Rocks"
+    short = sb_mod.abbreviate("Experimental Synthesizer", 8)
+    assert short.endswith(".") and sb_mod.label_width(short) <= 8
+
+
+def test_words_are_never_cut_below_the_minimum():
+    short = sb_mod.abbreviate("Urza's Saga, the Rocks", 0.1)
+    assert short == "Urz. Sag."
+    assert all(len(w.rstrip(".")) >= sb_mod.MIN_WORD_LENGTH for w in short.split())
+
+
+def test_collisions_fall_back_to_unique_prefixes():
+    labels = (
+        "Ragavan, Nimble Pilferer",
+        "Ragavan, Legendary Monkey",
+        "Ragavan",
+        "Bolt",
+        "Bolt",
+    )
+    assert sb_mod.abbreviate_labels(labels, 6) == (
+        "Ragavan, N.",
+        "Ragavan, L.",
+        "Ragavan",
+        "Bolt",
+        "Bolt",
+    )
+
+
+def test_widths_come_from_memoized_glyphs():
+    sb_mod._glyph_width.cache_clear()
+    width = sb_mod.label_width("Lightning Bolt")
+    misses = sb_mod._glyph_width.cache_info().misses
+    assert misses == len(set("Lightning Bolt"))
+    assert sb_mod.label_width("Bolt Lightning") == width
+    assert sb_mod._glyph_width.cache_info().misses == misses
+
+
+def test_layout_draws_the_abbreviated_labels():
+    rows = ("Four-Color Omnath Control", "Mono Red Aggro")
+    cols = tuple(f"Card number {i}, the Long Epithet" for i in range(12))
+    layout = sb_mod.solve_layout(rows, cols)
+    assert len(set(layout["col_labels"])) == len(cols)
+    width = sb_mod.COL_LABEL_SHARE * sb_mod.CARD_POINTS[1] / layout["font"]
+    assert all(sb_mod.label_width(c) <= width for c in layout["col_labels"])
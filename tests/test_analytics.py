@@ -0,0 +1,56 @@
+import json
+
+import numpy as np
+
+from sideboarder_modular import consensus_df, guide_consensus, stack_guides
+
+DECK = {"mainboard": {"MB:Bolt": 4}, "sideboard": {"SB:Moon": 3, "SB:Needle": 1}}
+
+
+def _guide(matrix):
+    return {"deck_data": DECK, "matrix": matrix}
+
+
+GUIDES = [
+    _guide([{"Matchup": "Burn", "MB:Bolt": "-2", "SB:Moon": "+2"}]),
+    _guide(
+        [
+            {"Matchup": "burn", "MB:Bolt": "-1", "SB:Needle": "+1"},
+            {"Matchup": "Tron", "MB:Bolt": "-1", "SB:Needle": "+1"},
+        ]
+    ),
+]
+
+
+def test_stack_merges_archetypes_and_tracks_coverage():
+    stacked = stack_guides(GUIDES)
+    assert stacked["archetypes"] == ["Burn", "Tron"]
+    assert stacked["cards"] == ["MB:Bolt", "SB:Moon", "SB:Needle"]
+    assert stacked["stack"].shape == (2, 2, 3)
+    assert stacked["present"].tolist() == [[True, False], [True, True]]
+
+
+def test_consensus_statistics_only_count_covering_guides():
+    stacked = stack_guides(GUIDES)
+    consensus = guide_consensus(stacked)
+    assert consensus["coverage"].tolist() == [2, 1]
+    np.testing.assert_allclose(consensus["mean"][0], [-1.5, 1.0, 0.5])
+    np.testing.assert_allclose(consensus["frequency"][0], [1.0, 0.5, 0.5])
+    np.testing.assert_allclose(consensus["spread"][0], [0.5, 1.0, 0.5])
+    np.testing.assert_allclose(consensus["spread"][1], [0, 0, 0])
+
+    df = consensus_df(stacked, consensus)
+    assert df.loc["Burn"].tolist() == ["-1.5", "+1", "+0.5"]
+    assert df.loc["Tron"].tolist() == ["-1", "", "+1"]
+
+
+def test_page_shows_spread_and_frequency_per_matchup(open_page):
+    at = open_page("pages/analytics.py")
+    for i, guide in enumerate(GUIDES):
+        payload = json.dumps(guide).encode()
+        at.get("file_uploader")[0].upload(f"g{i}.json", payload, "application/json")
+    at.run()
+    assert not at.exception
+    assert [t.label for t in at.tabs] == ["Spread", "How often"]
+    frequency = at.tabs[1].dataframe[0].value
+    assert frequency.loc["Burn", "Moon"] == 0.5
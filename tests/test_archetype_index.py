@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import sideboarder_modular as sb_mod
+from benchmarks.synthetic import synthetic_deck_data
+
+BUNDLED = sb_mod.load_bundled_archetypes.__wrapped__(
+    str(Path(__file__).parent.parent / "static" / "archetypes.json")
+)
+
+
+def _index():
+    index = sb_mod.ArchetypeIndex()
+    for name, aliases in BUNDLED.items():
+        index.add(name, tuple(aliases))
+    return index
+
+
+def test_bundled_names_fit_the_name_field():
+    assert all(len(n) <= 25 for n in BUNDLED)
+
+
+def test_case_aliases_and_typos_resolve_to_one_name():
+    index = _index()
+    assert index.suggest("boros  energy")[0] == "Boros Energy"
+    assert index.suggest("RW Energy")[0] == "Boros Energy"
+    assert index.suggest("Boros Enrgy")[0] == "Boros Energy"
+    assert index.suggest("U/R Murktide")[0] == "Izzet Murktide"
+    assert index.suggest("bor")[0] == "Boros Burn"  # prefixes rank first
+    assert index.suggest("zzzz") == []
+
+
+def test_closest_plan_is_per_deck_and_fuzzy():
+    index = _index()
+    deck = synthetic_deck_data("constructed75", seed=1)
+    other = synthetic_deck_data("constructed75", seed=2)
+    row = {"Matchup": "boros energy", "MB:x": "-2", "SB:y": "+2"}
+    index.remember(deck, [row])
+    assert index.closest_plan(deck, "RW Energy") == row
+    assert index.closest_plan(deck, "Boros Enrgy") == row
+    assert index.closest_plan(deck, "Amulet Titan") is None
+    assert index.closest_plan(other, "Boros Energy") is None
+
+    index.remember(deck, [{"Matchup": "Goblins"}])
+    assert index.suggest("gob")[0] == "Goblins"
+
+
+def test_suggestions_still_resolve_on_a_large_index():
+    # timings live in benchmarks/archetype_search.py
+    index = _index()
+    for i in range(5000):
+        index.add(f"Team Archetype {i}")
+    assert index.suggest("Boros Enrgy")[0] == "Boros Energy"
+    assert index.suggest("RW Energy")[0] == "Boros Energy"
+    assert index.suggest("murk")[0] == "Izzet Murktide"
+    assert index.suggest("team archetype 4999")[0] == "Team Archetype 4999"
+    assert len(index.suggest("team arch", limit=5)) == 5
@@ -0,0 +1,29 @@
+from benchmarks.run_benchmarks import STAGES, compare, run_scenario
+from benchmarks.synthetic import DECK_SHAPES, synthetic_deck_data, synthetic_matchups
+
+
+def test_synthetic_decks_match_their_shapes():
+    for shape, (mb_total, sb_total, _) in DECK_SHAPES.items():
+        deck = synthetic_deck_data(shape)
+        assert sum(deck["mainboard"].values()) == mb_total
+        assert sum(deck["sideboard"].values()) == sb_total
+
+
+def test_synthetic_matchups_respect_deck_quantities():
+    deck = synthetic_deck_data("constructed75")
+    counts = {**deck["mainboard"], **deck["sideboard"]}
+    for row in synthetic_matchups(deck, 20):
+        for card, cell in row.items():
+            if card != "Matchup":
+                assert 1 <= int(cell.lstrip("+-")) <= counts[card]
+
+
+def test_scenario_reports_every_stage_and_compares_to_baseline():
+    results = {"constructed75/5": run_scenario("constructed75", 5, repeats=1)}
+    assert set(results["constructed75/5"]) == set(STAGES)
+    assert compare(results, results, tolerance=0.0) == []
+    halved = {
+        name: {s: {k: v / 2 for k, v in m.items()} for s, m in stages.items()}
+        for name, stages in results.items()
+    }
+    assert any("render" in r for r in compare(results, halved, tolerance=0.0))
@@ -0,0 +1,157 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+import sideboarder_modular as sb_mod
+
+
+class _FormEndpoint(BaseHTTPRequestHandler):
+    """Stand-in for the form: records posts and answers with `status`."""
+
+    status = 200
+    gate = None  # a threading.Event the response waits for, if set
+    received: list
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.received.append({k: v[0] for k, v in parse_qs(body.decode()).items()})
+        self.send_response(self.status)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def endpoint():
+    handler = type("Handler", (_FormEndpoint,), {"received": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}/formResponse"
+    server.shutdown()
+
+
+def _outbox(tmp_path, url, **kwargs):
+    kwargs.setdefault("backoff", (10.0, 40.0))
+    return sb_mod.BugReportOutbox(str(tmp_path / "outbox.db"), url, **kwargs)
+
+
+def test_reports_are_delivered_and_deduplicated(tmp_path, endpoint):
+    handler, url = endpoint
+    outbox = _outbox(tmp_path, url)
+    assert outbox.enqueue({"entry.1": "it broke"})
+    assert not outbox.enqueue({"entry.1": "it broke"})  # double click
+    assert outbox.send_due() == 1
+    assert handler.received == [{"entry.1": "it broke"}]
+    assert not outbox.enqueue({"entry.1": "it broke"})  # already sent
+    assert outbox.pending() == 0
+
+
+def test_failures_back_off_and_survive_a_restart(tmp_path, endpoint):
+    handler, url = endpoint
+    handler.status = 503
+    outbox = _outbox(tmp_path, url)
+    outbox.enqueue({"entry.1": "flaky"}, now=0)
+    assert outbox.send_due(now=0) == 0
+    assert outbox.seconds_until_due(now=0) == 10
+    assert outbox.send_due(now=5) == 0 and len(handler.received) == 1  # not due yet
+    outbox.send_due(now=10)
+    assert outbox.seconds_until_due(now=10) == 20  # doubled
+
+    handler.status = 200
+    reopened = _outbox(tmp_path, url)  # e.g. after an app restart
+    assert reopened.pending() == 1
+    assert reopened.send_due(now=30) == 1
+    assert len(handler.received) == 3
+
+
+def test_rejected_or_exhausted_reports_are_dropped(tmp_path, endpoint):
+    handler, url = endpoint
+    handler.status = 400
+    outbox = _outbox(tmp_path, url, limits={"max_attempts": 2})
+    outbox.enqueue({"entry.1": "bad request"}, now=0)
+    outbox.send_due(now=0)
+    assert outbox.pending() == 0
+
+    handler.status = 500
+    outbox.enqueue({"entry.1": "server down"}, now=0)
+    outbox.send_due(now=0)
+    outbox.send_due(now=100)
+    assert outbox.pending() == 0
+
+
+def test_size_caps(tmp_path, endpoint):
+    handler, url = endpoint
+    outbox = _outbox(tmp_path, url, limits={"max_field_bytes": 100, "max_pending": 3})
+    outbox.enqueue({"entry.1": "é" * 500}, now=0)
+    for i in range(4):
+        outbox.enqueue({"entry.1": f"report {i}"}, now=i + 1)
+    assert outbox.pending() == 3
+    outbox.send_due(now=10)
+    texts = sorted(r["entry.1"] for r in handler.received)
+    assert texts == ["report 1", "report 2", "report 3"]
+    truncated = sb_mod._truncate_utf8("é" * 500, 100)
+    assert len(truncated.encode()) <= 100 and truncated.endswith("[truncated]")
+
+
+def test_slow_endpoints_time_out_instead_of_hanging(tmp_path, endpoint):
+    handler, url = endpoint
+    handler.gate = threading.Event()  # the form never answers in time
+    outbox = _outbox(tmp_path, url, timeout=0.2)
+    outbox.enqueue({"entry.1": "slow"}, now=0)
+    # a hang would wait out the gate and then deliver
+    assert outbox.send_due(now=0) == 0
+    assert outbox.pending() == 1
+    assert outbox.seconds_until_due(now=0) == 10  # retried later, like a 5xx
+    handler.gate.set()
+
+
+def test_outbox_defaults_to_the_user_data_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("SIDEBOARDER_BUG_OUTBOX", raising=False)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+    assert sb_mod.bug_outbox_path() == str(tmp_path / "sideboarder" / "outbox.db")
+    assert (tmp_path / "sideboarder").is_dir()
+
+    monkeypatch.setenv("SIDEBOARDER_BUG_OUTBOX", str(tmp_path / "elsewhere.db"))
+    assert sb_mod.bug_outbox_path() == str(tmp_path / "elsewhere.db")
+
+
+def test_background_sender_delivers_without_blocking(tmp_path, endpoint):
+    # enqueue latency is timed in benchmarks/bug_outbox.py
+    handler, url = endpoint
+    handler.gate = threading.Event()
+    outbox = _outbox(tmp_path, url).start()
+    assert outbox.enqueue({"entry.1": "async"})  # returns while the post is held
+    assert outbox.enqueue({"entry.1": "second"})
+    assert handler.received == [] and outbox.pending() == 2
+    handler.gate.set()
+    deadline = time.time() + 5
+    while outbox.pending() and time.time() < deadline:
+        time.sleep(0.05)
+    assert handler.received == [{"entry.1": "async"}, {"entry.1": "second"}]
+
+
+def test_every_connection_is_closed(tmp_path, endpoint, monkeypatch):
+    handler, url = endpoint
+    opened, connect = [], sb_mod.sqlite3.connect
+
+    def tracked(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(sb_mod.sqlite3, "connect", tracked)
+    outbox = _outbox(tmp_path, url)
+    outbox.enqueue({"entry.1": "closed"}, now=0)
+    outbox.send_due(now=0)
+    outbox.seconds_until_due(now=0)
+    assert outbox.pending() == 0
+
+    assert len(opened) == 6
+    for conn in opened:
+        with pytest.raises(sb_mod.sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
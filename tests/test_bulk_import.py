@@ -0,0 +1,143 @@
+import io
+import json
+import os
+import zipfile
+
+
+import bulk_import
+import sideboarder_modular as sb_mod
+
+
+DUMP = """\
+Boros Energy - alice (1st)
+4 Ragavan, Nimble Pilferer
+4x guide of souls
+2 Fire/Ice
+1 Lightning Bolt (2X2) 117
+3 lightning bolt
+
+Sideboard
+2 Wear // Tear
+SB: 1 Blood Moon
+
+Deck
+4 Primeval Titan
+4 Amulet of Vigor
+
+2 Dismember
+
+Creatures (4)
+4 Urza’s Saga
+"""
+
+
+def test_dump_splits_into_decks_with_canonical_names():
+    decks = list(sb_mod.iter_decklists(io.StringIO(DUMP)))
+    assert [d["name"] for d in decks] == [
+        "Boros Energy - alice (1st)",
+        "Deck 2",
+        "Deck 3",
+    ]
+    boros = decks[0]["deck_data"]
+    assert boros["mainboard"] == {
+        "MB:Ragavan, Nimble Pilferer": 4,
+        "MB:Guide of Souls": 4,
+        "MB:Fire // Ice": 2,
+        "MB:Lightning Bolt": 4,
+    }
+    assert boros["sideboard"] == {"SB:Wear // Tear": 2, "SB:Blood Moon": 1}
+    assert decks[1]["deck_data"]["sideboard"] == {"SB:Dismember": 2}
+    assert decks[2]["deck_data"]["mainboard"] == {"MB:Urza's Saga": 4}
+
+
+def test_dump_is_read_lazily():
+    lines = iter(DUMP.splitlines(keepends=True))
+    first = next(sb_mod.iter_decklists(lines))
+    assert first["name"].startswith("Boros Energy")
+    assert next(lines) == "Deck\n"  # the rest of the dump is still unread
+
+
+def test_skeleton_zip_holds_loadable_guides_and_reports_bad_decks():
+    dump = DUMP + "\nToo Many\n999 Island\n"
+    buf = io.BytesIO()
+    summary = sb_mod.write_skeleton_zip(
+        buf, sb_mod.iter_guide_skeletons(io.StringIO(dump))
+    )
+    assert [row["File"] for row in summary] == [
+        "boros-energy-alice-1st.json",
+        "deck-2.json",
+        "deck-3.json",
+        None,
+    ]
+    assert "quantity" in summary[-1]["Problem"]
+    assert summary[0]["Mainboard"] == 14 and summary[0]["Sideboard"] == 3
+    with zipfile.ZipFile(buf) as bundle:
+        guide = sb_mod.load_guide(io.BytesIO(bundle.read("deck-2.json")))
+    assert guide["matrix"] == []
+    assert guide["deck_data"]["mainboard"]["MB:Primeval Titan"] == 4
+
+
+def test_cli_writes_one_json_per_deck(tmp_path):
+    dump = tmp_path / "dump.txt"
+    dump.write_text(DUMP + "\nDeck 2\n1 Island\n", encoding="utf-8")
+    assert bulk_import.main([str(dump), "--out", str(tmp_path / "out")]) == 0
+    files = sorted(os.listdir(tmp_path / "out"))
+    assert files == [
+        "boros-energy-alice-1st.json",
+        "deck-2-2.json",
+        "deck-2.json",
+        "deck-3.json",
+    ]
+    with open(tmp_path / "out" / "deck-3.json", encoding="utf-8") as f:
+        assert json.load(f)["deck_data"]["mainboard"] == {"MB:Urza's Saga": 4}
+
+
+def test_create_page_opens_a_deck_from_the_dump(open_page):
+    at = open_page("pages/create.py")
+    at.text_area(key="bulk_text").input(DUMP)
+    at.button(key="bulk_build").click().run()
+    assert not at.exception
+    at.selectbox(key="bulk_pick").set_value("deck-2.json")
+    at.button(key="bulk_open").click().run()
+    assert not at.exception
+    assert at.session_state.deck_data["mainboard"] == {
+        "MB:Primeval Titan": 4,
+        "MB:Amulet of Vigor": 4,
+    }
+    assert at.session_state.matchups == []
+
+
+def _skeleton_payload():
+    buf = io.BytesIO()
+    sb_mod.write_skeleton_zip(buf, sb_mod.iter_guide_skeletons(io.StringIO(DUMP)))
+    with zipfile.ZipFile(buf) as bundle:
+        return bundle.read("deck-2.json")
+
+
+def test_print_page_skips_skeletons_with_a_warning(open_page, blast_cutter_path):
+    guide = blast_cutter_path.read_bytes()
+    at = open_page("pages/print.py")
+    uploader = at.get("file_uploader")[0]
+    uploader.upload("deck-2.json", _skeleton_payload(), "application/json")
+    uploader.upload("blast_cutter.json", guide, "application/json")
+    at.run()
+    assert not at.exception
+    assert "no matchups yet" in at.warning[0].value
+    assert any("from 1 guide " in m.value for m in at.markdown)
+    at.button(key="print_build").click().run()
+    assert not at.exception
+
+
+def test_editor_points_skeletons_to_the_create_page(open_page):
+    at = open_page("pages/editor.py")
+    at.get("file_uploader")[0].upload(
+        "deck-2.json", _skeleton_payload(), "application/json"
+    )
+    at.run()
+    assert not at.exception
+    assert "Create page" in at.info[0].value
+
+
+def test_skeletons_yield_no_print_cards():
+    guide = json.loads(_skeleton_payload())
+    assert list(sb_mod.guide_pngs([guide])) == []
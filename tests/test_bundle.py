@@ -0,0 +1,64 @@
+import io
+import zipfile
+
+from PIL import Image
+
+import batch_export
+import sideboarder_modular as sb_mod
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+
+def test_bundle_streams_every_format_into_an_unseekable_file(blast_cutter):
+    deck_data, df, labels = blast_cutter
+    out = _Unseekable()
+    sb_mod.write_guide_bundle(out, deck_data, df, labels, dpi=150, stem="g")
+    bundle = zipfile.ZipFile(io.BytesIO(b"".join(out.chunks)))
+    assert sorted(bundle.namelist()) == ["g.csv", "g.json", "g.pdf", "g.png"]
+    assert sb_mod.load_guide(bundle.open("g.json"))["deck_data"] == deck_data
+    assert bundle.read("g.csv").startswith(b"Matchup,")
+    assert Image.open(bundle.open("g.png")).size == (525, 375)
+    assert bundle.read("g.pdf").startswith(b"%PDF-")
+    assert bundle.getinfo("g.png").compress_type == zipfile.ZIP_STORED
+
+
+def test_bundle_images_match_the_in_app_export(blast_cutter):
+    deck_data, df, labels = blast_cutter
+    buf = io.BytesIO()
+    sb_mod.write_guide_bundle(buf, deck_data, df, labels, dpi=150)
+    png, pdf = sb_mod.render_guide_images(df, labels, "Colour", 150)
+    bundle = zipfile.ZipFile(buf)
+    assert bundle.read("sideboarder.png") == png.getvalue()
+    assert bundle.read("sideboarder.pdf") == pdf.getvalue()
+
+
+def test_bundle_reuses_images_that_are_already_rendered(blast_cutter):
+    deck_data, df, labels = blast_cutter
+    images = (io.BytesIO(b"png bytes"), io.BytesIO(b"pdf bytes"))
+    buf = io.BytesIO()
+    sb_mod.write_guide_bundle(buf, deck_data, df, labels, images=images)
+    bundle = zipfile.ZipFile(buf)
+    assert bundle.read("sideboarder.png") == b"png bytes"
+    assert bundle.read("sideboarder.pdf") == b"pdf bytes"
+
+
+def test_batch_export_writes_one_zip_per_guide(tmp_path, capsys, blast_cutter_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text("{}")
+    code = batch_export.main(
+        [str(blast_cutter_path), str(bad), "--out", str(tmp_path), "--dpi", "150"]
+    )
+    assert code == 1
+    assert zipfile.ZipFile(tmp_path / "blast_cutter.zip").testzip() is None
+    assert not (tmp_path / "bad.zip").exists()
+    assert "bad.json" in capsys.readouterr().err
@@ -0,0 +1,39 @@
+import sideboarder_modular as sb_mod
+from benchmarks.card_search import deck_with
+
+DECK = {
+    "mainboard": {
+        "MB:Lightning Bolt": 4,
+        "MB:Boltwave": 2,
+        "MB:Urza's Saga": 4,
+        "MB:Ragavan, Nimble Pilferer": 4,
+    },
+    "sideboard": {"SB:Blood Moon": 2, "SB:Wear // Tear": 1},
+}
+
+
+def test_prefixes_rank_before_word_prefixes_and_substrings():
+    index = sb_mod.CardSearchIndex(DECK)
+    assert index.search("bolt") == ["MB:Boltwave", "MB:Lightning Bolt"]
+    assert index.search("saga") == ["MB:Urza's Saga"]
+    assert index.search("imbl") == ["MB:Ragavan, Nimble Pilferer"]
+    assert index.search("NIMBLE pil") == ["MB:Ragavan, Nimble Pilferer"]
+    assert index.search("") == list(index.labels)
+
+
+def test_zone_and_used_filters():
+    index = sb_mod.CardSearchIndex(DECK)
+    assert index.search("o", zone="sideboard") == ["SB:Blood Moon"]
+    used = sb_mod.used_cards(
+        [{"Matchup": "Burn", "MB:Boltwave": "-2", "SB:Blood Moon": "", "SB:x": "+1"}]
+    )
+    assert used == {"MB:Boltwave", "SB:x"}
+    assert index.search("bolt", exclude=used) == ["MB:Lightning Bolt"]
+    assert index.search("", zone="mainboard", only=used) == ["MB:Boltwave"]
+
+
+def test_index_is_cached_per_deck():
+    deck = deck_with(300)
+    key = sb_mod.deck_hash(deck)
+    assert sb_mod.get_card_index(key, deck) is sb_mod.get_card_index(key, deck)
+    assert len(sb_mod.get_card_index(key, deck).search("", "sideboard")) == 50
@@ -0,0 +1,31 @@
+import io
+
+import pytest
+
+import sideboarder_modular as sb_mod
+from benchmarks.synthetic import synthetic_deck_data, synthetic_matchups
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_compact_round_trips_the_json_guide(compress, blast_cutter_guide):
+    guide = blast_cutter_guide
+    data = sb_mod.encode_guide_compact(guide["deck_data"], guide["matrix"], compress)
+    assert sb_mod.load_guide(io.BytesIO(data)) == guide
+
+
+def test_compact_is_much_smaller_than_json():
+    deck = synthetic_deck_data("constructed75")
+    df = sb_mod.build_matrix_df(synthetic_matchups(deck, 15), deck)
+    assert len(sb_mod.guide_to_compact(deck, df)) * 10 < len(
+        sb_mod.guide_to_json(deck, df)
+    )
+
+
+def test_rejects_newer_versions_and_truncated_data(blast_cutter_guide):
+    guide = blast_cutter_guide
+    data = sb_mod.encode_guide_compact(guide["deck_data"], guide["matrix"], False)
+    newer = data[:3] + bytes([sb_mod.COMPACT_FORMAT_VERSION + 1]) + data[4:]
+    with pytest.raises(sb_mod.GuideValidationError, match="newer"):
+        sb_mod.decode_guide_compact(newer)
+    with pytest.raises(sb_mod.GuideValidationError, match="truncated|malformed"):
+        sb_mod.decode_guide_compact(data[:40])
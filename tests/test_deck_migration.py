@@ -0,0 +1,33 @@
+from sideboarder_modular import migrate_guide
+
+OLD_DECK = {
+    "mainboard": {"MB:Bolt": 4, "MB:Chain": 4, "MB:Ragavan": 4},
+    "sideboard": {"SB:Moon": 3, "SB:Needle": 2},
+}
+MATCHUPS = [
+    {"Matchup": "Burn", "MB:Chain": "-3", "SB:Moon": "+3"},
+    {"Matchup": "Tron", "MB:Ragavan": "-2", "SB:Needle": "+2"},
+    {"Matchup": "Affinity", "MB:Bolt": "-1", "SB:Needle": "+1"},
+]
+
+
+def test_swaps_clamps_and_flags_only_affected_matchups():
+    new_deck = {
+        "mainboard": {"MB:Bolt": 4, "MB:Skewer": 4, "MB:Ragavan": 4},
+        "sideboard": {"SB:Moon": 2, "SB:Needle": 2},
+    }
+    migrated, flagged = migrate_guide(
+        OLD_DECK, new_deck, MATCHUPS, renames={"MB:Chain": "MB:Skewer"}
+    )
+    assert migrated[0] == {"Matchup": "Burn", "MB:Skewer": "-3", "SB:Moon": "+2"}
+    assert migrated[1] is MATCHUPS[1] and migrated[2] is MATCHUPS[2]
+    assert list(flagged) == ["Burn"]
+    assert "Moon reduced from 3 to 2 copies" in flagged["Burn"]
+
+
+def test_removed_cards_are_dropped_and_flagged():
+    new_deck = {"mainboard": dict(OLD_DECK["mainboard"]), "sideboard": {"SB:Moon": 3}}
+    migrated, flagged = migrate_guide(OLD_DECK, new_deck, MATCHUPS)
+    assert migrated[1] == {"Matchup": "Tron", "MB:Ragavan": "-2"}
+    assert set(flagged) == {"Tron", "Affinity"}
+    assert MATCHUPS[1]["SB:Needle"] == "+2"  # input rows are not mutated
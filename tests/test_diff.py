@@ -0,0 +1,54 @@
+import numpy as np
+
+from sideboarder_modular import (
+    diff_decks,
+    diff_guides,
+    format_cell_changes,
+    matchups_to_array,
+)
+
+OLD = [
+    {"Matchup": "Burn", "MB:Bolt": "-2", "SB:Moon": "+2"},
+    {"Matchup": "Tron", "MB:Ragavan": "-1", "SB:Needle": "+1"},
+    {"Matchup": "Affinity", "MB:Bolt": "-1", "SB:Moon": "+1"},
+]
+
+
+def test_matchups_to_array_is_signed_and_sparse():
+    arr = matchups_to_array(OLD, ["MB:Bolt", "SB:Moon"])
+    assert arr.tolist() == [[-2, 2], [0, 0], [-1, 1]]
+    assert arr.dtype == np.int16
+
+
+def test_diff_reports_renames_additions_removals_and_cell_changes():
+    new = [
+        {"Matchup": "Mono-R Burn", "MB:Bolt": "-2", "SB:Moon": "+2"},
+        {"Matchup": "tron", "MB:Ragavan": "-2", "SB:Needle": "+1"},
+        {"Matchup": "Living End", "SB:Needle": "+1"},
+    ]
+    diff = diff_guides(OLD, new)
+    assert diff["renamed"] == [("Burn", "Mono-R Burn"), ("Tron", "tron")]
+    assert diff["added"] == ["Living End"]
+    assert diff["removed"] == ["Affinity"]
+    assert diff["changed"] == [
+        {"matchup": "tron", "old_matchup": "Tron", "cells": [("MB:Ragavan", -1, -2)]}
+    ]
+    labels = {"MB:Ragavan": "Ragavan"}
+    assert format_cell_changes(diff["changed"][0]["cells"], labels) == ["+1 Ragavan"]
+
+
+def test_single_matchup_edit_pairs_by_position():
+    diff = diff_guides([OLD[0]], [{"Matchup": "Boros", "MB:Bolt": "-1"}])
+    assert diff["renamed"] == [("Burn", "Boros")]
+    assert not diff["added"] and not diff["removed"]
+    assert diff["changed"][0]["cells"] == [("MB:Bolt", -2, -1), ("SB:Moon", 2, 0)]
+
+
+def test_diff_decks():
+    old = {"mainboard": {"MB:Bolt": 4}, "sideboard": {"SB:Moon": 2}}
+    new = {"mainboard": {"MB:Bolt": 3, "MB:Chain": 1}, "sideboard": {}}
+    assert diff_decks(old, new) == {
+        "added": ["MB:Chain"],
+        "removed": ["SB:Moon"],
+        "recounted": [("MB:Bolt", 4, 3)],
+    }
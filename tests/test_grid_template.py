@@ -0,0 +1,40 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import sideboarder_modular as sb_mod
+from tests.test_play_draw import DECK, PLAIN, ROW
+
+
+@pytest.fixture
+def play_draw():
+    return (
+        DECK,
+        sb_mod.build_matrix_df([ROW, PLAIN], DECK),
+        sb_mod.card_labels_for(DECK),
+    )
+
+
+@pytest.mark.parametrize("guide", ["blast_cutter", "play_draw"])
+def test_composited_cells_match_a_full_draw(guide, request):
+    _, df, labels = request.getfixturevalue(guide)
+    fig = sb_mod._draw_matrix_figure(df, labels)
+    try:
+        full = np.asarray(sb_mod.figure_to_indexed(fig, 100).convert("RGB"), int)
+    finally:
+        plt.close(fig)
+    for _ in range(2):  # a fresh template, then the reused one
+        composite = sb_mod.composite_panel(df, labels, dpi=100)
+        assert np.array_equal(np.asarray(composite.convert("RGB"), int), full)
+
+
+def test_count_changes_reuse_the_template(blast_cutter):
+    _, df, labels = blast_cutter
+    sb_mod.composite_panel(df, labels, dpi=100)
+    sb_mod._cache_local.missed = False
+    edited = df.copy()
+    edited.iat[0, 0] = "-4" if edited.iat[0, 0] != "-4" else "-3"
+    before = sb_mod.composite_panel(df, labels, dpi=100)
+    after = sb_mod.composite_panel(edited, labels, dpi=100)
+    assert not sb_mod._cache_local.missed
+    assert before.tobytes() != after.tobytes()
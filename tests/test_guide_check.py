@@ -0,0 +1,29 @@
+from sideboarder_modular import check_guide
+
+DECK = {
+    "mainboard": {"MB:Bolt": 4, "MB:Ragavan": 4},
+    "sideboard": {"SB:Moon": 2, "SB:Needle": 1, "SB:Crypt": 1},
+}
+
+
+def test_reports_each_kind_of_issue():
+    matchups = [
+        {"Matchup": "Burn", "MB:Bolt": "-2", "SB:Moon": "+2"},
+        {"Matchup": "Tron", "MB:Bolt": "-1", "SB:Moon": "+3"},
+        {"Matchup": "burn ", "MB:Bolt": "-1", "MB:Ragavan": "+1", "SB:Needle": "+1"},
+    ]
+    report = check_guide(DECK, matchups)
+    assert report["unbalanced"] == [("Tron", 1, 3), ("burn ", 1, 2)]
+    assert report["over_limit"] == [("Tron", "SB:Moon", 3, 2)]
+    assert report["wrong_direction"] == [("burn ", "MB:Ragavan")]
+    assert report["unused_sideboard"] == ["SB:Crypt"]
+    assert report["always_cut"] == ["MB:Bolt"]
+    assert report["duplicate_names"] == ["burn "]
+
+
+def test_clean_guide_has_no_issues():
+    matchups = [
+        {"Matchup": "Burn", "MB:Bolt": "-2", "SB:Moon": "+2"},
+        {"Matchup": "Tron", "MB:Ragavan": "-2", "SB:Needle": "+1", "SB:Crypt": "+1"},
+    ]
+    assert not any(check_guide(DECK, matchups).values())
@@ -0,0 +1,39 @@
+import io
+import json
+
+import pytest
+
+from sideboarder_modular import GuideValidationError, load_guide
+
+
+def _guide(matrix):
+    deck = {"mainboard": {"MB:Lightning Bolt": 4}, "sideboard": {"SB:Blood Moon": 2}}
+    return io.BytesIO(json.dumps({"deck_data": deck, "matrix": matrix}).encode())
+
+
+def test_sample_guide_loads_with_nan_cells_dropped(blast_cutter_path):
+    with open(blast_cutter_path, "rb") as f:
+        guide = load_guide(f)
+    assert len(guide["matrix"]) == 9
+    for row in guide["matrix"]:
+        assert all(isinstance(v, str) and v for v in row.values())
+
+
+def test_rejects_files_over_the_size_limit_before_parsing():
+    with pytest.raises(GuideValidationError, match="larger than"):
+        load_guide(io.BytesIO(b" " * 2048), limits={"max_bytes": 1024})
+
+
+def test_reports_the_offending_cell():
+    bad = _guide([{"Matchup": "Burn", "MB:Lightning Bolt": "+2"}])
+    with pytest.raises(GuideValidationError, match=r"matrix\[0\] \(Burn\)"):
+        load_guide(bad)
+    too_many = _guide([{"Matchup": "Burn", "SB:Blood Moon": "+3"}])
+    with pytest.raises(GuideValidationError, match="exceeds the 2"):
+        load_guide(too_many)
+
+
+def test_enforces_matchup_limit():
+    rows = [{"Matchup": f"Deck {i}", "MB:Lightning Bolt": "-1"} for i in range(3)]
+    with pytest.raises(GuideValidationError, match="3 matchups"):
+        load_guide(_guide(rows), limits={"max_matchups": 2})
@@ -0,0 +1,115 @@
+import pytest
+
+import sideboarder_modular as sb_mod
+from benchmarks.synthetic import synthetic_deck_data, synthetic_matchups
+
+
+def _store(tmp_path):
+    return sb_mod.GuideStore(str(tmp_path / "guides.db"))
+
+
+def test_save_load_and_update_are_owner_scoped(tmp_path):
+    store = _store(tmp_path)
+    deck = synthetic_deck_data("constructed75")
+    matchups = synthetic_matchups(deck, 5)
+    guide_id = store.save("alice-token", deck, matchups, title="RW Energy")
+
+    assert store.load(guide_id, "alice-token")["matrix"] == matchups
+    assert store.load(guide_id, "mallory-token") is None
+
+    assert store.save("alice-token", deck, matchups[:2], guide_id=guide_id) == guide_id
+    assert len(store.load(guide_id, "alice-token")["matrix"]) == 2
+
+
+def test_listing_by_deck_and_archetype_with_pagination(tmp_path):
+    store = _store(tmp_path)
+    deck_a = synthetic_deck_data("constructed75", seed=1)
+    deck_b = synthetic_deck_data("constructed75", seed=2)
+    for i in range(5):
+        deck = deck_a if i % 2 else deck_b
+        store.save("owner", deck, synthetic_matchups(deck, 3, seed=i), title=f"g{i}")
+
+    assert [g["title"] for g in store.list_guides("owner", deck=deck_a)] == ["g3", "g1"]
+    assert len(store.list_guides("owner", archetype="  archetype 1 ")) == 5
+
+    first = store.list_guides("owner", limit=2)
+    second = store.list_guides("owner", before_id=first[-1]["id"], limit=2)
+    assert [g["title"] for g in first + second] == ["g4", "g3", "g2", "g1"]
+
+
+def test_archetype_lookup_uses_the_index(tmp_path):
+    store = _store(tmp_path)
+    with store._connect() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT guide_id FROM guide_archetypes WHERE archetype = ?",
+            ("burn",),
+        ).fetchall()
+    assert "SEARCH" in str(plan)
+
+
+def test_loading_a_guide_deleted_after_listing_shows_an_error(
+    tmp_path, monkeypatch, open_page
+):
+    monkeypatch.setenv("SIDEBOARDER_GUIDE_DB", str(tmp_path / "guides.db"))
+    sb_mod.get_guide_store.clear()
+    store = sb_mod.get_guide_store()
+    deck = synthetic_deck_data("constructed75")
+    guide_id = store.save("owner", deck, synthetic_matchups(deck, 2), title="Gone")
+
+    at = open_page("pages/editor.py")
+    at.text_input(key="store_owner").input("owner").run()
+    # deleted between listing and loading, e.g. from another session
+    monkeypatch.setattr(store, "load", lambda guide_id, owner_token: None)
+    at.button(key=f"store_load_{guide_id}").click().run()
+    sb_mod.get_guide_store.clear()
+
+    assert not at.exception
+    assert "no longer available" in at.error[0].value
+    assert "deck_data" not in at.session_state
+
+
+def test_changing_owner_or_filter_goes_back_to_the_newest_page(
+    tmp_path, monkeypatch, open_page
+):
+    monkeypatch.setenv("SIDEBOARDER_GUIDE_DB", str(tmp_path / "guides.db"))
+    sb_mod.get_guide_store.clear()
+    store = sb_mod.get_guide_store()
+    deck = synthetic_deck_data("constructed75")
+    for i in range(sb_mod.GUIDE_PAGE_SIZE + 1):
+        store.save("owner", deck, synthetic_matchups(deck, 1, seed=i), title=f"g{i}")
+
+    at = open_page("pages/editor.py")
+    at.text_input(key="store_owner").input("owner").run()
+    next(b for b in at.button if b.label == "Older").click().run()
+    assert len(at.session_state.store_pages) == 2
+
+    at.text_input(key="store_filter").input("burn").run()
+    assert at.session_state.store_pages == [None]
+    at.text_input(key="store_filter").input("").run()
+    next(b for b in at.button if b.label == "Older").click().run()
+    at.text_input(key="store_owner").input("someone-else").run()
+    sb_mod.get_guide_store.clear()
+
+    assert not at.exception
+    assert at.session_state.store_pages == [None]
+
+
+def test_every_connection_is_closed(tmp_path, monkeypatch):
+    opened, connect = [], sb_mod.sqlite3.connect
+
+    def tracked(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(sb_mod.sqlite3, "connect", tracked)
+    store = _store(tmp_path)
+    deck = synthetic_deck_data("constructed75")
+    guide_id = store.save("owner", deck, synthetic_matchups(deck, 2))
+    store.load(guide_id, "owner")
+    store.list_guides("owner")
+    store.delete(guide_id, "owner")
+
+    assert len(opened) == 5
+    for conn in opened:
+        with pytest.raises(sb_mod.sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,64 @@
+import copy
+
+import sideboarder_modular as sb_mod
+from sideboarder_modular import MatchupHistory
+
+
+def _matchups():
+    return [
+        {"Matchup": "Burn", "MB:Lightning Bolt": "-2", "SB:Blood Moon": "+2"},
+        {"Matchup": "Tron", "MB:Ragavan": "-1", "SB:Dismember": "+1"},
+    ]
+
+
+def test_edit_undo_redo_restores_each_state():
+    matchups, history = _matchups(), MatchupHistory()
+    before = copy.deepcopy(matchups)
+    history.edit(matchups, 0, {"Matchup": "Mono-R Burn", "MB:Lightning Bolt": "-1"})
+    after = copy.deepcopy(matchups)
+
+    assert history.undo(matchups) == "edit Mono-R Burn"
+    assert matchups == before
+    history.redo(matchups)
+    assert matchups == after
+
+
+def test_edit_entries_store_only_the_changed_cells():
+    matchups, history = _matchups(), MatchupHistory()
+    history.edit(matchups, 1, {**matchups[1], "Matchup": "Eldrazi Tron"})
+    kind, idx, rename, cells, _ = history._undo[-1]
+    assert (kind, idx, rename, cells) == ("edit", 1, ("Tron", "Eldrazi Tron"), {})
+    assert history.next_undo() == "rename Tron → Eldrazi Tron"
+    assert not history.edit(matchups, 1, dict(matchups[1]))
+
+
+def test_delete_and_add_undo_in_place_and_history_is_bounded():
+    matchups, history = _matchups(), MatchupHistory(max_depth=3)
+    before = copy.deepcopy(matchups)
+    history.delete(matchups, 0)
+    history.add(matchups, {"Matchup": "Affinity", "MB:Ragavan": "-1"})
+    history.undo(matchups)
+    history.undo(matchups)
+    assert matchups == before
+    assert not history.can_undo and history.can_redo
+
+    for i in range(10):
+        history.add(matchups, {"Matchup": f"Deck {i}"})
+    assert len(history._undo) == 3 and not history.can_redo
+
+
+def test_matchups_added_on_the_create_page_can_be_undone(open_page, small_deck):
+    at = open_page("pages/create.py", deck_data=small_deck)
+    at.text_input(key="tmp_opponent_name").input("Burn")
+    at.multiselect(key="tmp_search_out").select("MB:Ragavan")
+    at.multiselect(key="tmp_search_in").select("SB:Dismember")
+    at.run()
+    at.number_input(key=sb_mod._slug_key("tmp_qty_out", "MB:Ragavan")).set_value(1)
+    at.number_input(key=sb_mod._slug_key("tmp_qty_in", "SB:Dismember")).set_value(1)
+    at.button(key="add_matchup").click().run()
+    at.button(key="confirm_matchup").click().run()
+    assert [m["Matchup"] for m in at.session_state.matchups] == ["Burn"]
+
+    at.button(key="history_undo").click().run()
+    assert not at.exception
+    assert at.session_state.matchups == []
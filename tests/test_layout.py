@@ -0,0 +1,76 @@
+import matplotlib.pyplot as plt
+
+import sideboarder_modular as sb_mod
+
+SHORT = tuple(f"Deck {i}" for i in range(8))
+CARDS = tuple(f"Card {i}" for i in range(12))
+
+
+def _covered(layout, rows, cols):
+    cells = [
+        (r, c)
+        for r0, r1, c0, c1 in layout["panels"]
+        for r in range(r0, r1)
+        for c in range(c0, c1)
+    ]
+    return sorted(cells) == [(r, c) for r in range(rows) for c in range(cols)]
+
+
+def test_label_width_scales_with_text():
+    assert sb_mod.label_width("") == 0
+    assert (
+        0 < sb_mod.label_width("Bolt") < sb_mod.label_width("Ragavan, Nimble Pilferer")
+    )
+
+
+def test_small_guides_stay_on_one_readable_panel():
+    layout = sb_mod.solve_layout(SHORT, CARDS)
+    assert len(layout["panels"]) == 1
+    assert layout["font"] == max(sb_mod.LABEL_FONT_SIZES)
+    assert _covered(layout, len(SHORT), len(CARDS))
+
+
+def test_crowded_guides_split_into_panels_that_cover_every_cell():
+    rows = tuple(f"Archetype number {i}" for i in range(40))
+    cols = tuple(f"Some long card name, {i}" for i in range(30))
+    layout = sb_mod.solve_layout(rows, cols)
+    assert 1 < len(layout["panels"]) <= sb_mod.MAX_PANELS
+    assert _covered(layout, len(rows), len(cols))
+    assert layout["font"] >= min(sb_mod.LABEL_FONT_SIZES)
+
+
+def test_layout_is_solved_once_per_label_set():
+    sb_mod.solve_layout.cache_clear()
+    first = sb_mod.solve_layout(SHORT, CARDS, True)
+    assert sb_mod.solve_layout(SHORT, CARDS, True) is first
+    assert sb_mod.solve_layout.cache_info().hits == 1
+
+
+def test_each_panel_renders_its_own_slice():
+    deck = {
+        "mainboard": {f"MB:{name} of the long card name": 4 for name in "ABCDEFGHIJ"},
+        "sideboard": {f"SB:{name} of the long card name": 2 for name in "KLMNOPQRST"},
+    }
+    matchups = [
+        {
+            "Matchup": f"Opponent archetype {i}",
+            "MB:A of the long card name": "-2",
+            "SB:T of the long card name": "+2",
+            "Draw": {"SB:T of the long card name": "+1"},
+        }
+        for i in range(30)
+    ]
+    df = sb_mod.build_matrix_df(matchups, deck)
+    labels = sb_mod.card_labels_for(deck)
+    layout = sb_mod.matrix_layout(df, labels)
+    assert len(layout["panels"]) > 1
+    for panel, (r0, r1, c0, c1) in enumerate(layout["panels"]):
+        fig = sb_mod._draw_matrix_figure(df, labels, panel)
+        ax = fig.axes[0]
+        assert len(ax.get_yticklabels()) == r1 - r0
+        assert len(ax.get_xticklabels()) == c1 - c0
+        assert ax.get_title(loc="left") == f"{panel + 1}/{len(layout['panels'])}"
+        plt.close(fig)
+    masters = sb_mod.render_panels(df, labels, dpi=50)
+    stacked = sb_mod.stack_panels(masters, gap=5)
+    assert stacked.height == sum(m.height for m in masters) + 5 * (len(masters) - 1)
@@ -0,0 +1,13 @@
+from benchmarks.load_test import STEPS, percentile, simulate_session
+
+
+def test_percentile_uses_nearest_rank():
+    values = [0.1, 0.2, 0.3, 0.4]
+    assert percentile(values, 50) == 0.2
+    assert percentile(values, 99) == 0.4
+    assert percentile([], 95) == 0.0
+
+
+def test_simulated_session_walks_every_step():
+    latencies = simulate_session(n_matchups=1)
+    assert set(latencies) == set(STEPS)
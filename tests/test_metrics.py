@@ -0,0 +1,42 @@
+import socket
+
+import sideboarder_modular as sb_mod
+from sideboarder_modular import MetricsRegistry
+
+
+def test_counters_and_histograms_render_as_prometheus_text():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.inc("sideboarder_exports_total", format="png")
+    registry.inc("sideboarder_exports_total", format="png")
+    registry.observe("sideboarder_render_seconds", 0.05)
+    registry.observe("sideboarder_render_seconds", 0.5)
+
+    text = registry.render_prometheus()
+    assert "# TYPE sideboarder_exports_total counter" in text
+    assert 'sideboarder_exports_total{format="png"} 2' in text
+    assert 'sideboarder_render_seconds_bucket{le="0.1"} 1' in text
+    assert 'sideboarder_render_seconds_bucket{le="1"} 2' in text
+    assert 'sideboarder_render_seconds_bucket{le="+Inf"} 2' in text
+    assert "sideboarder_render_seconds_count 2" in text
+
+
+def test_dump_writes_metrics_file(tmp_path):
+    registry = MetricsRegistry()
+    registry.inc("sideboarder_parses_total")
+    path = tmp_path / "sideboarder.prom"
+    registry.dump(str(path))
+    assert "sideboarder_parses_total 1" in path.read_text()
+
+
+def test_a_busy_metrics_port_is_logged_not_raised(monkeypatch, caplog):
+    busy = socket.socket()
+    busy.bind(("127.0.0.1", 0))
+    busy.listen()
+    monkeypatch.delenv("SIDEBOARDER_METRICS_FILE", raising=False)
+    monkeypatch.setenv("SIDEBOARDER_METRICS_PORT", str(busy.getsockname()[1]))
+    try:
+        started = sb_mod.start_metrics_exporters.__wrapped__()
+    finally:
+        busy.close()
+    assert started == {}
+    assert "Not serving /metrics" in caplog.text
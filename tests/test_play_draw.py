@@ -0,0 +1,81 @@
+import io
+
+import matplotlib.pyplot as plt
+import pytest
+
+import sideboarder_modular as sb_mod
+
+DECK = {
+    "mainboard": {"MB:Bolt": 4, "MB:Saga": 4},
+    "sideboard": {"SB:Moon": 2, "SB:Needle": 1},
+}
+# on the draw: Saga stays in and only one Moon comes in
+ROW = {
+    "Matchup": "Tron",
+    "MB:Bolt": "-2",
+    "MB:Saga": "-1",
+    "SB:Moon": "+2",
+    "SB:Needle": "+1",
+    "Draw": {"MB:Saga": "0", "SB:Moon": "+1"},
+}
+PLAIN = {"Matchup": "Burn", "MB:Saga": "-2", "SB:Moon": "+2"}
+
+
+def test_draw_plan_applies_the_delta_and_draw_delta_inverts_it():
+    draw = sb_mod.draw_plan(ROW)
+    assert draw == {"MB:Bolt": "-2", "SB:Moon": "+1", "SB:Needle": "+1"}
+    assert sb_mod.draw_delta(sb_mod.plan_cells(ROW), draw) == ROW["Draw"]
+    assert sb_mod.draw_plan(PLAIN) == sb_mod.plan_cells(PLAIN)
+
+
+@pytest.mark.parametrize("fmt", ["json", "sbg"])
+def test_draw_deltas_survive_both_save_formats(fmt):
+    df = sb_mod.build_matrix_df([ROW, PLAIN], DECK)
+    if fmt == "json":
+        data = sb_mod.guide_to_json(DECK, df).encode()
+    else:
+        data = sb_mod.guide_to_compact(DECK, df)
+    matrix = sb_mod.load_guide(io.BytesIO(data))["matrix"]
+    assert matrix[0] == ROW
+    assert "Draw" not in matrix[1]
+
+
+def test_version_1_compact_files_still_load():
+    data = bytearray(sb_mod.encode_guide_compact(DECK, [PLAIN], compress=False))
+    # strip the (empty) draw section: name, n_cells, cells, then one zero byte
+    assert data[-1] == 0
+    data[3] = 1
+    assert sb_mod.load_guide(io.BytesIO(bytes(data[:-1])))["matrix"] == [PLAIN]
+
+
+def test_invalid_draw_cells_are_rejected():
+    bad = dict(ROW, Draw={"SB:Moon": "-1"})
+    with pytest.raises(sb_mod.GuideValidationError, match="Draw"):
+        sb_mod._validate_matrix([bad], DECK, sb_mod.GUIDE_LIMITS)
+
+
+def test_check_diff_and_migration_see_the_draw_plan():
+    assert sb_mod.check_guide(DECK, [ROW])["unbalanced"] == []
+    unbalanced = dict(ROW, Draw={"SB:Moon": "+1"})
+    report = sb_mod.check_guide(DECK, [unbalanced])
+    assert report["unbalanced"] == [("Tron (on the draw)", 3, 2)]
+
+    diff = sb_mod.diff_guides([ROW], [unbalanced])
+    assert "cells" in diff["changed"][0] and not diff["changed"][0]["cells"]
+    assert diff["changed"][0]["draw_cells"] == [("MB:Saga", 0, -1)]
+
+    new_deck = {"mainboard": {"MB:Bolt": 4}, "sideboard": DECK["sideboard"]}
+    (migrated,), flagged = sb_mod.migrate_guide(DECK, new_deck, [ROW])
+    assert "MB:Saga" not in migrated and migrated["Draw"] == {"SB:Moon": "+1"}
+    assert flagged["Tron"] == ["Saga was removed from the deck (-1 dropped)"]
+
+
+def test_split_cells_render_and_preview():
+    df = sb_mod.build_matrix_df([ROW, PLAIN], DECK)
+    assert list(df.columns) == ["MB:Bolt", "MB:Saga", "SB:Moon", "SB:Needle", "Draw"]
+    preview = sb_mod.matrix_preview_df(df)
+    assert preview.loc["Tron", "MB:Saga"] == "-1 / 0"
+    assert preview.loc["Burn", "MB:Bolt"] == ""
+    fig = sb_mod._draw_matrix_figure(df, {k: k[3:] for k in df.columns})
+    assert len(fig.axes[0].patches) > 4
+    plt.close(fig)
@@ -0,0 +1,111 @@
+import io
+import re
+import tracemalloc
+import zlib
+
+from PIL import Image
+
+import sideboarder_modular as sb_mod
+
+
+def _png(mode="P", size=(350, 250)):
+    img = Image.new("RGB", size, "white")
+    img.paste((154, 188, 167), (0, 0, size[0] // 2, size[1]))
+    if mode == "P":
+        img = img.quantize(4)
+    elif mode == "RGBA":
+        img = img.convert("RGBA")
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", dpi=(100, 100))
+    return buf.getvalue()
+
+
+def _objects(pdf: bytes) -> dict[int, bytes]:
+    """Check the xref table and return {object number: object bytes}."""
+    xref = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+    assert pdf[xref:].startswith(b"xref\n0 ")
+    count = int(re.search(rb"/Size (\d+)", pdf[xref:]).group(1))
+    offsets = re.findall(rb"(\d{10}) 00000 n ", pdf[xref:])
+    assert len(offsets) == count - 1
+    objects = {}
+    for num, offset in enumerate(offsets, start=1):
+        offset = int(offset)
+        assert pdf[offset:].startswith(b"%d 0 obj" % num)
+        objects[num] = pdf[offset : pdf.index(b"endobj", offset)]
+    return objects
+
+
+def _stream(obj: bytes) -> bytes:
+    length = int(re.search(rb"/Length (\d+)", obj).group(1))
+    start = obj.index(b"stream\n") + 7
+    return obj[start : start + length]
+
+
+def test_layout_packs_more_cards_than_one_per_page():
+    for paper in sb_mod.PAPER_SIZES:
+        layout = sb_mod.imposition_layout(paper)
+        assert layout["cols"] * layout["rows"] >= 8
+        page_w, page_h = (x * 72 for x in sb_mod.PAPER_SIZES[paper])
+        assert layout["x0"] >= sb_mod.PRINT_MARGIN * 72
+        assert layout["y0"] + layout["rows"] * layout["h"] <= page_h
+
+
+def test_imposed_pdf_is_well_formed_and_paginated():
+    per_page = 9  # 3 × 3 portrait cards on A4
+    out = io.BytesIO()
+    pages = sb_mod.impose_guides((_png() for _ in range(per_page + 2)), out)
+    assert pages == 2
+    objects = _objects(out.getvalue())
+    assert b"/Count 2" in objects[2]
+
+    images = [o for o in objects.values() if b"/Subtype /Image" in o]
+    assert len(images) == per_page + 2
+    # the PNG stream passes through: two colours, so one filter byte + 1 bpp rows
+    raw = zlib.decompress(_stream(images[0]))
+    assert b"/BitsPerComponent 1" in images[0] and b"/Indexed" in images[0]
+    assert len(raw) == 250 * (1 + -(-350 // 8))
+
+    contents = [
+        zlib.decompress(_stream(o))
+        for o in objects.values()
+        if b"/FlateDecode >>" in o[:80]
+    ]
+    assert sum(c.count(b" Do ") for c in contents) == per_page + 2
+    assert all(b" l S" in c for c in contents)
+
+
+def test_transparent_pngs_are_flattened():
+    out = io.BytesIO()
+    sb_mod.impose_guides([_png("RGBA")], out, paper="Letter", cut_marks=False)
+    image = next(o for o in _objects(out.getvalue()).values() if b"/Image" in o)
+    assert b"/DeviceRGB" in image and b"/Indexed" not in image
+    assert len(zlib.decompress(_stream(image))) == 250 * (1 + 350 * 3)
+
+
+def test_memory_stays_flat_as_guides_are_added():
+    class Sink:
+        def write(self, data):
+            pass
+
+    png = _png("RGB", (1050, 750))
+
+    def peak(n):
+        tracemalloc.start()
+        sb_mod.impose_guides((png for _ in range(n)), Sink())
+        _, high = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return high
+
+    assert peak(90) < peak(9) * 1.5
+
+
+def test_single_guide_pdf_keeps_its_print_size():
+    pdf = sb_mod.compose_print_pdf(io.BytesIO(_png()), dpi=100).getvalue()
+    objects = _objects(pdf)
+    content = next(
+        zlib.decompress(_stream(o))
+        for o in objects.values()
+        if b"/FlateDecode >>" in o[:80]
+    )
+    assert content.startswith(b"q 252.00 0 0 180.00 ")
+    assert b"/MediaBox [0 0 595.44 841.68]" in b"".join(objects.values())
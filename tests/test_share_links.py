@@ -0,0 +1,24 @@
+import pytest
+
+import sideboarder_modular as sb_mod
+
+
+def test_share_token_round_trips_and_fits_in_a_short_link(blast_cutter_guide):
+    guide = blast_cutter_guide
+    token = sb_mod.encode_share_token(guide["deck_data"], guide["matrix"])
+    assert len(token) < 1000
+    assert token.replace("-", "").replace("_", "").isalnum()
+    assert sb_mod.decode_share_token(token) == guide
+
+
+def test_rejects_mangled_tokens():
+    with pytest.raises(sb_mod.GuideValidationError):
+        sb_mod.decode_share_token("not-a-guide")
+
+
+def test_editor_opens_guide_from_query_param(open_page, blast_cutter_guide):
+    guide = blast_cutter_guide
+    token = sb_mod.encode_share_token(guide["deck_data"], guide["matrix"])
+    at = open_page("pages/editor.py", query_params={sb_mod.SHARE_QUERY_PARAM: token})
+    assert not at.exception
+    assert at.session_state["matchups"] == guide["matrix"]
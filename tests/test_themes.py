@@ -0,0 +1,59 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+import sideboarder_modular as sb_mod
+
+
+def _render(df, labels, dpi=100):
+    fig = sb_mod._draw_matrix_figure(df, labels)
+    try:
+        return sb_mod.figure_to_indexed(fig, dpi)
+    finally:
+        plt.close(fig)
+
+
+def test_key_colours_map_exactly_onto_the_theme():
+    indexed = Image.new("P", (4, 1))
+    keys = ("ink", "background", "in", "out")
+    indexed.putpalette(
+        b"".join(
+            bytes(sb_mod._rgb(sb_mod.KEY_COLORS[k]).astype(int).tolist()) for k in keys
+        )
+    )
+    indexed.putdata([0, 1, 2, 3])
+    for theme in sb_mod.EXPORT_THEMES.values():
+        themed = np.asarray(sb_mod.apply_theme(indexed, theme).convert("RGB"))[0]
+        assert themed.tolist() == [sb_mod._rgb(theme[k]).tolist() for k in keys]
+
+
+def test_recoloured_master_matches_a_direct_render(monkeypatch, blast_cutter):
+    _, df, labels = blast_cutter
+    master = _render(df, labels)
+    themed = sb_mod.themed_png(master, sb_mod.EXPORT_THEMES["Colour"])
+    assert Image.open(themed).mode == "P"
+
+    theme = sb_mod.EXPORT_THEMES["Colour"]
+    monkeypatch.setitem(sb_mod.KEY_COLORS, "in", theme["in"])
+    monkeypatch.setitem(sb_mod.KEY_COLORS, "out", theme["out"])
+    direct = _render(df, labels).convert("RGB")
+    diff = np.abs(
+        np.asarray(direct, int) - np.asarray(Image.open(themed).convert("RGB"), int)
+    )
+    assert diff.mean() < 0.5
+
+
+def test_indexed_export_is_smaller_opaque_and_keeps_the_target_dpi(blast_cutter):
+    _, df, labels = blast_cutter
+    fig = sb_mod._draw_matrix_figure(df, labels)
+    try:
+        rgba = sb_mod.figure_to_png(fig, 150).getvalue()
+        indexed = sb_mod.figure_to_indexed(fig, 150)
+    finally:
+        plt.close(fig)
+    png = sb_mod.themed_png(indexed, sb_mod.EXPORT_THEMES["Colour"])
+    img = Image.open(png)
+    assert img.mode == "P" and "transparency" not in img.info
+    assert img.size == (525, 375)  # 3.5 × 2.5 in
+    assert round(img.info["dpi"][0]) == 150
+    assert len(png.getvalue()) < len(rgba) / 2
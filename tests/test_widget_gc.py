@@ -0,0 +1,79 @@
+import pytest
+import streamlit as st
+
+import sideboarder_modular as sb_mod
+from sideboarder_modular import MatchupHistory
+
+
+@pytest.fixture(autouse=True)
+def _clean_session_state():
+    st.session_state.clear()
+    yield
+    st.session_state.clear()
+
+
+def _rerun(matchups):
+    """What the editor does with widget state on every rerun."""
+    ids = sb_mod.matchup_ids(matchups)
+    sb_mod.collect_widget_state({p: set(ids) for p in sb_mod.EDIT_WIDGET_PREFIXES})
+    for mid in ids:
+        st.session_state[f"edit_name_{mid}"] = "x"
+        st.session_state[f"edit_out_{mid}_MB:Ragavan"] = 1
+        st.session_state[f"edit_draw_{mid}_split"] = False
+    return ids
+
+
+def test_ids_follow_rows_through_edits_and_deletes():
+    matchups, history = [], MatchupHistory()
+    for name in ("Burn", "Tron", "Zoo"):
+        history.add(matchups, {"Matchup": name, "MB:Ragavan": "-1"})
+    first, second, third = sb_mod.matchup_ids(matchups)
+
+    history.edit(matchups, 2, {"Matchup": "Domain Zoo", "MB:Ragavan": "-2"})
+    history.delete(matchups, 0)
+    assert sb_mod.matchup_ids(matchups) == [second, third]
+
+    history.undo(matchups)  # the deleted row comes back under a fresh id
+    restored = sb_mod.matchup_ids(matchups)
+    assert restored[1:] == [second, third] and restored[0] != first
+
+
+def test_session_state_stays_bounded_over_many_add_delete_cycles():
+    matchups, history = [], MatchupHistory()
+    sizes = []
+    for cycle in range(300):
+        history.add(matchups, {"Matchup": f"Deck {cycle}", "MB:Ragavan": "-1"})
+        _rerun(matchups)
+        if len(matchups) > 3:
+            history.delete(matchups, cycle % len(matchups))
+            _rerun(matchups)
+        sizes.append(len(st.session_state))
+    assert max(sizes[50:]) == sizes[50]
+    assert len(st.session_state["matchup_ids"]) == len(matchups)
+
+
+def test_clear_matchup_widgets_matches_the_owner_exactly():
+    for key in ("edit_name_m1", "edit_out_m1_MB:Bolt", "edit_name_m10", "other"):
+        st.session_state[key] = 1
+    sb_mod.clear_matchup_widgets("m1")
+    assert set(st.session_state.keys()) == {"edit_name_m10", "other"}
+
+
+def test_deleted_tab_inputs_do_not_bleed_into_the_next_tab(open_page, small_deck):
+    matchups = [
+        {"Matchup": "Burn", "MB:Ragavan": "-1", "SB:Dismember": "+1"},
+        {"Matchup": "Tron", "MB:Ragavan": "-3", "SB:Dismember": "+2"},
+    ]
+    at = open_page("pages/editor.py", deck_data=small_deck, matchups=matchups)
+    assert not at.exception
+
+    burn_id = next(b.key for b in at.button if b.key.startswith("save_btn_"))[9:]
+    at.number_input(key=f"edit_out_{burn_id}_MB:Ragavan").set_value(4).run()
+    at.button(key=f"delete_btn_{burn_id}").click().run()
+    at.button(key=f"confirm_delete_{burn_id}").click().run()
+    assert not at.exception
+
+    assert [m["Matchup"] for m in at.session_state.matchups] == ["Tron"]
+    assert not [k for k in at.session_state if k.startswith(f"edit_out_{burn_id}_")]
+    tron = [n for n in at.number_input if n.key.startswith("edit_out_")]
+    assert [n.value for n in tron] == [3]